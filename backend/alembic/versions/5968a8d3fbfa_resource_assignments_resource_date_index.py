@@ -0,0 +1,31 @@
+"""add composite resource/date index on resource_assignments
+
+Revision ID: 5968a8d3fbfa
+Revises: d4ff84d78d75
+"""
+from alembic import op
+
+
+revision = "5968a8d3fbfa"
+down_revision = "d4ff84d78d75"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Allocation sums and conflict checks filter on resource + date and add
+    # capital + expense. On PostgreSQL the included columns let those run as
+    # index-only scans.
+    op.create_index(
+        "ix_resource_assignments_resource_date",
+        "resource_assignments",
+        ["resource_id", "assignment_date"],
+        postgresql_include=["capital_percentage", "expense_percentage"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_resource_assignments_resource_date",
+        table_name="resource_assignments",
+    )
@@ -0,0 +1,24 @@
+"""add created_at and entity indexes on audit_logs
+
+Revision ID: c8e2a779a40b
+Revises: 5968a8d3fbfa
+"""
+from alembic import op
+
+
+revision = "c8e2a779a40b"
+down_revision = "5968a8d3fbfa"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Recent-change listings order by created_at with a LIMIT; entity history
+    # filters on entity_type and entity_id together.
+    op.create_index("ix_audit_logs_created_at", "audit_logs", ["created_at"])
+    op.create_index("ix_audit_logs_entity", "audit_logs", ["entity_type", "entity_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_audit_logs_entity", table_name="audit_logs")
+    op.drop_index("ix_audit_logs_created_at", table_name="audit_logs")
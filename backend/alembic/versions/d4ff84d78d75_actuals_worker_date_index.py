@@ -0,0 +1,27 @@
+"""add composite worker/date index on actuals for allocation aggregates
+
+Revision ID: d4ff84d78d75
+Revises: f4a8c2d190b1
+"""
+from alembic import op
+
+
+revision = "d4ff84d78d75"
+down_revision = "f4a8c2d190b1"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Allocation checks filter on worker + date and sum allocation_percentage.
+    # On PostgreSQL the included column lets those run as index-only scans.
+    op.create_index(
+        "ix_actuals_worker_date",
+        "actuals",
+        ["external_worker_id", "actual_date"],
+        postgresql_include=["allocation_percentage"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_actuals_worker_date", table_name="actuals")
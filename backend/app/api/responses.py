@@ -0,0 +1,24 @@
+"""
+Response helpers shared by API endpoints.
+"""
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+
+
+class _ModelJSONResponse(ORJSONResponse):
+    """ORJSONResponse whose content is a model rendered by pydantic's serializer."""
+    
+    def render(self, content: BaseModel) -> bytes:
+        return content.__pydantic_serializer__.to_json(content)
+
+
+def json_response(model: BaseModel) -> ORJSONResponse:
+    """
+    Return an already-built response model as a JSON response.
+
+    Returning a Response from an endpoint skips its response_model, so FastAPI
+    doesn't re-validate the model (and every list item) before encoding it.
+    Only use this for models built from trusted data; response_model still
+    documents the endpoint in the OpenAPI schema.
+    """
+    return _ModelJSONResponse(model)
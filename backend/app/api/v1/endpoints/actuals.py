@@ -8,6 +8,7 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Query, UploadFile, File, status
 from sqlalchemy.orm import Session
 from sqlalchemy.orm.exc import StaleDataError
+from starlette.concurrency import run_in_threadpool
 
 from app.api.deps import get_db, get_current_user
 from app.models.user import User
@@ -505,7 +506,10 @@ async def import_labor_actuals(
 
         # Import actuals
         valid_records = [r for r in validated_records if r.is_valid()]
-        import_result = actuals_service.import_labor_batch(
+        # The import is synchronous and may wait on the import lock; run it on
+        # a worker thread so it doesn't block the event loop
+        import_result = await run_in_threadpool(
+            actuals_service.import_labor_batch,
             db=db,
             records=valid_records,
             validate_allocation=True,
@@ -516,12 +520,11 @@ async def import_labor_actuals(
 
         # Build response
         results = []
-        for i, record in enumerate(valid_records):
-            actual = import_result["actuals"][i] if i < len(import_result["actuals"]) else None
+        for record, actual_id in zip(valid_records, import_result["actual_ids"]):
             results.append(ActualImportResult(
                 row_number=record.row_number,
                 success=True,
-                actual_id=actual.id if actual else None,
+                actual_id=actual_id,
                 errors=None,
                 warnings=None
             ))
@@ -662,7 +665,10 @@ async def import_nonlabor_actuals(
 
         # Import actuals
         valid_records = [r for r in validated_records if r.is_valid()]
-        import_result = actuals_service.import_nonlabor_batch(
+        # The import is synchronous and may wait on the import lock; run it on
+        # a worker thread so it doesn't block the event loop
+        import_result = await run_in_threadpool(
+            actuals_service.import_nonlabor_batch,
             db=db,
             records=valid_records,
             actuals_through_date=actuals_through_date,
@@ -672,12 +678,11 @@ async def import_nonlabor_actuals(
 
         # Build response
         results = []
-        for i, record in enumerate(valid_records):
-            actual = import_result["actuals"][i] if i < len(import_result["actuals"]) else None
+        for record, actual_id in zip(valid_records, import_result["actual_ids"]):
             results.append(ActualImportResult(
                 row_number=record.row_number,
                 success=True,
-                actual_id=actual.id if actual else None,
+                actual_id=actual_id,
                 errors=None,
                 warnings=None
             ))
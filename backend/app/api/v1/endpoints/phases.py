@@ -8,6 +8,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_db, get_current_user
+from app.api.responses import json_response
 from app.models.user import User
 from app.schemas.phase import (
     PhaseCreate,
@@ -15,9 +16,10 @@ from app.schemas.phase import (
     PhaseResponse,
     PhaseValidationRequest,
     PhaseValidationResult,
-    PhaseBatchUpdate
+    PhaseBatchUpdate,
+    PHASE_RESPONSE_LIST_ADAPTER
 )
-from app.schemas.assignment import ResourceAssignmentResponse
+from app.schemas.assignment import ResourceAssignmentResponse, RESOURCE_ASSIGNMENT_RESPONSE_LIST_ADAPTER
 from app.services.phase_service import phase_service
 from app.core.exceptions import ValidationError, ResourceNotFoundError
 
@@ -172,7 +174,7 @@ async def batch_update_phases(
             phases=phases_data
         )
         
-        return [PhaseResponse.model_validate(phase) for phase in phases]
+        return PHASE_RESPONSE_LIST_ADAPTER.validate_python(phases, from_attributes=True)
         
     except ResourceNotFoundError as e:
         raise HTTPException(
@@ -276,7 +278,7 @@ async def list_phases(
         phases = project_phase_repository.get_by_project(db, project_id)
         phases_sorted = sorted(phases, key=lambda p: p.start_date)
         
-        return [PhaseResponse.model_validate(phase) for phase in phases_sorted]
+        return PHASE_RESPONSE_LIST_ADAPTER.validate_python(phases_sorted, from_attributes=True)
         
     except Exception as e:
         raise HTTPException(
@@ -520,7 +522,7 @@ async def validate_phases(
             phases_data
         )
         
-        return result
+        return json_response(result)
         
     except HTTPException:
         raise
@@ -628,7 +630,7 @@ async def get_phase_assignments(
             phase_id=phase_id
         )
         
-        return [ResourceAssignmentResponse.model_validate(assignment) for assignment in assignments]
+        return RESOURCE_ASSIGNMENT_RESPONSE_LIST_ADAPTER.validate_python(assignments, from_attributes=True)
         
     except ResourceNotFoundError as e:
         raise HTTPException(
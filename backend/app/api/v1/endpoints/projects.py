@@ -20,10 +20,8 @@ from app.schemas.project import (
     ProjectResponse,
     ProjectListResponse,
     ProjectSummary,
-    ProjectPhaseCreate,
-    ProjectPhaseUpdate,
-    ProjectPhaseResponse
 )
+from app.schemas.phase import PhaseResponse
 from app.schemas.base import SuccessResponse, PaginationParams
 from app.services.project import project_service, phase_service
 from app.services.reporting import reporting_service
@@ -93,7 +91,7 @@ async def create_project(
         # Convert to response model
         response = ProjectResponse.model_validate(project)
         response.program_name = project.program.name if project.program else None
-        response.phases = [ProjectPhaseResponse.model_validate(phase) for phase in project.phases]
+        response.phases = [PhaseResponse.model_validate(phase) for phase in project.phases]
         response.assignment_count = len(project.resource_assignments) if project.resource_assignments else 0
         response.actual_count = len(project.actuals) if project.actuals else 0
         
@@ -168,7 +166,7 @@ async def list_projects(
         for project in paginated_projects:
             response = ProjectResponse.model_validate(project)
             response.program_name = project.program.name if project.program else None
-            response.phases = [ProjectPhaseResponse.model_validate(phase) for phase in project.phases]
+            response.phases = [PhaseResponse.model_validate(phase) for phase in project.phases]
             response.assignment_count = len(project.resource_assignments) if project.resource_assignments else 0
             response.actual_count = len(project.actuals) if project.actuals else 0
             project_responses.append(response)
@@ -221,7 +219,7 @@ async def get_project(
     
     response = ProjectResponse.model_validate(project)
     response.program_name = project.program.name if project.program else None
-    response.phases = [ProjectPhaseResponse.model_validate(phase) for phase in project.phases]
+    response.phases = [PhaseResponse.model_validate(phase) for phase in project.phases]
     response.assignment_count = len(project.resource_assignments) if project.resource_assignments else 0
     response.actual_count = len(project.actuals) if project.actuals else 0
     
@@ -280,7 +278,7 @@ async def get_project_by_cost_center(
     
     response = ProjectResponse.model_validate(project)
     response.program_name = project.program.name if project.program else None
-    response.phases = [ProjectPhaseResponse.model_validate(phase) for phase in project.phases]
+    response.phases = [PhaseResponse.model_validate(phase) for phase in project.phases]
     response.assignment_count = len(project.resource_assignments) if project.resource_assignments else 0
     response.actual_count = len(project.actuals) if project.actuals else 0
     
@@ -326,7 +324,7 @@ async def update_project(
         
         response = ProjectResponse.model_validate(project)
         response.program_name = project.program.name if project.program else None
-        response.phases = [ProjectPhaseResponse.model_validate(phase) for phase in project.phases]
+        response.phases = [PhaseResponse.model_validate(phase) for phase in project.phases]
         response.assignment_count = len(project.resource_assignments) if project.resource_assignments else 0
         response.actual_count = len(project.actuals) if project.actuals else 0
         
@@ -402,13 +400,13 @@ async def delete_project(
 
 # NOTE: GET /{project_id}/phases intentionally does NOT live here. The projects
 # router is registered before the phases router, so a route here would shadow
-# phases.py's list_phases (response_model=List[PhaseResponse]) and strip the
-# labor/non-labor budget fields via the deprecated ProjectPhaseResponse schema.
+# phases.py's list_phases (response_model=List[PhaseResponse]) and change the
+# response shape of that endpoint.
 # See tests/integration/test_phase_route_shadowing.py.
 
 @router.get(
     "/{project_id}/phases/execution",
-    response_model=ProjectPhaseResponse,
+    response_model=PhaseResponse,
     summary="Get execution phase",
     description="Get the execution phase for a project"
 )
@@ -430,12 +428,12 @@ async def get_execution_phase(
             detail=f"Execution phase not found for project {project_id}"
         )
     
-    return ProjectPhaseResponse.model_validate(phase)
+    return PhaseResponse.model_validate(phase)
 
 
 @router.get(
     "/{project_id}/phases/planning",
-    response_model=ProjectPhaseResponse,
+    response_model=PhaseResponse,
     summary="Get planning phase",
     description="Get the planning phase for a project"
 )
@@ -457,12 +455,12 @@ async def get_planning_phase(
             detail=f"Planning phase not found for project {project_id}"
         )
     
-    return ProjectPhaseResponse.model_validate(phase)
+    return PhaseResponse.model_validate(phase)
 
 
 @router.post(
     "/{project_id}/phases/planning",
-    response_model=ProjectPhaseResponse,
+    response_model=PhaseResponse,
     status_code=status.HTTP_201_CREATED,
     summary="Create planning phase",
     description="Create a planning phase for a project"
@@ -487,7 +485,7 @@ async def create_planning_phase(
             expense_budget=expense_budget
         )
         
-        return ProjectPhaseResponse.model_validate(phase)
+        return PhaseResponse.model_validate(phase)
         
     except ValueError as e:
         raise HTTPException(
@@ -503,7 +501,7 @@ async def create_planning_phase(
 
 @router.put(
     "/{project_id}/phases/{phase_id}",
-    response_model=ProjectPhaseResponse,
+    response_model=PhaseResponse,
     summary="Update phase budget",
     description="Update the budget for a project phase"
 )
@@ -528,14 +526,14 @@ async def update_phase_budget(
             expense_budget=expense_budget
         )
         
-        return ProjectPhaseResponse.model_validate(phase)
+        return PhaseResponse.model_validate(phase)
     
     except StaleDataError:
         # Version conflict detected - fetch current state and raise ConflictError
         from app.repositories.project import project_phase_repository
         current_phase = project_phase_repository.get(db, phase_id)
         if current_phase:
-            current_state = ProjectPhaseResponse.model_validate(current_phase).model_dump()
+            current_state = PhaseResponse.model_validate(current_phase).model_dump()
             raise ConflictError("project_phase", str(phase_id), current_state)
         else:
             raise HTTPException(
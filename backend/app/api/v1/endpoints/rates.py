@@ -11,6 +11,7 @@ from sqlalchemy.orm import Session
 from sqlalchemy.orm.exc import StaleDataError
 
 from app.api.deps import get_db, get_current_user, check_admin_permission
+from app.api.responses import json_response
 from app.models.user import User
 from app.schemas.rate import (
     RateCreate,
@@ -28,6 +29,23 @@ from app.core.exceptions import ConflictError
 router = APIRouter()
 
 
+def _rate_row(rate) -> RateResponse:
+    """Build a RateResponse from a rate loaded from the database."""
+    # The rate was loaded from the database, so skip re-validation
+    return RateResponse.from_trusted({
+        "id": rate.id,
+        "worker_type_id": rate.worker_type_id,
+        "rate_amount": rate.rate_amount,
+        "start_date": rate.start_date,
+        "end_date": rate.end_date,
+        "version": rate.version,
+        "created_at": rate.created_at,
+        "updated_at": rate.updated_at,
+        "worker_type_name": rate.worker_type.type if rate.worker_type else None,
+        "is_current": rate.end_date is None,
+    })
+
+
 @router.post(
     "/",
     response_model=RateResponse,
@@ -116,14 +134,9 @@ async def list_rates(
         paginated_rates = rates[start_idx:end_idx]
         
         # Convert to response models
-        rate_responses = []
-        for rate in paginated_rates:
-            response = RateResponse.model_validate(rate)
-            response.worker_type_name = rate.worker_type.type if rate.worker_type else None
-            response.is_current = rate.end_date is None
-            rate_responses.append(response)
+        rate_responses = [_rate_row(rate) for rate in paginated_rates]
         
-        return RateListResponse(
+        list_response = RateListResponse(
             items=rate_responses,
             total=total,
             page=pagination.page,
@@ -132,6 +145,7 @@ async def list_rates(
             has_next=pagination.page < pages,
             has_prev=pagination.page > 1
         )
+        return json_response(list_response)
         
     except Exception as e:
         raise HTTPException(
@@ -317,14 +331,7 @@ async def get_rates_in_date_range(
     rates = rate_service.get_rates_in_date_range(db, worker_type_id, start_date, end_date)
     
     # Convert to response models
-    rate_responses = []
-    for rate in rates:
-        response = RateResponse.model_validate(rate)
-        response.worker_type_name = rate.worker_type.type if rate.worker_type else None
-        response.is_current = rate.end_date is None
-        rate_responses.append(response)
-    
-    return rate_responses
+    return [_rate_row(rate) for rate in rates]
 
 
 @router.post(
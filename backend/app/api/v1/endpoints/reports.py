@@ -7,6 +7,7 @@ from typing import Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_db, get_current_user
@@ -42,7 +43,9 @@ async def get_project_forecast(
             as_of_date=as_of_date,
             phase_id=phase_id
         )
-        return forecast_data.to_dict()
+        # to_dict() only emits str/float values, so hand it straight to orjson
+        # instead of walking it through jsonable_encoder first
+        return ORJSONResponse(content=forecast_data.to_dict())
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -72,7 +75,7 @@ async def get_program_forecast(
             program_id=program_id,
             as_of_date=as_of_date
         )
-        return forecast_data.to_dict()
+        return ORJSONResponse(content=forecast_data.to_dict())
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -102,7 +105,7 @@ async def get_portfolio_forecast(
             portfolio_id=portfolio_id,
             as_of_date=as_of_date
         )
-        return forecast_data.to_dict()
+        return ORJSONResponse(content=forecast_data.to_dict())
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -336,7 +339,8 @@ async def get_time_series_report(
             end_date=end_date,
             interval=interval
         )
-        return report
+        # Already JSON-native (str/float/int); skip jsonable_encoder
+        return ORJSONResponse(content=report)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
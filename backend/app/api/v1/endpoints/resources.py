@@ -9,6 +9,7 @@ from sqlalchemy.orm import Session
 from sqlalchemy.orm.exc import StaleDataError
 
 from app.api.deps import get_db, get_current_user
+from app.api.responses import json_response
 from app.models.user import User
 from app.models.resource import ResourceType
 from app.schemas.resource import (
@@ -32,29 +33,43 @@ def _enrich(db: Session, resource) -> ResourceResponse:
     fields: assignment_count, resource_role_name, and (for LABOR resources)
     worker_name, worker_type_name, and current_rate.
     """
-    response = ResourceResponse.model_validate(resource)
-    response.assignment_count = len(resource.resource_assignments) if resource.resource_assignments else 0
-    response.external_references = [
-        ExternalReferenceResponse(
-            id=link.external_reference.id,
-            reference_type_id=link.external_reference.reference_type_id,
-            reference_type_name=link.external_reference.reference_type.name,
-            value=link.external_reference.value,
-            version=link.external_reference.version,
-            created_at=link.external_reference.created_at,
-            updated_at=link.external_reference.updated_at,
-        )
-        for link in (getattr(resource, "external_reference_links", None) or [])
-    ]
-    response.resource_role_name = resource.resource_role.name if resource.resource_role else None
+    data = {
+        "id": resource.id,
+        "name": resource.name,
+        "resource_type": resource.resource_type,
+        "description": resource.description,
+        "worker_id": resource.worker_id,
+        "resource_role_id": resource.resource_role_id,
+        "version": resource.version,
+        "created_at": resource.created_at,
+        "updated_at": resource.updated_at,
+        "assignment_count": len(resource.resource_assignments) if resource.resource_assignments else 0,
+        "external_references": [
+            ExternalReferenceResponse(
+                id=link.external_reference.id,
+                reference_type_id=link.external_reference.reference_type_id,
+                reference_type_name=link.external_reference.reference_type.name,
+                value=link.external_reference.value,
+                version=link.external_reference.version,
+                created_at=link.external_reference.created_at,
+                updated_at=link.external_reference.updated_at,
+            )
+            for link in (getattr(resource, "external_reference_links", None) or [])
+        ],
+        "resource_role_name": resource.resource_role.name if resource.resource_role else None,
+        "worker_name": None,
+        "worker_type_name": None,
+        "current_rate": None,
+    }
     if resource.resource_type == ResourceType.LABOR and resource.worker_id:
         worker = resource.worker
         if worker:
-            response.worker_name = worker.name
-            response.worker_type_name = worker.worker_type.type if worker.worker_type else None
+            data["worker_name"] = worker.name
+            data["worker_type_name"] = worker.worker_type.type if worker.worker_type else None
             current = rate_service.get_current_rate(db, worker.worker_type_id)
-            response.current_rate = str(current.rate_amount) if current else None
-    return response
+            data["current_rate"] = str(current.rate_amount) if current else None
+    # The resource was loaded from the database, so skip re-validation
+    return ResourceResponse.from_trusted(data)
 
 
 @router.post(
@@ -152,7 +167,7 @@ async def list_resources(
         # Convert to response models
         resource_responses = [_enrich(db, resource) for resource in paginated_resources]
 
-        return ResourceListResponse(
+        list_response = ResourceListResponse(
             items=resource_responses,
             total=total,
             page=pagination.page,
@@ -161,6 +176,7 @@ async def list_resources(
             has_next=pagination.page < pages,
             has_prev=pagination.page > 1
         )
+        return json_response(list_response)
 
     except Exception as e:
         raise HTTPException(
@@ -322,7 +338,7 @@ async def list_labor_resources(
         # Convert to response models
         resource_responses = [_enrich(db, resource) for resource in resources]
 
-        return ResourceListResponse(
+        list_response = ResourceListResponse(
             items=resource_responses,
             total=total,
             page=pagination.page,
@@ -331,6 +347,7 @@ async def list_labor_resources(
             has_next=pagination.page < pages,
             has_prev=pagination.page > 1
         )
+        return json_response(list_response)
         
     except Exception as e:
         raise HTTPException(
@@ -371,7 +388,7 @@ async def list_non_labor_resources(
         # Convert to response models
         resource_responses = [_enrich(db, resource) for resource in resources]
 
-        return ResourceListResponse(
+        list_response = ResourceListResponse(
             items=resource_responses,
             total=total,
             page=pagination.page,
@@ -380,6 +397,7 @@ async def list_non_labor_resources(
             has_next=pagination.page < pages,
             has_prev=pagination.page > 1
         )
+        return json_response(list_response)
         
     except Exception as e:
         raise HTTPException(
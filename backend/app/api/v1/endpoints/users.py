@@ -11,6 +11,7 @@ from sqlalchemy.orm import Session
 from sqlalchemy.orm.exc import StaleDataError
 
 from app.api.deps import get_db, get_current_active_user
+from app.api.responses import json_response
 from app.models.user import User, RoleType, ScopeType
 from app.schemas.user import (
     UserCreate,
@@ -129,41 +130,43 @@ def list_users(
                     project = project_repository.get(db, scope.project_id)
                     scope_name = project.name if project else None
                 
-                scope_responses.append(ScopeAssignmentResponse(
-                    id=scope.id,
-                    user_role_id=scope.user_role_id,
-                    scope_type=scope.scope_type,
-                    program_id=scope.program_id,
-                    project_id=scope.project_id,
-                    is_active=scope.is_active,
-                    program_name=scope_name if scope.scope_type == ScopeType.PROGRAM else None,
-                    project_name=scope_name if scope.scope_type == ScopeType.PROJECT else None,
-                    version=scope.version,
-                    created_at=scope.created_at,
-                    updated_at=scope.updated_at
-                ))
-
-            role_responses.append(UserRoleResponse(
-                id=role.id,
-                user_id=role.user_id,
-                role_type=role.role_type,
-                is_active=role.is_active,
-                scope_assignments=scope_responses,
-                version=role.version,
-                created_at=role.created_at,
-                updated_at=role.updated_at
-            ))
-
-        user_responses.append(UserResponse(
-            id=user.id,
-            username=user.username,
-            email=user.email,
-            is_active=user.is_active,
-            user_roles=role_responses,
-            version=user.version,
-            created_at=user.created_at,
-            updated_at=user.updated_at
-        ))
+                scope_responses.append(ScopeAssignmentResponse.from_trusted({
+                    "id": scope.id,
+                    "user_role_id": scope.user_role_id,
+                    "scope_type": scope.scope_type,
+                    "program_id": scope.program_id,
+                    "project_id": scope.project_id,
+                    "is_active": scope.is_active,
+                    "program_name": scope_name if scope.scope_type == ScopeType.PROGRAM else None,
+                    "project_name": scope_name if scope.scope_type == ScopeType.PROJECT else None,
+                    "version": scope.version,
+                    "created_at": scope.created_at,
+                    "updated_at": scope.updated_at
+                }))
+
+            role_responses.append(UserRoleResponse.from_trusted({
+                "id": role.id,
+                "user_id": role.user_id,
+                "role_type": role.role_type,
+                "is_active": role.is_active,
+                "scope_assignments": scope_responses,
+                "version": role.version,
+                "created_at": role.created_at,
+                "updated_at": role.updated_at
+            }))
+
+        # Users, roles and scopes are all read from the database, so the list
+        # is built without re-running field validation
+        user_responses.append(UserResponse.from_trusted({
+            "id": user.id,
+            "username": user.username,
+            "email": user.email,
+            "is_active": user.is_active,
+            "user_roles": role_responses,
+            "version": user.version,
+            "created_at": user.created_at,
+            "updated_at": user.updated_at
+        }))
     
     # Calculate pagination
     page = (skip // limit) + 1 if limit > 0 else 1
@@ -171,7 +174,7 @@ def list_users(
     has_next = skip + limit < total
     has_prev = skip > 0
     
-    return UserListResponse(
+    list_response = UserListResponse(
         items=user_responses,
         total=total,
         page=page,
@@ -180,6 +183,7 @@ def list_users(
         has_next=has_next,
         has_prev=has_prev
     )
+    return json_response(list_response)
 
 
 @router.post("", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
@@ -9,6 +9,7 @@ from sqlalchemy.orm import Session
 from sqlalchemy.orm.exc import StaleDataError
 
 from app.api.deps import get_db, get_current_user, check_admin_permission
+from app.api.responses import json_response
 from app.models.user import User
 from app.schemas.resource import (
     WorkerCreate,
@@ -18,7 +19,8 @@ from app.schemas.resource import (
     WorkerSummary,
     WorkerTypeCreate,
     WorkerTypeUpdate,
-    WorkerTypeResponse
+    WorkerTypeResponse,
+    WORKER_TYPE_RESPONSE_LIST_ADAPTER
 )
 from app.schemas.base import SuccessResponse, PaginationParams
 from app.services.resource import worker_service, worker_type_service
@@ -109,18 +111,22 @@ async def list_worker_types(
         
         # Convert to response models
         from app.services.resource import rate_service
-        worker_type_responses = []
+        rows = []
         for worker_type in worker_types:
-            response = WorkerTypeResponse.model_validate(worker_type)
-            response.worker_count = len(worker_type.workers) if worker_type.workers else 0
-            
             # Get current rate if available
             current_rate = rate_service.get_current_rate(db, worker_type.id)
-            response.current_rate = str(current_rate.rate_amount) if current_rate else None
-            
-            worker_type_responses.append(response)
+            rows.append({
+                "id": worker_type.id,
+                "type": worker_type.type,
+                "description": worker_type.description,
+                "version": worker_type.version,
+                "created_at": worker_type.created_at,
+                "updated_at": worker_type.updated_at,
+                "worker_count": len(worker_type.workers) if worker_type.workers else 0,
+                "current_rate": str(current_rate.rate_amount) if current_rate else None,
+            })
         
-        return worker_type_responses
+        return WORKER_TYPE_RESPONSE_LIST_ADAPTER.validate_python(rows)
         
     except Exception as e:
         raise HTTPException(
@@ -398,16 +404,24 @@ async def list_workers(
         from app.services.resource import rate_service
         worker_responses = []
         for worker in paginated_workers:
-            response = WorkerResponse.model_validate(worker)
-            response.worker_type_name = worker.worker_type.type if worker.worker_type else None
-            
             # Get current rate for the worker type
             current_rate = rate_service.get_current_rate(db, worker.worker_type_id)
-            response.current_rate = str(current_rate.rate_amount) if current_rate else None
-            
-            worker_responses.append(response)
+
+            # Rows come straight from the database, so skip re-validation
+            worker_responses.append(WorkerResponse.from_trusted({
+                "id": worker.id,
+                "worker_type_id": worker.worker_type_id,
+                "external_id": worker.external_id,
+                "name": worker.name,
+                "cost_center_code": worker.cost_center_code,
+                "version": worker.version,
+                "created_at": worker.created_at,
+                "updated_at": worker.updated_at,
+                "worker_type_name": worker.worker_type.type if worker.worker_type else None,
+                "current_rate": str(current_rate.rate_amount) if current_rate else None,
+            }))
         
-        return WorkerListResponse(
+        list_response = WorkerListResponse(
             items=worker_responses,
             total=total,
             page=pagination.page,
@@ -416,6 +430,7 @@ async def list_workers(
             has_next=pagination.page < pages,
             has_prev=pagination.page > 1
         )
+        return json_response(list_response)
         
     except Exception as e:
         raise HTTPException(
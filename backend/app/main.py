@@ -3,6 +3,7 @@ Main FastAPI application entry point.
 """
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.api.v1.api import api_router
 from app.api.middleware import (
@@ -63,6 +64,7 @@ Authorization: Bearer <your-token>
 - [API Documentation](https://github.com/your-org/your-repo/blob/main/backend/docs/)
 """,
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
+    default_response_class=ORJSONResponse,
     openapi_tags=[
         {
             "name": "authentication",
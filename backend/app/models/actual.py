@@ -3,7 +3,7 @@ from datetime import date
 from decimal import Decimal
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Column, Date, String, Numeric, ForeignKey, CheckConstraint, Integer
+from sqlalchemy import Column, Date, String, Numeric, ForeignKey, CheckConstraint, Index, Integer
 from sqlalchemy.orm import relationship
 
 from app.models.base import BaseModel, GUID
@@ -69,6 +69,14 @@ class Actual(BaseModel):
         CheckConstraint('capital_amount >= 0', name='check_capital_amount_positive'),
         CheckConstraint('expense_amount >= 0', name='check_expense_amount_positive'),
         CheckConstraint('capital_amount + expense_amount = actual_cost', name='check_actual_cost_split'),
+        # Serves the allocation validator's per-worker, per-date SUM queries;
+        # PostgreSQL answers them from the index alone.
+        Index(
+            'ix_actuals_worker_date',
+            'external_worker_id',
+            'actual_date',
+            postgresql_include=['allocation_percentage'],
+        ),
     )
     
     def __repr__(self) -> str:
@@ -3,7 +3,7 @@ AuditLog model for tracking data modifications.
 """
 from typing import TYPE_CHECKING, Any, Dict
 
-from sqlalchemy import Column, String, ForeignKey
+from sqlalchemy import Column, String, ForeignKey, Index
 from sqlalchemy.orm import relationship
 
 from app.models.base import BaseModel, GUID, JSON
@@ -17,6 +17,13 @@ class AuditLog(BaseModel):
     
     __tablename__ = "audit_logs"
     
+    __table_args__ = (
+        # Recent-changes queries order by created_at and stop at a limit
+        Index('ix_audit_logs_created_at', 'created_at'),
+        # Entity history filters on both columns together
+        Index('ix_audit_logs_entity', 'entity_type', 'entity_id'),
+    )
+    
     # Foreign keys
     user_id = Column(GUID(), ForeignKey("users.id"), nullable=False, index=True)
     
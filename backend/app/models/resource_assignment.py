@@ -10,6 +10,7 @@ from sqlalchemy import (
     Column,
     Date,
     ForeignKey,
+    Index,
     Numeric,
     UniqueConstraint,
 )
@@ -64,6 +65,15 @@ class ResourceAssignment(BaseModel):
             'assignment_date',
             name='uq_resource_assignments_resource_project_date',
         ),
+        # Daily allocation sums and conflict scans filter on resource + date
+        # range; the unique constraint can't serve that with project_id in
+        # the middle.
+        Index(
+            'ix_resource_assignments_resource_date',
+            'resource_id',
+            'assignment_date',
+            postgresql_include=['capital_percentage', 'expense_percentage'],
+        ),
     )
     
     def __repr__(self) -> str:
@@ -3,7 +3,7 @@ Actual repository for data access operations.
 """
 from datetime import date
 from decimal import Decimal
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 from uuid import UUID
 
 from sqlalchemy import and_, func
@@ -13,6 +13,15 @@ from app.models.actual import Actual, ActualImportBatch
 from app.repositories.base import BaseRepository
 
 
+# Decimal constants for the aggregate defaults, built once at import time.
+_ZERO = Decimal('0.00')
+_HUNDRED = Decimal('100.00')
+
+# Worker-date pairs per aggregate query, keeping both IN lists well under the
+# bind-parameter limits of SQLite and PostgreSQL.
+ALLOCATION_LOOKUP_CHUNK_SIZE = 500
+
+
 class ActualRepository(BaseRepository[Actual]):
     """Repository for Actual model operations."""
     
@@ -67,7 +76,104 @@ class ActualRepository(BaseRepository[Actual]):
             )
         ).scalar()
         
-        return result if result else Decimal('0.00')
+        return result if result else _ZERO
+
+    def get_allocation_summary_for_date(
+        self,
+        db: Session,
+        external_worker_id: str,
+        actual_date: date
+    ) -> Tuple[Decimal, Optional[str]]:
+        """
+        Get a worker's total allocation percentage on a date together with a
+        recorded worker name (None when the worker has no actuals that day).
+        """
+        total, worker_name = db.query(
+            func.sum(Actual.allocation_percentage),
+            func.min(Actual.worker_name),
+        ).filter(
+            and_(
+                Actual.external_worker_id == external_worker_id,
+                Actual.actual_date == actual_date
+            )
+        ).one()
+        
+        return (total if total else _ZERO), worker_name
+
+    def get_total_allocations_for_dates(
+        self,
+        db: Session,
+        keys: Iterable[Tuple[str, date]]
+    ) -> Dict[Tuple[str, date], Decimal]:
+        """
+        Get total allocation percentages for many (worker, date) pairs.
+
+        Issues one grouped query per ALLOCATION_LOOKUP_CHUNK_SIZE pairs rather
+        than one per pair. Pairs with no actuals map to 0.00.
+        """
+        totals = {key: _ZERO for key in keys}
+        # Sorted chunks keep each chunk's worker and date sets narrow.
+        ordered = sorted(totals)
+        for start in range(0, len(ordered), ALLOCATION_LOOKUP_CHUNK_SIZE):
+            chunk = ordered[start:start + ALLOCATION_LOOKUP_CHUNK_SIZE]
+            worker_ids = {external_worker_id for external_worker_id, _ in chunk}
+            dates = {actual_date for _, actual_date in chunk}
+            # Filter on both columns independently (portable across backends)
+            # and keep only the requested pairs from the grouped superset.
+            rows = db.query(
+                Actual.external_worker_id,
+                Actual.actual_date,
+                func.sum(Actual.allocation_percentage),
+            ).filter(
+                Actual.external_worker_id.in_(worker_ids),
+                Actual.actual_date.in_(dates),
+            ).group_by(Actual.external_worker_id, Actual.actual_date).all()
+            for external_worker_id, actual_date, total in rows:
+                key = (external_worker_id, actual_date)
+                if key in totals and total is not None:
+                    totals[key] = total
+        return totals
+    
+    def get_daily_totals(
+        self,
+        db: Session,
+        external_worker_id: str,
+        start_date: date,
+        end_date: date
+    ) -> Dict[date, Decimal]:
+        """Get a worker's total allocation percentage per day within a date range."""
+        rows = db.query(
+            Actual.actual_date,
+            func.sum(Actual.allocation_percentage),
+        ).filter(
+            Actual.external_worker_id == external_worker_id,
+            Actual.actual_date.between(start_date, end_date),
+        ).group_by(Actual.actual_date).order_by(Actual.actual_date).all()
+        return {
+            actual_date: total if total is not None else _ZERO
+            for actual_date, total in rows
+        }
+    
+    def find_over_allocated_dates(
+        self,
+        db: Session,
+        external_worker_id: str,
+        start_date: date,
+        end_date: date,
+        max_allocation: Decimal = _HUNDRED
+    ) -> List[Tuple[date, Decimal, Decimal]]:
+        """
+        Get (date, total allocation, excess over max_allocation) for each day in
+        the range where a worker's summed allocation exceeds max_allocation,
+        ordered by date.
+        """
+        total = func.sum(Actual.allocation_percentage)
+        return db.query(Actual.actual_date, total, total - max_allocation).filter(
+            Actual.external_worker_id == external_worker_id,
+            Actual.actual_date.between(start_date, end_date),
+        ).group_by(Actual.actual_date).having(
+            total > max_allocation
+        ).order_by(Actual.actual_date).all()
     
     def get_by_date_range(
         self,
@@ -113,6 +219,24 @@ class ActualRepository(BaseRepository[Actual]):
         db.flush()
         return actual
 
+    def create_many_in_transaction(
+        self,
+        db: Session,
+        *,
+        objs_in: List[Dict[str, Any]],
+    ) -> List[Actual]:
+        """Add and flush many actuals with a single batched INSERT.
+
+        Primary keys are generated client-side, so the unit of work groups the
+        rows into one executemany instead of a round-trip per actual. Going
+        through the session (rather than a Core insert) keeps the temporal
+        revision and realtime listeners firing for every row.
+        """
+        actuals = [Actual(**obj_in) for obj_in in objs_in]
+        db.add_all(actuals)
+        db.flush()
+        return actuals
+
     def latest_watermarks(self, db: Session) -> Dict[str, Optional[date]]:
         """Return the latest explicitly recorded completeness date per source."""
         rows = db.query(
@@ -145,7 +269,7 @@ class ActualRepository(BaseRepository[Actual]):
             query = query.filter(Actual.actual_date <= end_date)
         
         result = query.scalar()
-        return result if result else Decimal('0.00')
+        return result if result else _ZERO
     
     def validate_allocation_limit(
         self,
@@ -172,8 +296,8 @@ class ActualRepository(BaseRepository[Actual]):
         if exclude_id:
             query = query.filter(Actual.id != exclude_id)
         
-        current_total = query.scalar() or Decimal('0.00')
-        return (current_total + new_allocation) <= Decimal('100.00')
+        current_total = query.scalar() or _ZERO
+        return (current_total + new_allocation) <= _HUNDRED
     
     def validate_cost_split(
         self,
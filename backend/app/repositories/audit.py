@@ -2,10 +2,10 @@
 AuditLog repository for data access operations.
 """
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 from uuid import UUID
 
-from sqlalchemy import and_, or_
+from sqlalchemy import and_, func, or_
 from sqlalchemy.orm import Session
 
 from app.models.audit import AuditLog
@@ -64,6 +64,61 @@ class AuditLogRepository(BaseRepository[AuditLog]):
             )
         ).order_by(AuditLog.created_at.desc()).all()
     
+    def get_recent(
+        self,
+        db: Session,
+        entity_type: Optional[str] = None,
+        limit: int = 100
+    ) -> List[AuditLog]:
+        """Get the most recent audit logs, optionally for one entity type."""
+        query = db.query(AuditLog)
+        if entity_type:
+            query = query.filter(AuditLog.entity_type == entity_type)
+        return query.order_by(AuditLog.created_at.desc()).limit(limit).all()
+    
+    def get_recent_by_entity_types(
+        self,
+        db: Session,
+        entity_types: Iterable[str],
+        entity_id: Optional[UUID] = None,
+        limit: int = 100
+    ) -> List[AuditLog]:
+        """
+        Get the most recent audit logs for any of the given entity types,
+        optionally for one entity ID.
+        """
+        query = db.query(AuditLog).filter(AuditLog.entity_type.in_(list(entity_types)))
+        if entity_id:
+            query = query.filter(AuditLog.entity_id == entity_id)
+        return query.order_by(AuditLog.created_at.desc()).limit(limit).all()
+    
+    def count_by_operation_entity_user(
+        self,
+        db: Session,
+        entity_type: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> List[Tuple[str, str, UUID, int]]:
+        """
+        Count audit logs grouped by (operation, entity_type, user_id),
+        optionally for one entity type and within a created_at range.
+        """
+        query = db.query(
+            AuditLog.operation,
+            AuditLog.entity_type,
+            AuditLog.user_id,
+            func.count(AuditLog.id),
+        )
+        if entity_type:
+            query = query.filter(AuditLog.entity_type == entity_type)
+        if start_date:
+            query = query.filter(AuditLog.created_at >= start_date)
+        if end_date:
+            query = query.filter(AuditLog.created_at <= end_date)
+        return query.group_by(
+            AuditLog.operation, AuditLog.entity_type, AuditLog.user_id
+        ).all()
+    
     def create_audit_log(
         self,
         db: Session,
@@ -75,18 +130,30 @@ class AuditLogRepository(BaseRepository[AuditLog]):
         after_values: Optional[Dict[str, Any]] = None
     ) -> AuditLog:
         """Create a new audit log entry."""
-        audit_log = AuditLog(
-            user_id=user_id,
-            entity_type=entity_type,
-            entity_id=entity_id,
-            operation=operation,
-            before_values=before_values,
-            after_values=after_values
-        )
-        db.add(audit_log)
+        return self.create_audit_logs(db, [{
+            "user_id": user_id,
+            "entity_type": entity_type,
+            "entity_id": entity_id,
+            "operation": operation,
+            "before_values": before_values,
+            "after_values": after_values
+        }])[0]
+    
+    def create_audit_logs(
+        self,
+        db: Session,
+        entries: List[Dict[str, Any]]
+    ) -> List[AuditLog]:
+        """
+        Create many audit log entries with one batched INSERT and one commit.
+        
+        The returned logs are expired by the commit rather than refreshed, so
+        they are only re-read if a caller actually uses them.
+        """
+        audit_logs = [AuditLog(**entry) for entry in entries]
+        db.add_all(audit_logs)
         db.commit()
-        db.refresh(audit_log)
-        return audit_log
+        return audit_logs
 
 
 # Create repository instance
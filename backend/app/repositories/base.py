@@ -1,15 +1,28 @@
 """
 Base repository class for data access operations.
 """
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, Union
+from typing import Any, Dict, Generic, Iterable, Iterator, List, Optional, Set, Type, TypeVar, Union
 from uuid import UUID
 
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.db.utils import DatabaseUtils
 from app.models.base import BaseModel
 
 ModelType = TypeVar("ModelType", bound=BaseModel)
+T = TypeVar("T")
+
+# Values per IN list in the batched lookups, keeping each query well under
+# the bind-parameter limits of SQLite and PostgreSQL.
+ID_LOOKUP_CHUNK_SIZE = 500
+
+
+def in_chunks(values: Iterable[T]) -> Iterator[List[T]]:
+    """Split the distinct values into lists of at most ID_LOOKUP_CHUNK_SIZE."""
+    values = list(set(values))
+    for start in range(0, len(values), ID_LOOKUP_CHUNK_SIZE):
+        yield values[start:start + ID_LOOKUP_CHUNK_SIZE]
 
 
 class BaseRepository(Generic[ModelType]):
@@ -23,6 +36,30 @@ class BaseRepository(Generic[ModelType]):
         """Get a single record by ID."""
         return DatabaseUtils.get_by_id(db, self.model, id)
     
+    def get_many(
+        self,
+        db: Session,
+        ids: Iterable[Union[UUID, str]]
+    ) -> Dict[UUID, ModelType]:
+        """Get the records for a set of IDs, keyed by ID, one query per chunk."""
+        return {
+            obj.id: obj
+            for chunk in in_chunks(ids)
+            for obj in db.query(self.model).filter(self.model.id.in_(chunk)).all()
+        }
+    
+    def exists_many(
+        self,
+        db: Session,
+        ids: Iterable[Union[UUID, str]]
+    ) -> Set[UUID]:
+        """Return which of the given IDs exist, selecting only the ID column."""
+        return {
+            obj_id
+            for chunk in in_chunks(ids)
+            for obj_id in db.scalars(select(self.model.id).where(self.model.id.in_(chunk)))
+        }
+    
     def get_multi(
         self,
         db: Session,
@@ -3,10 +3,10 @@ Project and ProjectPhase repositories for data access operations.
 """
 from datetime import date
 from decimal import Decimal
-from typing import List, Optional
+from typing import Iterable, List, Optional, Set
 from uuid import UUID
 
-from sqlalchemy import and_
+from sqlalchemy import and_, select
 from sqlalchemy.orm import Session
 
 from app.models.project import Project, ProjectPhase
@@ -23,6 +23,13 @@ class ProjectRepository(BaseRepository[Project]):
         """Get all projects for a program."""
         return db.query(Project).filter(Project.program_id == program_id).all()
     
+    def get_ids_by_programs(self, db: Session, program_ids: Iterable[UUID]) -> Set[UUID]:
+        """Get the IDs of every project in any of the given programs in one query."""
+        program_ids = set(program_ids)
+        if not program_ids:
+            return set()
+        return set(db.scalars(select(Project.id).where(Project.program_id.in_(program_ids))))
+    
     def get_by_cost_center(self, db: Session, cost_center_code: str) -> Optional[Project]:
         """Get project by cost center code."""
         return db.query(Project).filter(Project.cost_center_code == cost_center_code).first()
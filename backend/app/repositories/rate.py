@@ -3,7 +3,7 @@ Rate repository for data access operations with temporal queries.
 """
 from datetime import date
 from decimal import Decimal
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 from uuid import UUID
 
 from sqlalchemy import and_, or_
@@ -46,6 +46,23 @@ class RateRepository(BaseRepository[Rate]):
             )
         ).first()
     
+    def get_by_worker_types(
+        self,
+        db: Session,
+        worker_type_ids: Iterable[UUID]
+    ) -> Dict[UUID, List[Rate]]:
+        """Get all rates for a set of worker types, grouped by worker type (newest first)."""
+        worker_type_ids = set(worker_type_ids)
+        rates_by_type: Dict[UUID, List[Rate]] = {}
+        if not worker_type_ids:
+            return rates_by_type
+        rates = db.query(Rate).filter(
+            Rate.worker_type_id.in_(worker_type_ids)
+        ).order_by(Rate.start_date.desc()).all()
+        for rate in rates:
+            rates_by_type.setdefault(rate.worker_type_id, []).append(rate)
+        return rates_by_type
+    
     def get_current_rate(self, db: Session, worker_type_id: UUID) -> Optional[Rate]:
         """Get the current active rate for a worker type (end_date is NULL)."""
         return db.query(Rate).filter(
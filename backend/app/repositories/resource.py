@@ -1,13 +1,13 @@
 """
 Resource, Worker, and WorkerType repositories for data access operations.
 """
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 from uuid import UUID
 
 from sqlalchemy.orm import Session
 
 from app.models.resource import Resource, Worker, WorkerType, ResourceType
-from app.repositories.base import BaseRepository
+from app.repositories.base import BaseRepository, in_chunks
 
 
 class ResourceRepository(BaseRepository[Resource]):
@@ -38,6 +38,18 @@ class ResourceRepository(BaseRepository[Resource]):
         """Get the LABOR resource linked to a worker."""
         return db.query(Resource).filter(Resource.worker_id == worker_id).first()
 
+    def get_by_worker_ids(
+        self,
+        db: Session,
+        worker_ids: Iterable[UUID]
+    ) -> Dict[UUID, Resource]:
+        """Get the LABOR resources linked to a set of workers, keyed by worker ID."""
+        worker_ids = set(worker_ids)
+        if not worker_ids:
+            return {}
+        resources = db.query(Resource).filter(Resource.worker_id.in_(worker_ids)).all()
+        return {resource.worker_id: resource for resource in resources}
+
 
 class WorkerTypeRepository(BaseRepository[WorkerType]):
     """Repository for WorkerType model operations."""
@@ -65,6 +77,18 @@ class WorkerRepository(BaseRepository[Worker]):
     def get_by_external_id(self, db: Session, external_id: str) -> Optional[Worker]:
         """Get worker by external ID."""
         return db.query(Worker).filter(Worker.external_id == external_id).first()
+
+    def get_many_by_external_ids(
+        self,
+        db: Session,
+        external_ids: Iterable[str]
+    ) -> Dict[str, Worker]:
+        """Get workers for a set of external IDs, keyed by external ID, one query per chunk."""
+        return {
+            worker.external_id: worker
+            for chunk in in_chunks(external_ids)
+            for worker in db.query(Worker).filter(Worker.external_id.in_(chunk)).all()
+        }
     
     def get_by_worker_type(self, db: Session, worker_type_id: UUID) -> List[Worker]:
         """Get workers by worker type."""
@@ -3,7 +3,7 @@ ResourceAssignment repository for data access operations.
 """
 from datetime import date
 from decimal import Decimal
-from typing import List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 from uuid import UUID
 
 from sqlalchemy import and_, func
@@ -13,6 +13,14 @@ from app.models.resource_assignment import ResourceAssignment
 from app.repositories.base import BaseRepository
 
 
+_ZERO = Decimal('0')
+_HUNDRED = Decimal('100')
+
+# Resource-date pairs per allocation query, keeping both IN lists well under
+# the bind-parameter limits of SQLite and PostgreSQL.
+ALLOCATION_LOOKUP_CHUNK_SIZE = 500
+
+
 class ResourceAssignmentRepository(BaseRepository[ResourceAssignment]):
     """Repository for ResourceAssignment model operations."""
     
@@ -25,26 +33,106 @@ class ResourceAssignmentRepository(BaseRepository[ResourceAssignment]):
             ResourceAssignment.project_id == project_id
         ).all()
     
-    def get_by_resource(self, db: Session, resource_id: UUID) -> List[ResourceAssignment]:
-        """Get all assignments for a resource."""
-        return db.query(ResourceAssignment).filter(
-            ResourceAssignment.resource_id == resource_id
+    def get_by_projects(
+        self,
+        db: Session,
+        project_ids: Iterable[UUID]
+    ) -> Dict[UUID, List[ResourceAssignment]]:
+        """Get all assignments for a set of projects, grouped by project."""
+        project_ids = set(project_ids)
+        assignments_by_project: Dict[UUID, List[ResourceAssignment]] = {}
+        if not project_ids:
+            return assignments_by_project
+        assignments = db.query(ResourceAssignment).filter(
+            ResourceAssignment.project_id.in_(project_ids)
         ).all()
+        for assignment in assignments:
+            assignments_by_project.setdefault(assignment.project_id, []).append(assignment)
+        return assignments_by_project
+    
+    def get_by_resource(
+        self,
+        db: Session,
+        resource_id: UUID,
+        project_ids: Optional[Iterable[UUID]] = None
+    ) -> List[ResourceAssignment]:
+        """Get all assignments for a resource, optionally only in the given projects."""
+        query = db.query(ResourceAssignment).filter(
+            ResourceAssignment.resource_id == resource_id
+        )
+        if project_ids is not None:
+            query = query.filter(ResourceAssignment.project_id.in_(set(project_ids)))
+        return query.all()
+    
+    def get_page(
+        self,
+        db: Session,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        project_id: Optional[UUID] = None,
+        resource_id: Optional[UUID] = None,
+        project_ids: Optional[Iterable[UUID]] = None
+    ) -> List[ResourceAssignment]:
+        """
+        Get one page of assignments, optionally filtered by project, resource,
+        and a set of allowed project IDs (None means no restriction).
+        """
+        query = db.query(ResourceAssignment)
+        if project_id:
+            query = query.filter(ResourceAssignment.project_id == project_id)
+        if resource_id:
+            query = query.filter(ResourceAssignment.resource_id == resource_id)
+        if project_ids is not None:
+            query = query.filter(ResourceAssignment.project_id.in_(set(project_ids)))
+        return query.order_by(
+            ResourceAssignment.assignment_date, ResourceAssignment.id
+        ).offset(skip).limit(limit).all()
     
     def get_by_date(
         self,
         db: Session,
         resource_id: UUID,
-        assignment_date: date
+        assignment_date: date,
+        project_ids: Optional[Iterable[UUID]] = None
     ) -> List[ResourceAssignment]:
-        """Get all assignments for a resource on a specific date."""
-        return db.query(ResourceAssignment).filter(
+        """
+        Get all assignments for a resource on a specific date, optionally only
+        in the given projects.
+        """
+        query = db.query(ResourceAssignment).filter(
             and_(
                 ResourceAssignment.resource_id == resource_id,
                 ResourceAssignment.assignment_date == assignment_date
             )
-        ).all()
+        )
+        if project_ids is not None:
+            query = query.filter(ResourceAssignment.project_id.in_(set(project_ids)))
+        return query.all()
 
+    def get_total_allocation_for_date(
+        self,
+        db: Session,
+        resource_id: UUID,
+        assignment_date: date,
+        exclude_id: Optional[UUID] = None
+    ) -> Decimal:
+        """
+        Get a resource's total capital + expense allocation on a date, optionally
+        leaving out one assignment (the one being updated).
+        """
+        query = db.query(
+            func.sum(ResourceAssignment.capital_percentage + ResourceAssignment.expense_percentage)
+        ).filter(
+            ResourceAssignment.resource_id == resource_id,
+            ResourceAssignment.assignment_date == assignment_date
+        )
+        if exclude_id:
+            query = query.filter(ResourceAssignment.id != exclude_id)
+        
+        result = query.scalar()
+        return result if result is not None else _ZERO
+    
     def get_by_resource_project_date(
         self,
         db: Session,
@@ -76,6 +164,79 @@ class ResourceAssignmentRepository(BaseRepository[ResourceAssignment]):
                 ResourceAssignment.assignment_date <= end_date
             )
         ).order_by(ResourceAssignment.assignment_date).all()
+
+    def find_over_allocated_dates(
+        self,
+        db: Session,
+        resource_id: UUID,
+        start_date: date,
+        end_date: date,
+        max_allocation: Decimal = _HUNDRED
+    ) -> List[Tuple[date, Decimal, Decimal]]:
+        """
+        Get (date, total allocation, excess over max_allocation) for each day in
+        the range where a resource's summed capital + expense exceeds
+        max_allocation, ordered by date.
+        """
+        total = func.sum(
+            ResourceAssignment.capital_percentage + ResourceAssignment.expense_percentage
+        )
+        return db.query(ResourceAssignment.assignment_date, total, total - max_allocation).filter(
+            ResourceAssignment.resource_id == resource_id,
+            ResourceAssignment.assignment_date.between(start_date, end_date),
+        ).group_by(ResourceAssignment.assignment_date).having(
+            total > max_allocation
+        ).order_by(ResourceAssignment.assignment_date).all()
+
+    def get_allocation_cells(
+        self,
+        db: Session,
+        keys: Iterable[Tuple[UUID, date]]
+    ) -> List[Tuple[UUID, UUID, date, Decimal]]:
+        """
+        Get (resource_id, project_id, assignment_date, capital + expense) for
+        every assignment on the given (resource, date) pairs.
+
+        Issues one query per ALLOCATION_LOOKUP_CHUNK_SIZE pairs and selects only
+        the columns needed to check uniqueness and daily allocation.
+        """
+        keys = sorted(set(keys))
+        cells = []
+        for start in range(0, len(keys), ALLOCATION_LOOKUP_CHUNK_SIZE):
+            chunk = keys[start:start + ALLOCATION_LOOKUP_CHUNK_SIZE]
+            requested = set(chunk)
+            # Filter on both columns independently (portable across backends)
+            # and keep only the requested pairs from the superset.
+            rows = db.query(
+                ResourceAssignment.resource_id,
+                ResourceAssignment.project_id,
+                ResourceAssignment.assignment_date,
+                ResourceAssignment.capital_percentage + ResourceAssignment.expense_percentage,
+            ).filter(
+                ResourceAssignment.resource_id.in_({resource_id for resource_id, _ in chunk}),
+                ResourceAssignment.assignment_date.in_({assignment_date for _, assignment_date in chunk}),
+            ).all()
+            cells.extend(
+                tuple(row) for row in rows
+                if (row[0], row[2]) in requested
+            )
+        return cells
+
+    def create_many_in_transaction(
+        self,
+        db: Session,
+        *,
+        objs_in: List[Dict[str, Any]],
+    ) -> List[ResourceAssignment]:
+        """Add and flush many assignments with a single batched INSERT.
+
+        Going through the session (rather than a Core insert) keeps the
+        temporal revision and realtime listeners firing for every row.
+        """
+        assignments = [ResourceAssignment(**obj_in) for obj_in in objs_in]
+        db.add_all(assignments)
+        db.flush()
+        return assignments
     
 
 # Create repository instance
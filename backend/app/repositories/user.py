@@ -1,12 +1,13 @@
 """
 User, UserRole, and ScopeAssignment repositories for data access operations.
 """
-from typing import List, Optional
+from typing import Iterable, List, Optional
 from uuid import UUID
 
-from sqlalchemy import and_
+from sqlalchemy import and_, or_, select
 from sqlalchemy.orm import Session
 
+from app.models.project import Project
 from app.models.user import User, UserRole, ScopeAssignment, RoleType, ScopeType
 from app.repositories.base import BaseRepository
 
@@ -99,6 +100,22 @@ class ScopeAssignmentRepository(BaseRepository[ScopeAssignment]):
             )
         ).all()
     
+    def get_active_by_user_role_ids(
+        self,
+        db: Session,
+        user_role_ids: Iterable[UUID]
+    ) -> List[ScopeAssignment]:
+        """Get active scope assignments for several user roles in one query."""
+        user_role_ids = set(user_role_ids)
+        if not user_role_ids:
+            return []
+        return db.query(ScopeAssignment).filter(
+            and_(
+                ScopeAssignment.user_role_id.in_(user_role_ids),
+                ScopeAssignment.is_active == True
+            )
+        ).all()
+    
     def get_program_scopes(self, db: Session, user_role_id: UUID) -> List[ScopeAssignment]:
         """Get program-level scope assignments for a user role."""
         return db.query(ScopeAssignment).filter(
@@ -141,6 +158,35 @@ class ScopeAssignmentRepository(BaseRepository[ScopeAssignment]):
             )
         ).first() is not None
 
+    
+    def user_can_access_project(self, db: Session, user_id: UUID, project_id: UUID) -> bool:
+        """
+        Check in one EXISTS query whether any of a user's active roles has an
+        active global scope, a program scope covering the project's program, or
+        a project scope for the project. False if the project does not exist.
+        """
+        matching_scope = select(ScopeAssignment.id).join(
+            UserRole, ScopeAssignment.user_role_id == UserRole.id
+        ).join(
+            Project, Project.id == project_id
+        ).where(
+            UserRole.user_id == user_id,
+            UserRole.is_active == True,
+            ScopeAssignment.is_active == True,
+            or_(
+                ScopeAssignment.scope_type == ScopeType.GLOBAL,
+                and_(
+                    ScopeAssignment.scope_type == ScopeType.PROGRAM,
+                    ScopeAssignment.program_id == Project.program_id
+                ),
+                and_(
+                    ScopeAssignment.scope_type == ScopeType.PROJECT,
+                    ScopeAssignment.project_id == Project.id
+                )
+            )
+        )
+        return db.scalar(select(matching_scope.exists()))
+
 
 # Create repository instances
 user_repository = UserRepository()
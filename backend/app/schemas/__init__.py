@@ -44,10 +44,6 @@ __all__ = [
     "ProjectUpdate",
     "ProjectResponse",
     "ProjectListResponse",
-    "ProjectPhaseBase",
-    "ProjectPhaseCreate",
-    "ProjectPhaseUpdate",
-    "ProjectPhaseResponse",
     
     # Phase schemas
     "PhaseBase",
@@ -135,4 +131,7 @@ __all__ = [
     "VarianceAnalysisReport",
     "ResourceUtilizationReport",
     "ReportFilters",
+    "ReportSummary",
+    "VarianceSeveritySummary",
+    "UtilizationSummary",
 ]
\ No newline at end of file
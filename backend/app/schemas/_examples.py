@@ -0,0 +1,81 @@
+"""
+OpenAPI examples for Pydantic schemas.
+
+Examples live in a single registry keyed by schema class name instead of
+inline in each model_config, so identical examples are shared between
+schemas and are only attached when a JSON schema is generated.
+"""
+from typing import Any, Dict, List
+
+
+_PLANNING_PHASE = {
+    "name": "Planning",
+    "start_date": "2024-01-01",
+    "end_date": "2024-03-31",
+    "description": "Initial planning phase",
+    "labor_capital_budget": 30000.00,
+    "labor_expense_budget": 20000.00,
+    "nonlabor_capital_budget": 15000.00,
+    "nonlabor_expense_budget": 10000.00,
+    "total_budget": 75000.00
+}
+
+_EXECUTION_PHASE = {
+    "name": "Execution",
+    "start_date": "2024-04-01",
+    "end_date": "2024-12-31",
+    "description": "Main execution phase",
+    "labor_capital_budget": 90000.00,
+    "labor_expense_budget": 60000.00,
+    "nonlabor_capital_budget": 45000.00,
+    "nonlabor_expense_budget": 30000.00,
+    "total_budget": 225000.00
+}
+
+_PHASE_EXAMPLES = [_PLANNING_PHASE]
+
+EXAMPLES: Dict[str, List[Dict[str, Any]]] = {
+    "PhaseBase": _PHASE_EXAMPLES,
+    "PhaseCreate": _PHASE_EXAMPLES,
+    "PhaseResponse": _PHASE_EXAMPLES,
+    "PhaseBatchItem": _PHASE_EXAMPLES,
+    "PhaseValidationRequest": [
+        {
+            "id": None,
+            "name": "Planning",
+            "start_date": "2024-01-01",
+            "end_date": "2024-03-31"
+        }
+    ],
+    "PhaseValidationResult": [
+        {
+            "is_valid": True,
+            "errors": []
+        },
+        {
+            "is_valid": False,
+            "errors": [
+                {
+                    "field": "timeline",
+                    "message": "Gap detected between Planning and Execution",
+                    "phase_id": None
+                }
+            ]
+        }
+    ],
+    "PhaseBatchUpdate": [
+        {
+            "phases": [
+                {"id": None, **_PLANNING_PHASE},
+                {"id": "123e4567-e89b-12d3-a456-426614174001", **_EXECUTION_PHASE}
+            ]
+        }
+    ],
+}
+
+
+def attach_examples(schema: Dict[str, Any], model_class: type) -> None:
+    """json_schema_extra hook that adds registered examples for model_class."""
+    examples = EXAMPLES.get(model_class.__name__)
+    if examples:
+        schema.setdefault("examples", examples)
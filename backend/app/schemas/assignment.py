@@ -6,7 +6,7 @@ from decimal import Decimal
 from typing import List, Optional
 from uuid import UUID
 
-from pydantic import Field, field_validator
+from pydantic import Field, TypeAdapter, field_validator
 
 from .base import BaseSchema, TimestampMixin, PaginatedResponse, VersionedSchema
 
@@ -97,6 +97,10 @@ class ResourceAssignmentListResponse(PaginatedResponse[ResourceAssignmentRespons
     pass
 
 
+# Built once at import so list endpoints validate all rows in a single call.
+RESOURCE_ASSIGNMENT_RESPONSE_LIST_ADAPTER = TypeAdapter(List[ResourceAssignmentResponse])
+
+
 class AssignmentImportRow(BaseSchema):
     """Schema for a single row in assignment import."""
     
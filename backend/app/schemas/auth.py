@@ -4,7 +4,7 @@ Authentication-related Pydantic schemas.
 from typing import List, Optional
 from uuid import UUID
 
-from pydantic import EmailStr, Field
+from pydantic import ConfigDict, EmailStr, Field
 
 from app.models.user import RoleType, ScopeType
 from .base import BaseSchema
@@ -91,6 +91,9 @@ class LogoutRequest(BaseSchema):
 class ForgotPasswordRequest(BaseSchema):
     """Schema for forgot password request."""
     
+    # Built on first use; an EmailStr schema imports email-validator.
+    model_config = ConfigDict(defer_build=True)
+    
     email: EmailStr = Field(description="Email address")
 
 
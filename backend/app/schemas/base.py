@@ -2,10 +2,27 @@
 Base Pydantic schemas with common patterns.
 """
 from datetime import datetime
-from typing import Any, Dict, Generic, List, Optional, TypeVar
+from typing import Annotated, Any, Dict, Generic, List, Literal, Optional, TypeVar
 from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field
+from pydantic.dataclasses import dataclass
+
+
+# Shared alias so every optional UUID-list field reuses one validator definition.
+UuidList = Annotated[Optional[List[UUID]], Field(default=None)]
+
+
+# Decorator for small, immutable summary DTOs that are built in bulk for list
+# responses. Slotted dataclasses carry no per-instance __dict__. They cannot be
+# validated from ORM attributes, so only use this for schemas constructed with
+# explicit keyword arguments.
+summary_dataclass = dataclass(
+    frozen=True,
+    slots=True,
+    kw_only=True,
+    config=ConfigDict(str_strip_whitespace=True),
+)
 
 
 class BaseSchema(BaseModel):
@@ -14,10 +31,19 @@ class BaseSchema(BaseModel):
     model_config = ConfigDict(
         from_attributes=True,
         validate_assignment=True,
-        arbitrary_types_allowed=True,
         str_strip_whitespace=True,
     )
 
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]):
+        """
+        Build an instance from already-validated data without running validators.
+
+        Only use this for values read back from the database; anything that
+        originates from a request must go through model_validate.
+        """
+        return cls.model_construct(_fields_set=set(data), **data)
+
 
 class TimestampMixin(BaseSchema):
     """Mixin for models with timestamps."""
@@ -39,7 +65,7 @@ class PaginationParams(BaseSchema):
     page: int = Field(default=1, ge=1, description="Page number (1-based)")
     size: int = Field(default=20, ge=1, le=100, description="Items per page")
     sort_by: Optional[str] = Field(default=None, description="Field to sort by")
-    sort_order: Optional[str] = Field(default="asc", pattern="^(asc|desc)$", description="Sort order")
+    sort_order: Literal["asc", "desc"] = Field(default="asc", description="Sort order")
 
 
 T = TypeVar('T')
@@ -48,6 +74,10 @@ T = TypeVar('T')
 class PaginatedResponse(BaseSchema, Generic[T]):
     """Generic paginated response."""
     
+    # Each parametrization builds its core schema on first use (FastAPI does
+    # that when registering response_model), not when the module is imported.
+    model_config = ConfigDict(defer_build=True)
+    
     items: List[T]
     total: int = Field(description="Total number of items")
     page: int = Field(description="Current page number")
@@ -57,7 +87,8 @@ class PaginatedResponse(BaseSchema, Generic[T]):
     has_prev: bool = Field(description="Whether there are previous pages")
 
 
-class ErrorDetail(BaseSchema):
+@summary_dataclass
+class ErrorDetail:
     """Error detail schema."""
     
     field: Optional[str] = Field(default=None, description="Field that caused the error")
@@ -99,5 +130,5 @@ class DateRangeFilter(BaseSchema):
 class ScopeFilter(BaseSchema):
     """Scope-based filter parameters."""
     
-    program_ids: Optional[List[UUID]] = Field(default=None, description="Filter by program IDs")
-    project_ids: Optional[List[UUID]] = Field(default=None, description="Filter by project IDs")
\ No newline at end of file
+    program_ids: UuidList = Field(description="Filter by program IDs")
+    project_ids: UuidList = Field(description="Filter by project IDs")
\ No newline at end of file
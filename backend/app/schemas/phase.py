@@ -6,61 +6,56 @@ from decimal import Decimal
 from typing import List, Optional
 from uuid import UUID
 
-from pydantic import Field, field_validator
+from pydantic import ConfigDict, Field, TypeAdapter, field_validator
 
-from .base import BaseSchema, TimestampMixin, VersionedSchema
+from ._examples import attach_examples
+from .base import BaseSchema, summary_dataclass, TimestampMixin, VersionedSchema
+
+
+_ZERO = Decimal("0")
+
+_CATEGORY_BUDGET_KEYS = ('labor_capital_budget', 'labor_expense_budget',
+                         'nonlabor_capital_budget', 'nonlabor_expense_budget')
+
+
+# Validators shared by PhaseBase and PhaseBatchItem, which declare the same fields.
+
+def _phase_end_after_start(cls, v, info):
+    """Validate that end_date is after or equal to start_date."""
+    start_date = info.data.get('start_date')
+    if start_date is not None and v < start_date:
+        raise ValueError('End date must be on or after start date')
+    return v
+
+
+def _phase_total_eq(cls, v, info):
+    """Validate that total_budget equals sum of four category budgets."""
+    data = info.data
+    budgets = [data.get(k) for k in _CATEGORY_BUDGET_KEYS]
+    if None not in budgets:
+        expected = sum(budgets)
+        if v != expected:
+            raise ValueError(f'Total budget must equal the four category budgets ({expected})')
+    return v
 
 
 class PhaseBase(BaseSchema):
     """Base phase schema with common fields."""
 
-    model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "name": "Planning",
-                    "start_date": "2024-01-01",
-                    "end_date": "2024-03-31",
-                    "description": "Initial planning phase",
-                    "labor_capital_budget": 30000.00,
-                    "labor_expense_budget": 20000.00,
-                    "nonlabor_capital_budget": 15000.00,
-                    "nonlabor_expense_budget": 10000.00,
-                    "total_budget": 75000.00
-                }
-            ]
-        }
-    }
+    model_config = ConfigDict(json_schema_extra=attach_examples)
 
     name: str = Field(min_length=1, max_length=100, description="Phase name")
     start_date: date = Field(description="Phase start date")
     end_date: date = Field(description="Phase end date")
     description: Optional[str] = Field(default=None, max_length=500, description="Phase description")
-    labor_capital_budget: Decimal = Field(ge=0, default=Decimal("0"), description="Labor capital budget")
-    labor_expense_budget: Decimal = Field(ge=0, default=Decimal("0"), description="Labor expense budget")
-    nonlabor_capital_budget: Decimal = Field(ge=0, default=Decimal("0"), description="Non-labor capital budget")
-    nonlabor_expense_budget: Decimal = Field(ge=0, default=Decimal("0"), description="Non-labor expense budget")
-    total_budget: Decimal = Field(ge=0, default=Decimal("0"), description="Total budget")
-
-    @field_validator('end_date')
-    @classmethod
-    def validate_end_date(cls, v, info):
-        """Validate that end_date is after or equal to start_date."""
-        if 'start_date' in info.data and v < info.data['start_date']:
-            raise ValueError('End date must be on or after start date')
-        return v
-
-    @field_validator('total_budget')
-    @classmethod
-    def validate_total_budget(cls, v, info):
-        """Validate that total_budget equals sum of four category budgets."""
-        keys = ('labor_capital_budget', 'labor_expense_budget',
-                'nonlabor_capital_budget', 'nonlabor_expense_budget')
-        if all(k in info.data for k in keys):
-            expected = sum(info.data[k] for k in keys)
-            if v != expected:
-                raise ValueError(f'Total budget must equal the four category budgets ({expected})')
-        return v
+    labor_capital_budget: Decimal = Field(ge=0, default=_ZERO, description="Labor capital budget")
+    labor_expense_budget: Decimal = Field(ge=0, default=_ZERO, description="Labor expense budget")
+    nonlabor_capital_budget: Decimal = Field(ge=0, default=_ZERO, description="Non-labor capital budget")
+    nonlabor_expense_budget: Decimal = Field(ge=0, default=_ZERO, description="Non-labor expense budget")
+    total_budget: Decimal = Field(ge=0, default=_ZERO, description="Total budget")
+
+    validate_end_date = field_validator('end_date')(classmethod(_phase_end_after_start))
+    validate_total_budget = field_validator('total_budget')(classmethod(_phase_total_eq))
 
 
 class PhaseCreate(PhaseBase):
@@ -88,25 +83,18 @@ class PhaseResponse(PhaseBase, TimestampMixin, VersionedSchema):
     id: UUID
     project_id: UUID
     assignment_count: Optional[int] = Field(default=0, description="Number of assignments in this phase")
-    capital_budget: Decimal = Field(default=Decimal("0"), description="Derived: labor+nonlabor capital")
-    expense_budget: Decimal = Field(default=Decimal("0"), description="Derived: labor+nonlabor expense")
+    capital_budget: Decimal = Field(default=_ZERO, description="Derived: labor+nonlabor capital")
+    expense_budget: Decimal = Field(default=_ZERO, description="Derived: labor+nonlabor expense")
+
+
+# Built once at import so list endpoints validate all rows in a single call.
+PHASE_RESPONSE_LIST_ADAPTER = TypeAdapter(List[PhaseResponse])
 
 
 class PhaseValidationRequest(BaseSchema):
     """Schema for validating phases."""
     
-    model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "id": None,
-                    "name": "Planning",
-                    "start_date": "2024-01-01",
-                    "end_date": "2024-03-31"
-                }
-            ]
-        }
-    }
+    model_config = ConfigDict(json_schema_extra=attach_examples)
     
     id: Optional[UUID] = Field(default=None, description="Phase ID (null for new phases)")
     name: str
@@ -114,7 +102,8 @@ class PhaseValidationRequest(BaseSchema):
     end_date: date
 
 
-class PhaseValidationError(BaseSchema):
+@summary_dataclass
+class PhaseValidationError:
     """Validation error details."""
     
     field: str
@@ -125,26 +114,7 @@ class PhaseValidationError(BaseSchema):
 class PhaseValidationResult(BaseSchema):
     """Result of phase validation."""
     
-    model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "is_valid": True,
-                    "errors": []
-                },
-                {
-                    "is_valid": False,
-                    "errors": [
-                        {
-                            "field": "timeline",
-                            "message": "Gap detected between Planning and Execution",
-                            "phase_id": None
-                        }
-                    ]
-                }
-            ]
-        }
-    }
+    model_config = ConfigDict(json_schema_extra=attach_examples)
     
     is_valid: bool
     errors: List[PhaseValidationError]
@@ -153,74 +123,29 @@ class PhaseValidationResult(BaseSchema):
 class PhaseBatchItem(BaseSchema):
     """Schema for a single phase in a batch update."""
 
+    model_config = ConfigDict(json_schema_extra=attach_examples)
+
     id: Optional[UUID] = Field(default=None, description="Phase ID (null for new phases)")
     name: str = Field(min_length=1, max_length=100, description="Phase name")
     start_date: date = Field(description="Phase start date")
     end_date: date = Field(description="Phase end date")
     description: Optional[str] = Field(default=None, max_length=500, description="Phase description")
-    labor_capital_budget: Decimal = Field(ge=0, default=Decimal("0"), description="Labor capital budget")
-    labor_expense_budget: Decimal = Field(ge=0, default=Decimal("0"), description="Labor expense budget")
-    nonlabor_capital_budget: Decimal = Field(ge=0, default=Decimal("0"), description="Non-labor capital budget")
-    nonlabor_expense_budget: Decimal = Field(ge=0, default=Decimal("0"), description="Non-labor expense budget")
-    total_budget: Decimal = Field(ge=0, default=Decimal("0"), description="Total budget")
-
-    @field_validator('end_date')
-    @classmethod
-    def validate_end_date(cls, v, info):
-        """Validate that end_date is after or equal to start_date."""
-        if 'start_date' in info.data and v < info.data['start_date']:
-            raise ValueError('End date must be on or after start date')
-        return v
-
-    @field_validator('total_budget')
-    @classmethod
-    def validate_total_budget(cls, v, info):
-        """Validate that total_budget equals sum of four category budgets."""
-        keys = ('labor_capital_budget', 'labor_expense_budget',
-                'nonlabor_capital_budget', 'nonlabor_expense_budget')
-        if all(k in info.data for k in keys):
-            expected = sum(info.data[k] for k in keys)
-            if v != expected:
-                raise ValueError(f'Total budget must equal the four category budgets ({expected})')
-        return v
+    labor_capital_budget: Decimal = Field(ge=0, default=_ZERO, description="Labor capital budget")
+    labor_expense_budget: Decimal = Field(ge=0, default=_ZERO, description="Labor expense budget")
+    nonlabor_capital_budget: Decimal = Field(ge=0, default=_ZERO, description="Non-labor capital budget")
+    nonlabor_expense_budget: Decimal = Field(ge=0, default=_ZERO, description="Non-labor expense budget")
+    total_budget: Decimal = Field(ge=0, default=_ZERO, description="Total budget")
+
+    validate_end_date = field_validator('end_date')(classmethod(_phase_end_after_start))
+    validate_total_budget = field_validator('total_budget')(classmethod(_phase_total_eq))
+
+
+PhaseBatchItemList = List[PhaseBatchItem]
 
 
 class PhaseBatchUpdate(BaseSchema):
     """Schema for batch updating all phases for a project."""
 
-    model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "phases": [
-                        {
-                            "id": None,
-                            "name": "Planning",
-                            "start_date": "2024-01-01",
-                            "end_date": "2024-03-31",
-                            "description": "Initial planning phase",
-                            "labor_capital_budget": 30000.00,
-                            "labor_expense_budget": 20000.00,
-                            "nonlabor_capital_budget": 15000.00,
-                            "nonlabor_expense_budget": 10000.00,
-                            "total_budget": 75000.00
-                        },
-                        {
-                            "id": "123e4567-e89b-12d3-a456-426614174001",
-                            "name": "Execution",
-                            "start_date": "2024-04-01",
-                            "end_date": "2024-12-31",
-                            "description": "Main execution phase",
-                            "labor_capital_budget": 90000.00,
-                            "labor_expense_budget": 60000.00,
-                            "nonlabor_capital_budget": 45000.00,
-                            "nonlabor_expense_budget": 30000.00,
-                            "total_budget": 225000.00
-                        }
-                    ]
-                }
-            ]
-        }
-    }
-
-    phases: List[PhaseBatchItem] = Field(description="Complete list of phases for the project")
+    model_config = ConfigDict(json_schema_extra=attach_examples)
+
+    phases: PhaseBatchItemList = Field(description="Complete list of phases for the project")
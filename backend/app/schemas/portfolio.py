@@ -23,7 +23,8 @@ class PortfolioBase(BaseSchema):
     @classmethod
     def validate_end_date(cls, v, info):
         """Validate that reporting_end_date is after reporting_start_date."""
-        if 'reporting_start_date' in info.data and v <= info.data['reporting_start_date']:
+        start_date = info.data.get('reporting_start_date')
+        if start_date is not None and v <= start_date:
             raise ValueError('Reporting end date must be after reporting start date')
         return v
 
@@ -46,9 +47,9 @@ class PortfolioUpdate(VersionedSchema):
     @classmethod
     def validate_end_date(cls, v, info):
         """Validate that reporting_end_date is after reporting_start_date."""
-        if v is not None and 'reporting_start_date' in info.data and info.data['reporting_start_date'] is not None:
-            if v <= info.data['reporting_start_date']:
-                raise ValueError('Reporting end date must be after reporting start date')
+        start_date = info.data.get('reporting_start_date')
+        if v is not None and start_date is not None and v <= start_date:
+            raise ValueError('Reporting end date must be after reporting start date')
         return v
 
 
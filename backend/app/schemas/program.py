@@ -7,7 +7,7 @@ from uuid import UUID
 
 from pydantic import Field, field_validator
 
-from .base import BaseSchema, TimestampMixin, PaginatedResponse, VersionedSchema
+from .base import BaseSchema, summary_dataclass, TimestampMixin, PaginatedResponse, VersionedSchema
 
 if TYPE_CHECKING:
     from .portfolio import PortfolioSummary
@@ -28,7 +28,8 @@ class ProgramBase(BaseSchema):
     @classmethod
     def validate_end_date(cls, v, info):
         """Validate that end_date is after start_date."""
-        if 'start_date' in info.data and v <= info.data['start_date']:
+        start_date = info.data.get('start_date')
+        if start_date is not None and v <= start_date:
             raise ValueError('End date must be after start date')
         return v
 
@@ -55,9 +56,9 @@ class ProgramUpdate(VersionedSchema):
     @classmethod
     def validate_end_date(cls, v, info):
         """Validate that end_date is after start_date."""
-        if v is not None and 'start_date' in info.data and info.data['start_date'] is not None:
-            if v <= info.data['start_date']:
-                raise ValueError('End date must be after start date')
+        start_date = info.data.get('start_date')
+        if v is not None and start_date is not None and v <= start_date:
+            raise ValueError('End date must be after start date')
         return v
 
 
@@ -75,7 +76,8 @@ class ProgramListResponse(PaginatedResponse[ProgramResponse]):
     pass
 
 
-class ProgramSummary(BaseSchema):
+@summary_dataclass
+class ProgramSummary:
     """Summary schema for program with basic info."""
     
     id: UUID
@@ -86,6 +88,12 @@ class ProgramSummary(BaseSchema):
     project_count: int = Field(default=0, description="Number of projects in this program")
 
 
-# Resolve forward references
+# Resolve forward references once. PortfolioSummary is passed explicitly so the
+# rebuild does not have to walk the module namespace to find it. The list
+# response was parametrized while ProgramResponse was still incomplete, so it is
+# rebuilt here too rather than lazily on the first request that uses it.
 from .portfolio import PortfolioSummary  # noqa: E402
-ProgramResponse.model_rebuild()
+
+for _model in (ProgramResponse, PaginatedResponse[ProgramResponse], ProgramListResponse):
+    if not _model.__pydantic_complete__:
+        _model.model_rebuild(_types_namespace={"PortfolioSummary": PortfolioSummary})
@@ -2,13 +2,13 @@
 Project-related Pydantic schemas.
 """
 from datetime import date
-from decimal import Decimal
 from typing import Any, Dict, List, Literal, Optional
 from uuid import UUID
 
 from pydantic import Field, field_validator
 
-from .base import BaseSchema, TimestampMixin, PaginatedResponse, VersionedSchema
+from .base import BaseSchema, summary_dataclass, TimestampMixin, PaginatedResponse, VersionedSchema
+from .phase import PhaseResponse
 
 
 class ProjectBase(BaseSchema):
@@ -29,7 +29,8 @@ class ProjectBase(BaseSchema):
     @classmethod
     def validate_end_date(cls, v, info):
         """Validate that end_date is after start_date."""
-        if 'start_date' in info.data and v <= info.data['start_date']:
+        start_date = info.data.get('start_date')
+        if start_date is not None and v <= start_date:
             raise ValueError('End date must be after start date')
         return v
 
@@ -57,9 +58,9 @@ class ProjectUpdate(VersionedSchema):
     @classmethod
     def validate_end_date(cls, v, info):
         """Validate that end_date is after start_date."""
-        if v is not None and 'start_date' in info.data and info.data['start_date'] is not None:
-            if v <= info.data['start_date']:
-                raise ValueError('End date must be after start date')
+        start_date = info.data.get('start_date')
+        if v is not None and start_date is not None and v <= start_date:
+            raise ValueError('End date must be after start date')
         return v
 
 
@@ -94,77 +95,12 @@ class ProjectDateChangePreview(BaseSchema):
     constraints: List[ProjectDateConstraint]
 
 
-class ProjectPhaseBase(BaseSchema):
-    """Base project phase schema with common fields (deprecated - use PhaseBase instead)."""
-    
-    project_id: UUID = Field(description="Project ID this phase belongs to")
-    name: str = Field(min_length=1, max_length=100, description="Phase name")
-    start_date: date = Field(description="Phase start date")
-    end_date: date = Field(description="Phase end date")
-    description: Optional[str] = Field(default=None, max_length=500, description="Phase description")
-    capital_budget: Decimal = Field(ge=0, default=Decimal("0"), description="Capital budget amount")
-    expense_budget: Decimal = Field(ge=0, default=Decimal("0"), description="Expense budget amount")
-    total_budget: Decimal = Field(ge=0, default=Decimal("0"), description="Total budget amount")
-    
-    @field_validator('end_date')
-    @classmethod
-    def validate_end_date(cls, v, info):
-        """Validate that end_date is after or equal to start_date."""
-        if 'start_date' in info.data and v < info.data['start_date']:
-            raise ValueError('End date must be on or after start date')
-        return v
-    
-    @field_validator('total_budget')
-    @classmethod
-    def validate_total_budget(cls, v, info):
-        """Validate that total_budget equals capital_budget + expense_budget."""
-        if 'capital_budget' in info.data and 'expense_budget' in info.data:
-            expected_total = info.data['capital_budget'] + info.data['expense_budget']
-            if v != expected_total:
-                raise ValueError(f'Total budget must equal capital budget + expense budget ({expected_total})')
-        return v
-
-
-class ProjectPhaseCreate(ProjectPhaseBase):
-    """Schema for creating a new project phase (deprecated - use PhaseCreate instead)."""
-    pass
-
-
-class ProjectPhaseUpdate(VersionedSchema):
-    """Schema for updating an existing project phase (deprecated - use PhaseUpdate instead)."""
-    
-    name: Optional[str] = Field(default=None, min_length=1, max_length=100, description="Phase name")
-    start_date: Optional[date] = Field(default=None, description="Phase start date")
-    end_date: Optional[date] = Field(default=None, description="Phase end date")
-    description: Optional[str] = Field(default=None, max_length=500, description="Phase description")
-    capital_budget: Optional[Decimal] = Field(default=None, ge=0, description="Capital budget amount")
-    expense_budget: Optional[Decimal] = Field(default=None, ge=0, description="Expense budget amount")
-    total_budget: Optional[Decimal] = Field(default=None, ge=0, description="Total budget amount")
-    
-    @field_validator('total_budget')
-    @classmethod
-    def validate_total_budget(cls, v, info):
-        """Validate that total_budget equals capital_budget + expense_budget."""
-        if v is not None and 'capital_budget' in info.data and 'expense_budget' in info.data:
-            if info.data['capital_budget'] is not None and info.data['expense_budget'] is not None:
-                expected_total = info.data['capital_budget'] + info.data['expense_budget']
-                if v != expected_total:
-                    raise ValueError(f'Total budget must equal capital budget + expense budget ({expected_total})')
-        return v
-
-
-class ProjectPhaseResponse(ProjectPhaseBase, TimestampMixin, VersionedSchema):
-    """Schema for project phase response (deprecated - use PhaseResponse instead)."""
-    id: UUID
-    assignment_count: Optional[int] = Field(default=0, description="Number of assignments in this phase")
-
-
 class ProjectResponse(ProjectBase, TimestampMixin, VersionedSchema):
     """Schema for project response."""
 
     business_id: Optional[str] = Field(default=None, description="Human-friendly 9-digit ID (server-generated)")
     program_name: Optional[str] = Field(default=None, description="Program name")
-    phases: Optional[List[ProjectPhaseResponse]] = Field(default=None, description="Project phases")
+    phases: Optional[List[PhaseResponse]] = Field(default=None, description="Project phases")
     assignment_count: Optional[int] = Field(default=0, description="Number of resource assignments")
     actual_count: Optional[int] = Field(default=0, description="Number of actual records")
     phase_adjustments: Optional[List[dict]] = Field(default=None, description="Phase date adjustments made during project update")
@@ -175,7 +111,8 @@ class ProjectListResponse(PaginatedResponse[ProjectResponse]):
     pass
 
 
-class ProjectSummary(BaseSchema):
+@summary_dataclass
+class ProjectSummary:
     """Summary schema for project with basic info."""
     
     id: UUID
@@ -3,12 +3,12 @@ Rate-related Pydantic schemas.
 """
 from datetime import date
 from decimal import Decimal
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
 
-from pydantic import Field, field_validator
+from pydantic import ConfigDict, Field, field_validator
 
-from .base import BaseSchema, TimestampMixin, PaginatedResponse, VersionedSchema
+from .base import BaseSchema, summary_dataclass, TimestampMixin, PaginatedResponse, VersionedSchema
 
 
 class RateBase(BaseSchema):
@@ -23,7 +23,8 @@ class RateBase(BaseSchema):
     @classmethod
     def validate_end_date(cls, v, info):
         """Validate that end_date is after start_date."""
-        if v is not None and 'start_date' in info.data and v <= info.data['start_date']:
+        start_date = info.data.get('start_date')
+        if v is not None and start_date is not None and v <= start_date:
             raise ValueError('End date must be after start date')
         return v
 
@@ -45,15 +46,19 @@ class RateUpdate(VersionedSchema):
     @classmethod
     def validate_end_date(cls, v, info):
         """Validate that end_date is after start_date."""
-        if v is not None and 'start_date' in info.data and info.data['start_date'] is not None:
-            if v <= info.data['start_date']:
-                raise ValueError('End date must be after start date')
+        start_date = info.data.get('start_date')
+        if v is not None and start_date is not None and v <= start_date:
+            raise ValueError('End date must be after start date')
         return v
 
 
 class RateResponse(RateBase, TimestampMixin, VersionedSchema):
     """Schema for rate response."""
     
+    # The single-record endpoints set the derived fields below on an already
+    # validated response; don't re-validate the model on each of those sets.
+    model_config = ConfigDict(validate_assignment=False)
+    
     worker_type_name: Optional[str] = Field(default=None, description="Worker type name")
     is_current: Optional[bool] = Field(default=None, description="Whether this is the current rate")
 
@@ -63,7 +68,8 @@ class RateListResponse(PaginatedResponse[RateResponse]):
     pass
 
 
-class RateHistory(BaseSchema):
+@summary_dataclass
+class RateHistory:
     """Schema for rate history information."""
     
     id: UUID
@@ -3,14 +3,42 @@ Report and forecast-related Pydantic schemas.
 """
 from datetime import date
 from decimal import Decimal
-from typing import Dict, List, Optional
+from typing import Annotated, Dict, List, Literal, Optional
 from uuid import UUID
 
-from pydantic import Field
+from pydantic import AfterValidator, ConfigDict, Field
 
 from .base import BaseSchema, DateRangeFilter, ScopeFilter
 
 
+_CENT = Decimal("0.01")
+
+
+def _to_cents(amount: Decimal) -> Decimal:
+    """Round a monetary amount to whole cents."""
+    return amount.quantize(_CENT)
+
+
+# Monetary amounts, quantized to the cent precision of the Numeric(15, 2)
+# cost and budget columns they are aggregated from; computed totals can carry
+# more decimal places than that.
+Money = Annotated[Decimal, AfterValidator(_to_cents)]
+
+# Mirrors the values of app.services.variance_analysis.VarianceType.
+VarianceTypeName = Literal[
+    "allocation_over",
+    "allocation_under",
+    "cost_over",
+    "cost_under",
+    "unplanned_work",
+    "unworked_assignment",
+]
+
+# Read-only report rows; core schemas are built on first use rather than at
+# import since most processes never generate a report.
+_REPORT_ROW_CONFIG = ConfigDict(frozen=True, defer_build=True)
+
+
 class ReportFilters(DateRangeFilter, ScopeFilter):
     """Base filters for reports."""
     
@@ -22,40 +50,52 @@ class ReportFilters(DateRangeFilter, ScopeFilter):
 class BudgetBreakdown(BaseSchema):
     """Schema for budget breakdown information."""
     
-    capital_budget: Decimal = Field(description="Capital budget amount")
-    expense_budget: Decimal = Field(description="Expense budget amount")
-    total_budget: Decimal = Field(description="Total budget amount")
+    capital_budget: Money = Field(description="Capital budget amount")
+    expense_budget: Money = Field(description="Expense budget amount")
+    total_budget: Money = Field(description="Total budget amount")
 
 
 class ActualBreakdown(BaseSchema):
     """Schema for actual costs breakdown."""
     
-    capital_actual: Decimal = Field(description="Capital actual amount")
-    expense_actual: Decimal = Field(description="Expense actual amount")
-    total_actual: Decimal = Field(description="Total actual amount")
+    capital_actual: Money = Field(description="Capital actual amount")
+    expense_actual: Money = Field(description="Expense actual amount")
+    total_actual: Money = Field(description="Total actual amount")
 
 
 class ForecastBreakdown(BaseSchema):
     """Schema for forecast breakdown."""
     
-    capital_forecast: Decimal = Field(description="Capital forecast amount")
-    expense_forecast: Decimal = Field(description="Expense forecast amount")
-    total_forecast: Decimal = Field(description="Total forecast amount")
+    capital_forecast: Money = Field(description="Capital forecast amount")
+    expense_forecast: Money = Field(description="Expense forecast amount")
+    total_forecast: Money = Field(description="Total forecast amount")
 
 
 class VarianceBreakdown(BaseSchema):
     """Schema for variance breakdown."""
     
-    budget_vs_actual_variance: Decimal = Field(description="Budget vs actual variance")
-    budget_vs_forecast_variance: Decimal = Field(description="Budget vs forecast variance")
-    actual_vs_forecast_variance: Decimal = Field(description="Actual vs forecast variance")
+    budget_vs_actual_variance: Money = Field(description="Budget vs actual variance")
+    budget_vs_forecast_variance: Money = Field(description="Budget vs forecast variance")
+    actual_vs_forecast_variance: Money = Field(description="Actual vs forecast variance")
     budget_vs_actual_percentage: Decimal = Field(description="Budget vs actual variance percentage")
     budget_vs_forecast_percentage: Decimal = Field(description="Budget vs forecast variance percentage")
 
 
+class ReportSummary(BaseSchema):
+    """Schema for overall financial totals of a report."""
+    
+    total_budget: Money = Field(description="Total budget amount")
+    total_actual: Money = Field(description="Total actual amount")
+    total_forecast: Money = Field(description="Total forecast amount")
+    budget_vs_actual_variance: Money = Field(description="Budget vs actual variance")
+    budget_vs_forecast_variance: Money = Field(description="Budget vs forecast variance")
+
+
 class ProjectFinancialSummary(BaseSchema):
     """Schema for project financial summary."""
     
+    model_config = _REPORT_ROW_CONFIG
+    
     project_id: UUID = Field(description="Project ID")
     project_name: str = Field(description="Project name")
     program_id: UUID = Field(description="Program ID")
@@ -70,6 +110,8 @@ class ProjectFinancialSummary(BaseSchema):
 class ProgramFinancialSummary(BaseSchema):
     """Schema for program financial summary."""
     
+    model_config = _REPORT_ROW_CONFIG
+    
     program_id: UUID = Field(description="Program ID")
     program_name: str = Field(description="Program name")
     project_count: int = Field(description="Number of projects in program")
@@ -85,20 +127,22 @@ class BudgetVsActualReport(BaseSchema):
     
     report_date: date = Field(description="Report generation date")
     filters: ReportFilters = Field(description="Applied filters")
-    summary: Dict[str, Decimal] = Field(description="Overall summary totals")
+    summary: ReportSummary = Field(description="Overall summary totals")
     programs: List[ProgramFinancialSummary] = Field(description="Program-level data")
 
 
 class TimeSeriesDataPoint(BaseSchema):
     """Schema for time series data point."""
     
+    model_config = _REPORT_ROW_CONFIG
+    
     data_date: date = Field(description="Data point date")
-    budget: Decimal = Field(description="Budget amount")
-    actual: Decimal = Field(description="Actual amount")
-    forecast: Decimal = Field(description="Forecast amount")
-    cumulative_budget: Decimal = Field(description="Cumulative budget")
-    cumulative_actual: Decimal = Field(description="Cumulative actual")
-    cumulative_forecast: Decimal = Field(description="Cumulative forecast")
+    budget: Money = Field(description="Budget amount")
+    actual: Money = Field(description="Actual amount")
+    forecast: Money = Field(description="Forecast amount")
+    cumulative_budget: Money = Field(description="Cumulative budget")
+    cumulative_actual: Money = Field(description="Cumulative actual")
+    cumulative_forecast: Money = Field(description="Cumulative forecast")
 
 
 class ForecastReport(BaseSchema):
@@ -107,7 +151,7 @@ class ForecastReport(BaseSchema):
     report_date: date = Field(description="Report generation date")
     forecast_date: date = Field(description="Forecast as of date")
     filters: ReportFilters = Field(description="Applied filters")
-    summary: Dict[str, Decimal] = Field(description="Overall summary totals")
+    summary: ReportSummary = Field(description="Overall summary totals")
     time_series: List[TimeSeriesDataPoint] = Field(description="Time series data")
     programs: List[ProgramFinancialSummary] = Field(description="Program-level forecasts")
 
@@ -115,14 +159,22 @@ class ForecastReport(BaseSchema):
 class VarianceException(BaseSchema):
     """Schema for variance exception."""
     
-    entity_type: str = Field(description="Entity type (program/project)")
+    entity_type: Literal["program", "project"] = Field(description="Entity type (program/project)")
     entity_id: UUID = Field(description="Entity ID")
     entity_name: str = Field(description="Entity name")
-    variance_type: str = Field(description="Type of variance")
-    variance_amount: Decimal = Field(description="Variance amount")
+    variance_type: VarianceTypeName = Field(description="Type of variance")
+    variance_amount: Money = Field(description="Variance amount")
     variance_percentage: Decimal = Field(description="Variance percentage")
     threshold_exceeded: Decimal = Field(description="Threshold that was exceeded")
-    severity: str = Field(description="Severity level (low/medium/high)")
+    severity: Literal["low", "medium", "high"] = Field(description="Severity level (low/medium/high)")
+
+
+class VarianceSeveritySummary(BaseSchema):
+    """Schema for variance exception counts by severity."""
+    
+    low: int = Field(default=0, ge=0, description="Number of low severity exceptions")
+    medium: int = Field(default=0, ge=0, description="Number of medium severity exceptions")
+    high: int = Field(default=0, ge=0, description="Number of high severity exceptions")
 
 
 class VarianceAnalysisReport(BaseSchema):
@@ -131,13 +183,15 @@ class VarianceAnalysisReport(BaseSchema):
     report_date: date = Field(description="Report generation date")
     filters: ReportFilters = Field(description="Applied filters")
     thresholds: Dict[str, Decimal] = Field(description="Variance thresholds used")
-    summary: Dict[str, int] = Field(description="Summary of exceptions by severity")
+    summary: VarianceSeveritySummary = Field(description="Summary of exceptions by severity")
     exceptions: List[VarianceException] = Field(description="Variance exceptions")
 
 
 class ResourceUtilization(BaseSchema):
     """Schema for resource utilization data."""
     
+    model_config = _REPORT_ROW_CONFIG
+    
     resource_id: UUID = Field(description="Resource ID")
     resource_name: str = Field(description="Resource name")
     resource_type: str = Field(description="Resource type")
@@ -151,6 +205,8 @@ class ResourceUtilization(BaseSchema):
 class WorkerUtilization(BaseSchema):
     """Schema for worker utilization data."""
     
+    model_config = _REPORT_ROW_CONFIG
+    
     external_worker_id: str = Field(description="External worker ID")
     worker_name: str = Field(description="Worker name")
     worker_type: str = Field(description="Worker type")
@@ -159,7 +215,16 @@ class WorkerUtilization(BaseSchema):
     working_days: int = Field(description="Number of days with actuals")
     total_days: int = Field(description="Total days in period")
     utilization_percentage: Decimal = Field(description="Utilization percentage")
-    total_cost: Decimal = Field(description="Total cost")
+    total_cost: Money = Field(description="Total cost")
+
+
+class UtilizationSummary(BaseSchema):
+    """Schema for overall utilization totals."""
+    
+    resource_count: int = Field(description="Number of resources in the report")
+    worker_count: int = Field(description="Number of workers in the report")
+    average_utilization_percentage: Decimal = Field(description="Average utilization percentage")
+    total_cost: Money = Field(description="Total cost")
 
 
 class ResourceUtilizationReport(BaseSchema):
@@ -167,7 +232,7 @@ class ResourceUtilizationReport(BaseSchema):
     
     report_date: date = Field(description="Report generation date")
     filters: ReportFilters = Field(description="Applied filters")
-    summary: Dict[str, Decimal] = Field(description="Overall utilization summary")
+    summary: UtilizationSummary = Field(description="Overall utilization summary")
     resource_utilization: List[ResourceUtilization] = Field(description="Resource utilization data")
     worker_utilization: List[WorkerUtilization] = Field(description="Worker utilization data")
 
@@ -175,7 +240,7 @@ class ResourceUtilizationReport(BaseSchema):
 class ExportFormat(BaseSchema):
     """Schema for report export format options."""
     
-    format: str = Field(description="Export format (pdf, excel, csv)")
+    format: Literal["pdf", "excel", "csv"] = Field(description="Export format (pdf, excel, csv)")
     include_charts: bool = Field(default=True, description="Include charts in export")
     include_details: bool = Field(default=True, description="Include detailed data")
 
@@ -192,6 +257,6 @@ class ReportExportResponse(BaseSchema):
     """Schema for report export response."""
     
     export_id: UUID = Field(description="Export job ID")
-    status: str = Field(description="Export status")
+    status: Literal["pending", "running", "ready", "failed", "expired"] = Field(description="Export status")
     download_url: Optional[str] = Field(default=None, description="Download URL when ready")
     expires_at: Optional[str] = Field(default=None, description="Download URL expiration")
\ No newline at end of file
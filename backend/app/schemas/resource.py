@@ -4,10 +4,10 @@ Resource-related Pydantic schemas.
 from typing import List, Optional
 from uuid import UUID
 
-from pydantic import Field
+from pydantic import ConfigDict, Field, TypeAdapter
 
 from app.models.resource import ResourceType
-from .base import BaseSchema, TimestampMixin, PaginatedResponse, VersionedSchema
+from .base import BaseSchema, summary_dataclass, TimestampMixin, PaginatedResponse, VersionedSchema
 from .nonlabor_plan import ExternalReferenceInput, ExternalReferenceResponse
 
 
@@ -56,6 +56,8 @@ class ResourceUpdate(VersionedSchema):
 class ResourceResponse(ResourceBase, TimestampMixin, VersionedSchema):
     """Schema for resource response."""
 
+    model_config = ConfigDict(frozen=True)
+
     worker_id: Optional[UUID] = Field(default=None)
     resource_role_id: Optional[UUID] = Field(default=None)
     resource_role_name: Optional[str] = Field(default=None, description="Denormalized resource role name")
@@ -100,6 +102,10 @@ class WorkerTypeResponse(WorkerTypeBase, TimestampMixin, VersionedSchema):
     current_rate: Optional[str] = Field(default=None, description="Current rate for this worker type")
 
 
+# Built once at import so list endpoints validate all rows in a single call.
+WORKER_TYPE_RESPONSE_LIST_ADAPTER = TypeAdapter(List[WorkerTypeResponse])
+
+
 class WorkerBase(BaseSchema):
     """Base worker schema with common fields."""
     
@@ -126,6 +132,10 @@ class WorkerUpdate(VersionedSchema):
 class WorkerResponse(WorkerBase, TimestampMixin, VersionedSchema):
     """Schema for worker response."""
     
+    # The single-record endpoints set the derived fields below on an already
+    # validated response; don't re-validate the model on each of those sets.
+    model_config = ConfigDict(validate_assignment=False)
+    
     worker_type_name: Optional[str] = Field(default=None, description="Worker type name")
     current_rate: Optional[str] = Field(default=None, description="Current rate for this worker")
 
@@ -135,7 +145,8 @@ class WorkerListResponse(PaginatedResponse[WorkerResponse]):
     pass
 
 
-class ResourceSummary(BaseSchema):
+@summary_dataclass
+class ResourceSummary:
     """Summary schema for resource with basic info."""
     
     id: UUID
@@ -143,7 +154,8 @@ class ResourceSummary(BaseSchema):
     resource_type: ResourceType
 
 
-class WorkerSummary(BaseSchema):
+@summary_dataclass
+class WorkerSummary:
     """Summary schema for worker with basic info."""
     
     id: UUID
@@ -1,20 +1,31 @@
 """
 User-related Pydantic schemas.
 """
-from typing import List, Optional
+from typing import Annotated, List, Optional
 from uuid import UUID
 
-from pydantic import EmailStr, Field
+from pydantic import ConfigDict, EmailStr, Field
 
 from app.models.user import RoleType, ScopeType
-from .base import BaseSchema, TimestampMixin, PaginatedResponse, VersionedSchema
+from .auth import UserScope
+from .base import BaseSchema, summary_dataclass, TimestampMixin, PaginatedResponse, VersionedSchema
+
+
+# One email type shared by every user schema that accepts an address.
+_Email = Annotated[str, EmailStr]
+
+# Building an EmailStr schema imports email-validator (and idna), so schemas
+# with email fields are built on first use rather than at import.
+_EMAIL_SCHEMA_CONFIG = ConfigDict(defer_build=True)
 
 
 class UserBase(BaseSchema):
     """Base user schema with common fields."""
     
+    model_config = _EMAIL_SCHEMA_CONFIG
+    
     username: str = Field(min_length=1, max_length=100, description="Username")
-    email: EmailStr = Field(description="Email address")
+    email: _Email = Field(description="Email address")
     is_active: bool = Field(default=True, description="Whether the user is active")
 
 
@@ -27,8 +38,10 @@ class UserCreate(UserBase):
 class UserUpdate(VersionedSchema):
     """Schema for updating an existing user."""
     
+    model_config = _EMAIL_SCHEMA_CONFIG
+    
     username: Optional[str] = Field(default=None, min_length=1, max_length=100, description="Username")
-    email: Optional[EmailStr] = Field(default=None, description="Email address")
+    email: Optional[_Email] = Field(default=None, description="Email address")
     is_active: Optional[bool] = Field(default=None, description="Whether the user is active")
 
 
@@ -92,6 +105,8 @@ class UserRoleResponse(UserRoleBase, TimestampMixin, VersionedSchema):
 class UserResponse(UserBase, TimestampMixin, VersionedSchema):
     """Schema for user response."""
     
+    model_config = ConfigDict(frozen=True)
+    
     user_roles: Optional[List[UserRoleResponse]] = Field(default=None, description="User roles")
 
 
@@ -100,7 +115,8 @@ class UserListResponse(PaginatedResponse[UserResponse]):
     pass
 
 
-class UserSummary(BaseSchema):
+@summary_dataclass
+class UserSummary:
     """Summary schema for user with basic info."""
     
     id: UUID
@@ -117,5 +133,5 @@ class CurrentUserResponse(BaseSchema):
     email: str
     is_active: bool
     active_roles: List[RoleType] = Field(description="Currently active roles")
-    available_scopes: List[dict] = Field(description="Available scopes for the user")
-    current_scope: Optional[dict] = Field(default=None, description="Currently selected scope")
\ No newline at end of file
+    available_scopes: List[UserScope] = Field(description="Available scopes for the user")
+    current_scope: Optional[UserScope] = Field(default=None, description="Currently selected scope")
\ No newline at end of file
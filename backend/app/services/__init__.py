@@ -1,32 +1,68 @@
 """
 Business services for the application.
 """
-from app.services.program import program_service, ProgramService
-from app.services.project import project_service, ProjectService
-from app.services.phase_service import phase_service, PhaseService
-from app.services.resource import (
-    resource_service,
-    worker_service,
-    worker_type_service,
-    rate_service,
-    ResourceService,
-    WorkerService,
-    WorkerTypeService,
-    RateService,
-)
-from app.services.assignment import assignment_service, AssignmentService
-from app.services.actuals_import import actuals_import_service, ActualsImportService
-from app.services.allocation_validator import allocation_validator_service, AllocationValidatorService
-from app.services.actuals import actuals_service, ActualsService
-from app.services.variance_analysis import variance_analysis_service, VarianceAnalysisService
-from app.services.forecasting import forecasting_service, ForecastingService
-from app.services.reporting import reporting_service, ReportingService
-from app.services.authentication import authentication_service, AuthenticationService
-from app.services.scope_validator import scope_validator_service, ScopeValidatorService
-from app.services.authorization import authorization_service, AuthorizationService, Permission
-from app.services.role_management import role_management_service, RoleManagementService
-from app.services.permission_cache import permission_cache_service, PermissionCacheService
-from app.services.audit import audit_service, AuditService
+import importlib
+from typing import Any
+
+# Exported names are imported on first attribute access (PEP 562) so that
+# importing one service module does not pull in every other service.
+_LAZY = {
+    "program_service": "app.services.program",
+    "ProgramService": "app.services.program",
+    "project_service": "app.services.project",
+    "ProjectService": "app.services.project",
+    "phase_service": "app.services.phase_service",
+    "PhaseService": "app.services.phase_service",
+    "resource_service": "app.services.resource",
+    "worker_service": "app.services.resource",
+    "worker_type_service": "app.services.resource",
+    "rate_service": "app.services.resource",
+    "ResourceService": "app.services.resource",
+    "WorkerService": "app.services.resource",
+    "WorkerTypeService": "app.services.resource",
+    "RateService": "app.services.resource",
+    "assignment_service": "app.services.assignment",
+    "AssignmentService": "app.services.assignment",
+    "actuals_import_service": "app.services.actuals_import",
+    "ActualsImportService": "app.services.actuals_import",
+    "allocation_validator_service": "app.services.allocation_validator",
+    "AllocationValidatorService": "app.services.allocation_validator",
+    "actuals_service": "app.services.actuals",
+    "ActualsService": "app.services.actuals",
+    "variance_analysis_service": "app.services.variance_analysis",
+    "VarianceAnalysisService": "app.services.variance_analysis",
+    "forecasting_service": "app.services.forecasting",
+    "ForecastingService": "app.services.forecasting",
+    "reporting_service": "app.services.reporting",
+    "ReportingService": "app.services.reporting",
+    "authentication_service": "app.services.authentication",
+    "AuthenticationService": "app.services.authentication",
+    "scope_validator_service": "app.services.scope_validator",
+    "ScopeValidatorService": "app.services.scope_validator",
+    "authorization_service": "app.services.authorization",
+    "AuthorizationService": "app.services.authorization",
+    "Permission": "app.services.authorization",
+    "role_management_service": "app.services.role_management",
+    "RoleManagementService": "app.services.role_management",
+    "permission_cache_service": "app.services.permission_cache",
+    "PermissionCacheService": "app.services.permission_cache",
+    "audit_service": "app.services.audit",
+    "AuditService": "app.services.audit",
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
 
 __all__ = [
     "program_service",
@@ -1,15 +1,22 @@
 """
 ActualsService for managing actual work records with cost calculation.
 """
+import functools
+import threading
 from datetime import date
 from decimal import Decimal
-from typing import List, Dict, Any, Optional
+from typing import Callable, List, Dict, Any, Iterable, Optional, Tuple
 from uuid import UUID, uuid4
 
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
 from app.models.actual import Actual, ActualImportBatch
-from app.models.resource import ResourceType
+from app.models.project import Project
+from app.models.rate import Rate
+from app.models.resource import Resource, ResourceType, Worker
+from app.models.resource_assignment import ResourceAssignment
 from app.repositories.actual import actual_repository
 from app.repositories.resource import worker_repository, resource_repository
 from app.repositories.rate import rate_repository
@@ -29,6 +36,155 @@ from app.core.exceptions import (
 from app.temporal import TRANSACTION_KEY
 
 
+# Decimal constants for the per-actual cost math, built once at import time.
+_ZERO = Decimal('0.00')
+_CENT = Decimal('0.01')
+_HUNDRED = Decimal('100.00')
+
+# Rows flushed per batched INSERT when importing actuals.
+IMPORT_INSERT_CHUNK_SIZE = 1000
+
+# Imports allowed to run at once in this process. The upload endpoints run
+# each import on a threadpool thread, which it holds, along with a pooled
+# connection, for its whole duration (including any wait on the import lock).
+MAX_CONCURRENT_IMPORTS = 2
+
+_import_slots = threading.BoundedSemaphore(MAX_CONCURRENT_IMPORTS)
+
+# Key for the PostgreSQL advisory lock that serializes actuals imports.
+_IMPORT_LOCK_KEY = "actuals_import"
+
+
+def _import_slot(func: Callable) -> Callable:
+    """Run an import method while holding one of the process-wide import slots."""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with _import_slots:
+            return func(*args, **kwargs)
+    return wrapper
+
+
+def _lock_actuals_import(db: Session) -> None:
+    """
+    Serialize actuals imports for the rest of the current transaction.
+
+    Two imports touching the same worker-days could otherwise both pass the
+    allocation check before either commits. On PostgreSQL a transaction-scoped
+    advisory lock makes the second import wait until the first commits or
+    rolls back; SQLite already admits a single writer.
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        db.execute(
+            text("SELECT pg_advisory_xact_lock(hashtext(:key))"),
+            {"key": _IMPORT_LOCK_KEY},
+        )
+
+
+class ActualsLookups:
+    """Reference data needed to validate and cost an actual.
+
+    This default implementation queries the repositories on every call, which
+    is right for single actuals. Batch imports use PreloadedActualsLookups.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def project(self, project_id: UUID) -> Optional[Project]:
+        return project_repository.get(self.db, project_id)
+
+    def worker(self, external_worker_id: str) -> Optional[Worker]:
+        return worker_repository.get_by_external_id(self.db, external_worker_id)
+
+    def active_rate(self, worker_type_id: UUID, as_of_date: date) -> Optional[Rate]:
+        return rate_repository.get_active_rate(
+            db=self.db,
+            worker_type_id=worker_type_id,
+            as_of_date=as_of_date
+        )
+
+    def resource(self, resource_id: UUID) -> Optional[Resource]:
+        return resource_repository.get(self.db, resource_id)
+
+    def resource_for_worker(self, worker_id: UUID) -> Optional[Resource]:
+        return resource_repository.get_by_worker_id(self.db, worker_id)
+
+    def planned_assignment(
+        self,
+        project_id: UUID,
+        resource_id: UUID,
+        assignment_date: date,
+    ) -> Optional[ResourceAssignment]:
+        return resource_assignment_repository.get_by_resource_project_date(
+            self.db, resource_id, project_id, assignment_date
+        )
+
+
+class PreloadedActualsLookups(ActualsLookups):
+    """Reference data for a whole import batch, fetched with one query per kind."""
+
+    def __init__(
+        self,
+        db: Session,
+        project_ids: Iterable[UUID],
+        external_worker_ids: Iterable[str] = (),
+        resource_ids: Iterable[UUID] = (),
+    ):
+        super().__init__(db)
+        self.projects = project_repository.get_many(db, project_ids)
+        self.resources = resource_repository.get_many(db, resource_ids)
+        self.workers = worker_repository.get_many_by_external_ids(db, external_worker_ids)
+        self.rates = rate_repository.get_by_worker_types(
+            db, {worker.worker_type_id for worker in self.workers.values()}
+        )
+        # Many rows share a worker type and date; resolve each pair once.
+        self.active_rates: Dict[Tuple[UUID, date], Optional[Rate]] = {}
+        self.worker_resources = resource_repository.get_by_worker_ids(
+            db, {worker.id for worker in self.workers.values()}
+        )
+        # Index planned assignments by cell so costing each actual is a dict
+        # lookup rather than a scan over every assignment on the project.
+        # Only labor rows (those with workers) split cost by assignment.
+        self.assignments = {
+            (assignment.project_id, assignment.resource_id, assignment.assignment_date): assignment
+            for assignments in resource_assignment_repository.get_by_projects(
+                db, self.projects if self.workers else ()
+            ).values()
+            for assignment in assignments
+        }
+
+    def project(self, project_id: UUID) -> Optional[Project]:
+        return self.projects.get(project_id)
+
+    def worker(self, external_worker_id: str) -> Optional[Worker]:
+        return self.workers.get(external_worker_id)
+
+    def active_rate(self, worker_type_id: UUID, as_of_date: date) -> Optional[Rate]:
+        key = (worker_type_id, as_of_date)
+        if key not in self.active_rates:
+            self.active_rates[key] = next(
+                (rate for rate in self.rates.get(worker_type_id, ())
+                 if rate.start_date <= as_of_date
+                 and (rate.end_date is None or rate.end_date >= as_of_date)),
+                None
+            )
+        return self.active_rates[key]
+
+    def resource(self, resource_id: UUID) -> Optional[Resource]:
+        return self.resources.get(resource_id)
+
+    def resource_for_worker(self, worker_id: UUID) -> Optional[Resource]:
+        return self.worker_resources.get(worker_id)
+
+    def planned_assignment(
+        self,
+        project_id: UUID,
+        resource_id: UUID,
+        assignment_date: date,
+    ) -> Optional[ResourceAssignment]:
+        return self.assignments.get((project_id, resource_id, assignment_date))
+
+
 class ActualsService:
     """Service for managing actual work records with cost calculation."""
     
@@ -47,6 +203,7 @@ class ActualsService:
         *,
         commit: bool = True,
         import_batch_id: Optional[UUID] = None,
+        lookups: Optional[ActualsLookups] = None,
     ) -> Actual:
         """
         Create a new actual record with automatic cost calculation.
@@ -59,6 +216,7 @@ class ActualsService:
             actual_date: Date of actual work
             allocation_percentage: Allocation percentage (0-100)
             validate_allocation: Whether to validate allocation limits
+            lookups: Preloaded reference data for batch imports
             
         Returns:
             Created Actual object
@@ -66,18 +224,99 @@ class ActualsService:
         Raises:
             ActualsServiceError: If validation fails or data is invalid
         """
+        actual_data = self._build_actual_data(
+            db=db,
+            project_id=project_id,
+            external_worker_id=external_worker_id,
+            worker_name=worker_name,
+            actual_date=actual_date,
+            allocation_percentage=allocation_percentage,
+            validate_allocation=validate_allocation,
+            import_batch_id=import_batch_id,
+            lookups=lookups,
+        )
+
+        return self._persist_actual(db, actual_data, commit=commit)
+
+    def _persist_actual(
+        self,
+        db: Session,
+        actual_data: Dict[str, Any],
+        *,
+        commit: bool,
+    ) -> Actual:
+        """Insert one actual, committing or just flushing into the open transaction."""
+        if commit:
+            return actual_repository.create(db, obj_in=actual_data)
+        return actual_repository.create_in_transaction(db, obj_in=actual_data)
+
+    def _insert_actuals(
+        self,
+        db: Session,
+        rows: List[Dict[str, Any]],
+        row_numbers: List[int],
+        keep_objects: bool = True,
+    ) -> Tuple[List[Actual], List[UUID], List[Dict[str, Any]]]:
+        """
+        Flush prepared actual rows in chunks, one batched INSERT per chunk.
+
+        Each chunk runs inside its own SAVEPOINT, so a database error only
+        unwinds that chunk and the remaining chunks are still checked. Errors
+        are reported against the CSV rows of the failing chunk; the caller
+        decides whether to commit the outer transaction.
+
+        The IDs of inserted rows are always returned, in row order. With
+        keep_objects=False the inserted instances are not collected, so each
+        flushed chunk can be garbage-collected before the next one.
+        """
+        created_actuals = []
+        actual_ids = []
+        errors = []
+        for start in range(0, len(rows), IMPORT_INSERT_CHUNK_SIZE):
+            chunk = rows[start:start + IMPORT_INSERT_CHUNK_SIZE]
+            try:
+                with db.begin_nested():
+                    inserted = actual_repository.create_many_in_transaction(db, objs_in=chunk)
+                actual_ids.extend(actual.id for actual in inserted)
+                if keep_objects:
+                    created_actuals.extend(inserted)
+            except SQLAlchemyError as e:
+                first_row = row_numbers[start]
+                last_row = row_numbers[start + len(chunk) - 1]
+                errors.append({
+                    "row": first_row,
+                    "error": f"Rows {first_row}-{last_row} could not be saved: {e}"
+                })
+        return created_actuals, actual_ids, errors
+
+    def _build_actual_data(
+        self,
+        db: Session,
+        project_id: UUID,
+        external_worker_id: str,
+        worker_name: str,
+        actual_date: date,
+        allocation_percentage: Decimal,
+        validate_allocation: bool,
+        import_batch_id: Optional[UUID],
+        lookups: Optional[ActualsLookups] = None,
+        validate_worker_name: bool = True,
+    ) -> Dict[str, Any]:
+        """Validate a labor actual and return its column values, costs included."""
+        lookups = lookups or ActualsLookups(db)
+
         # Validate project exists
-        project = project_repository.get(db, project_id)
+        project = lookups.project(project_id)
         if not project:
             raise ProjectNotFoundError(project_id)
         
         # Validate worker exists
-        worker = worker_repository.get_by_external_id(db, external_worker_id)
+        worker = lookups.worker(external_worker_id)
         if not worker:
             raise WorkerNotFoundError(external_id=external_worker_id)
         
         # Validate worker name matches
-        if worker.name != worker_name:
+        if validate_worker_name and worker.name != worker_name:
             raise BusinessRuleViolationError(
                 f"Worker name mismatch: expected '{worker.name}', got '{worker_name}'",
                 rule_code="WORKER_NAME_MISMATCH",
@@ -88,20 +327,14 @@ class ActualsService:
                 }
             )
         
-        # Validate allocation limit
+        # Validate allocation limit (one read serves both the check and the message)
         if validate_allocation:
-            is_valid = allocation_validator_service.validate_single_actual(
+            existing = allocation_validator_service.get_current_allocation(
                 db=db,
                 external_worker_id=external_worker_id,
-                actual_date=actual_date,
-                new_allocation=allocation_percentage
+                actual_date=actual_date
             )
-            if not is_valid:
-                existing = allocation_validator_service.get_current_allocation(
-                    db=db,
-                    external_worker_id=external_worker_id,
-                    actual_date=actual_date
-                )
+            if existing + allocation_percentage > allocation_validator_service.MAX_ALLOCATION:
                 raise AllocationConflictError(
                     resource_id=worker.id,
                     date=str(actual_date),
@@ -115,7 +348,8 @@ class ActualsService:
             worker=worker,
             project_id=project_id,
             actual_date=actual_date,
-            allocation_percentage=allocation_percentage
+            allocation_percentage=allocation_percentage,
+            lookups=lookups
         )
 
         # Create actual record
@@ -132,10 +366,7 @@ class ActualsService:
         }
         if import_batch_id is not None:
             actual_data["import_batch_id"] = import_batch_id
-
-        if commit:
-            return actual_repository.create(db, obj_in=actual_data)
-        return actual_repository.create_in_transaction(db, obj_in=actual_data)
+        return actual_data
 
     def _calculate_cost(
         self,
@@ -143,7 +374,8 @@ class ActualsService:
         worker: Any,
         project_id: UUID,
         actual_date: date,
-        allocation_percentage: Decimal
+        allocation_percentage: Decimal,
+        lookups: Optional[ActualsLookups] = None
     ) -> Dict[str, Any]:
         """
         Calculate cost for an actual based on worker rate and the worker's
@@ -160,22 +392,21 @@ class ActualsService:
             project_id: Project ID
             actual_date: Date of actual work
             allocation_percentage: Allocation percentage
+            lookups: Reference data source; defaults to querying per call
 
         Returns:
             Dictionary with cost breakdown and the resolved resource_id
         """
+        lookups = lookups or ActualsLookups(db)
+
         # Get worker's rate for the date
-        rate = rate_repository.get_active_rate(
-            db=db,
-            worker_type_id=worker.worker_type_id,
-            as_of_date=actual_date
-        )
+        rate = lookups.active_rate(worker.worker_type_id, actual_date)
 
         if not rate:
             raise RateNotFoundError(worker.worker_type_id, str(actual_date))
 
         # Resolve the resource linked to this worker
-        resource = resource_repository.get_by_worker_id(db, worker.id)
+        resource = lookups.resource_for_worker(worker.id)
         if not resource:
             raise BusinessRuleViolationError(
                 f"No resource linked to worker '{worker.external_id}'",
@@ -184,12 +415,7 @@ class ActualsService:
             )
 
         # Planned assignment for this resource on this date supplies the cap/exp split
-        assignments = resource_assignment_repository.get_by_project(db, project_id)
-        planned = next(
-            (a for a in assignments
-             if a.resource_id == resource.id and a.assignment_date == actual_date),
-            None
-        )
+        planned = lookups.planned_assignment(project_id, resource.id, actual_date)
         if planned is None:
             raise BusinessRuleViolationError(
                 f"No planned assignment for worker '{worker.external_id}' on {actual_date}; cannot split cost",
@@ -199,15 +425,15 @@ class ActualsService:
 
         # Calculate base cost (daily rate * allocation percentage)
         daily_rate = rate.rate_amount
-        actual_cost = ((daily_rate * allocation_percentage) / Decimal('100.00')).quantize(Decimal('0.01'))
+        actual_cost = ((daily_rate * allocation_percentage) / _HUNDRED).quantize(_CENT)
 
         total_pct = planned.capital_percentage + planned.expense_percentage
         if total_pct == 0:
-            cap_ratio = Decimal('0')
+            cap_ratio = _ZERO
         else:
             cap_ratio = planned.capital_percentage / total_pct
 
-        capital_amount = (actual_cost * cap_ratio).quantize(Decimal('0.01'))
+        capital_amount = (actual_cost * cap_ratio).quantize(_CENT)
         # Ensure capital + expense = actual_cost (handle rounding)
         expense_amount = actual_cost - capital_amount
 
@@ -230,6 +456,7 @@ class ActualsService:
         *,
         commit: bool = True,
         import_batch_id: Optional[UUID] = None,
+        lookups: Optional[ActualsLookups] = None,
     ) -> Actual:
         """
         Create a non-labor actual directly from dollar amounts.
@@ -244,15 +471,42 @@ class ActualsService:
             actual_date: Date of the actual
             capital_amount: Capital dollars
             expense_amount: Expense dollars
+            lookups: Preloaded reference data for batch imports
 
         Returns:
             Created Actual object
         """
-        project = project_repository.get(db, project_id)
+        actual_data = self._build_nonlabor_actual_data(
+            db=db,
+            project_id=project_id,
+            resource_id=resource_id,
+            actual_date=actual_date,
+            capital_amount=capital_amount,
+            expense_amount=expense_amount,
+            import_batch_id=import_batch_id,
+            lookups=lookups,
+        )
+        return self._persist_actual(db, actual_data, commit=commit)
+
+    def _build_nonlabor_actual_data(
+        self,
+        db: Session,
+        project_id: UUID,
+        resource_id: UUID,
+        actual_date: date,
+        capital_amount: Decimal,
+        expense_amount: Decimal,
+        import_batch_id: Optional[UUID],
+        lookups: Optional[ActualsLookups] = None,
+    ) -> Dict[str, Any]:
+        """Validate a non-labor actual and return its column values."""
+        lookups = lookups or ActualsLookups(db)
+
+        project = lookups.project(project_id)
         if not project:
             raise ProjectNotFoundError(project_id)
 
-        resource = resource_repository.get(db, resource_id)
+        resource = lookups.resource(resource_id)
         if not resource:
             raise ResourceNotFoundError("Resource", resource_id=resource_id)
 
@@ -277,9 +531,7 @@ class ActualsService:
         if import_batch_id is not None:
             actual_data["import_batch_id"] = import_batch_id
 
-        if commit:
-            return actual_repository.create(db, obj_in=actual_data)
-        return actual_repository.create_in_transaction(db, obj_in=actual_data)
+        return actual_data
 
     def _create_import_batch(
         self,
@@ -319,6 +571,7 @@ class ActualsService:
         db.flush()
         return batch
 
+    @_import_slot
     def import_actuals_batch(
         self,
         db: Session,
@@ -327,6 +580,7 @@ class ActualsService:
         actuals_through_date: Optional[date] = None,
         file_name: Optional[str] = None,
         imported_by_user_id: Optional[UUID] = None,
+        return_objects: bool = False,
     ) -> Dict[str, Any]:
         """
         Import a batch of actuals from validated import records.
@@ -335,6 +589,9 @@ class ActualsService:
             db: Database session
             records: List of validated ActualsImportRecord objects
             validate_allocation: Whether to validate allocation limits
+            return_objects: Include the created Actual objects under
+                "actuals". Off by default so large imports do not hold every
+                inserted row; "actual_ids" always lists the created IDs.
             
         Returns:
             Dictionary with import results
@@ -352,6 +609,9 @@ class ActualsService:
                     "errors": r.validation_errors
                 } for r in invalid_records]
             )
+
+        # Hold the import lock from the allocation check through the commit.
+        _lock_actuals_import(db)
         
         # Check for allocation conflicts if validation is enabled
         if validate_allocation:
@@ -378,7 +638,7 @@ class ActualsService:
                 )
         
         # Import actuals and completeness metadata in one transaction.
-        created_actuals = []
+        rows = []
         errors = []
         
         try:
@@ -390,9 +650,14 @@ class ActualsService:
                 file_name=file_name,
                 imported_by_user_id=imported_by_user_id,
             )
+            lookups = PreloadedActualsLookups(
+                db,
+                project_ids={record.project_id for record in records},
+                external_worker_ids={record.external_worker_id for record in records},
+            )
             for record in records:
                 try:
-                    actual = self.create_actual(
+                    rows.append(self._build_actual_data(
                         db=db,
                         project_id=record.project_id,
                         external_worker_id=record.external_worker_id,
@@ -400,10 +665,10 @@ class ActualsService:
                         actual_date=record.actual_date,
                         allocation_percentage=record.percentage,
                         validate_allocation=False,  # Already validated in batch
-                        commit=False,
                         import_batch_id=batch.id,
-                    )
-                    created_actuals.append(actual)
+                        lookups=lookups,
+                        validate_worker_name=False,  # Checked by validate_records
+                    ))
                 except Exception as e:
                     errors.append({
                         "row": record.row_number,
@@ -418,14 +683,30 @@ class ActualsService:
                     row_errors=errors
                 )
             
+            created_actuals, actual_ids, errors = self._insert_actuals(
+                db,
+                rows,
+                [record.row_number for record in records],
+                keep_objects=return_objects,
+            )
+            if errors:
+                db.rollback()
+                raise ImportException(
+                    f"Import failed with {len(errors)} errors",
+                    row_errors=errors
+                )
+
             db.commit()
             
-            return {
+            result = {
                 "status": "success",
-                "imported_count": len(created_actuals),
-                "actuals": created_actuals,
+                "imported_count": len(rows),
+                "actual_ids": actual_ids,
                 "batch": batch,
             }
+            if return_objects:
+                result["actuals"] = created_actuals
+            return result
             
         except ImportException:
             # Re-raise import exceptions
@@ -446,6 +727,7 @@ class ActualsService:
         *,
         commit: bool = True,
         import_batch_id: Optional[UUID] = None,
+        lookups: Optional[ActualsLookups] = None,
     ) -> Actual:
         """
         Create a labor actual whose capital/expense split is given explicitly
@@ -463,19 +745,49 @@ class ActualsService:
             actual_date: Date of actual work
             capital_percentage: Capital allocation percentage (0-100)
             expense_percentage: Expense allocation percentage (0-100)
+            lookups: Preloaded reference data for batch imports
 
         Returns:
             Created Actual object
         """
-        project = project_repository.get(db, project_id)
+        actual_data = self._build_labor_split_actual_data(
+            db=db,
+            project_id=project_id,
+            external_worker_id=external_worker_id,
+            worker_name=worker_name,
+            actual_date=actual_date,
+            capital_percentage=capital_percentage,
+            expense_percentage=expense_percentage,
+            import_batch_id=import_batch_id,
+            lookups=lookups,
+        )
+        return self._persist_actual(db, actual_data, commit=commit)
+
+    def _build_labor_split_actual_data(
+        self,
+        db: Session,
+        project_id: UUID,
+        external_worker_id: str,
+        worker_name: str,
+        actual_date: date,
+        capital_percentage: Decimal,
+        expense_percentage: Decimal,
+        import_batch_id: Optional[UUID],
+        lookups: Optional[ActualsLookups] = None,
+        validate_worker_name: bool = True,
+    ) -> Dict[str, Any]:
+        """Validate an explicit-split labor actual and return its column values."""
+        lookups = lookups or ActualsLookups(db)
+
+        project = lookups.project(project_id)
         if not project:
             raise ProjectNotFoundError(project_id)
 
-        worker = worker_repository.get_by_external_id(db, external_worker_id)
+        worker = lookups.worker(external_worker_id)
         if not worker:
             raise WorkerNotFoundError(external_id=external_worker_id)
 
-        if worker.name != worker_name:
+        if validate_worker_name and worker.name != worker_name:
             raise BusinessRuleViolationError(
                 f"Worker name mismatch: expected '{worker.name}', got '{worker_name}'",
                 rule_code="WORKER_NAME_MISMATCH",
@@ -486,15 +798,11 @@ class ActualsService:
                 }
             )
 
-        rate = rate_repository.get_active_rate(
-            db=db,
-            worker_type_id=worker.worker_type_id,
-            as_of_date=actual_date
-        )
+        rate = lookups.active_rate(worker.worker_type_id, actual_date)
         if not rate:
             raise RateNotFoundError(worker.worker_type_id, str(actual_date))
 
-        resource = resource_repository.get_by_worker_id(db, worker.id)
+        resource = lookups.resource_for_worker(worker.id)
         if not resource:
             raise BusinessRuleViolationError(
                 f"No resource linked to worker '{worker.external_id}'",
@@ -504,8 +812,8 @@ class ActualsService:
 
         allocation_percentage = capital_percentage + expense_percentage
         daily_rate = rate.rate_amount
-        actual_cost = ((daily_rate * allocation_percentage) / Decimal('100.00')).quantize(Decimal('0.01'))
-        capital_amount = ((daily_rate * capital_percentage) / Decimal('100.00')).quantize(Decimal('0.01'))
+        actual_cost = ((daily_rate * allocation_percentage) / _HUNDRED).quantize(_CENT)
+        capital_amount = ((daily_rate * capital_percentage) / _HUNDRED).quantize(_CENT)
         # Ensure capital + expense = actual_cost exactly (handle rounding)
         expense_amount = actual_cost - capital_amount
 
@@ -523,10 +831,9 @@ class ActualsService:
         if import_batch_id is not None:
             actual_data["import_batch_id"] = import_batch_id
 
-        if commit:
-            return actual_repository.create(db, obj_in=actual_data)
-        return actual_repository.create_in_transaction(db, obj_in=actual_data)
+        return actual_data
 
+    @_import_slot
     def import_labor_batch(
         self,
         db: Session,
@@ -535,21 +842,26 @@ class ActualsService:
         actuals_through_date: Optional[date] = None,
         file_name: Optional[str] = None,
         imported_by_user_id: Optional[UUID] = None,
+        return_objects: bool = False,
     ) -> Dict[str, Any]:
         """
         Import a batch of labor actuals from validated LaborImportRecord objects.
 
-        Records carrying a single `percentage` delegate to create_actual,
+        Records carrying a single `percentage` are costed like create_actual,
         which resolves the capital/expense split from the worker's planned
         ResourceAssignment (and rejects rows with no such assignment).
         Records carrying explicit `capital_percentage`/`expense_percentage`
-        are costed directly from the worker's rate via
-        _create_labor_split_actual, bypassing the assignment lookup.
+        are costed directly from the worker's rate like
+        _create_labor_split_actual, bypassing the assignment lookup. All rows
+        are costed first and then inserted in batches.
 
         Args:
             db: Database session
             records: List of validated LaborImportRecord objects
             validate_allocation: Whether to validate allocation limits
+            return_objects: Include the created Actual objects under
+                "actuals". Off by default so large imports do not hold every
+                inserted row; "actual_ids" always lists the created IDs.
 
         Returns:
             Dictionary with import results
@@ -568,6 +880,9 @@ class ActualsService:
                 } for r in invalid_records]
             )
 
+        # Hold the import lock from the allocation check through the commit.
+        _lock_actuals_import(db)
+
         # Check for allocation conflicts if validation is enabled
         if validate_allocation:
             actuals_data = [
@@ -596,7 +911,7 @@ class ActualsService:
                 )
 
         # Import actuals and their completeness boundary in one transaction.
-        created_actuals = []
+        rows = []
         errors = []
 
         try:
@@ -608,10 +923,15 @@ class ActualsService:
                 file_name=file_name,
                 imported_by_user_id=imported_by_user_id,
             )
+            lookups = PreloadedActualsLookups(
+                db,
+                project_ids={record.project_id for record in records},
+                external_worker_ids={record.external_worker_id for record in records},
+            )
             for record in records:
                 try:
                     if record.percentage is not None:
-                        actual = self.create_actual(
+                        actual_data = self._build_actual_data(
                             db=db,
                             project_id=record.project_id,
                             external_worker_id=record.external_worker_id,
@@ -619,11 +939,12 @@ class ActualsService:
                             actual_date=record.actual_date,
                             allocation_percentage=record.percentage,
                             validate_allocation=False,  # Already validated in batch
-                            commit=False,
                             import_batch_id=batch.id,
+                            lookups=lookups,
+                            validate_worker_name=False,  # Checked by validate_records
                         )
                     else:
-                        actual = self._create_labor_split_actual(
+                        actual_data = self._build_labor_split_actual_data(
                             db=db,
                             project_id=record.project_id,
                             external_worker_id=record.external_worker_id,
@@ -631,10 +952,11 @@ class ActualsService:
                             actual_date=record.actual_date,
                             capital_percentage=record.capital_percentage,
                             expense_percentage=record.expense_percentage,
-                            commit=False,
                             import_batch_id=batch.id,
+                            lookups=lookups,
+                            validate_worker_name=False,  # Checked by validate_records
                         )
-                    created_actuals.append(actual)
+                    rows.append(actual_data)
                 except Exception as e:
                     errors.append({
                         "row": record.row_number,
@@ -649,14 +971,30 @@ class ActualsService:
                     row_errors=errors
                 )
 
+            created_actuals, actual_ids, errors = self._insert_actuals(
+                db,
+                rows,
+                [record.row_number for record in records],
+                keep_objects=return_objects,
+            )
+            if errors:
+                db.rollback()
+                raise ImportException(
+                    f"Import failed with {len(errors)} errors",
+                    row_errors=errors
+                )
+
             db.commit()
 
-            return {
+            result = {
                 "status": "success",
-                "imported_count": len(created_actuals),
-                "actuals": created_actuals,
+                "imported_count": len(rows),
+                "actual_ids": actual_ids,
                 "batch": batch,
             }
+            if return_objects:
+                result["actuals"] = created_actuals
+            return result
 
         except ImportException:
             # Re-raise import exceptions
@@ -665,6 +1003,7 @@ class ActualsService:
             db.rollback()
             raise ImportException(f"Import failed: {str(e)}")
 
+    @_import_slot
     def import_nonlabor_batch(
         self,
         db: Session,
@@ -672,6 +1011,7 @@ class ActualsService:
         actuals_through_date: Optional[date] = None,
         file_name: Optional[str] = None,
         imported_by_user_id: Optional[UUID] = None,
+        return_objects: bool = False,
     ) -> Dict[str, Any]:
         """
         Import a batch of non-labor actuals from validated
@@ -683,6 +1023,9 @@ class ActualsService:
         Args:
             db: Database session
             records: List of validated NonLaborImportRecord objects
+            return_objects: Include the created Actual objects under
+                "actuals". Off by default so large imports do not hold every
+                inserted row; "actual_ids" always lists the created IDs.
 
         Returns:
             Dictionary with import results
@@ -701,8 +1044,11 @@ class ActualsService:
                 } for r in invalid_records]
             )
 
+        # Hold the import lock through the commit.
+        _lock_actuals_import(db)
+
         # Import actuals and their completeness boundary in one transaction.
-        created_actuals = []
+        rows = []
         errors = []
 
         try:
@@ -714,19 +1060,23 @@ class ActualsService:
                 file_name=file_name,
                 imported_by_user_id=imported_by_user_id,
             )
+            lookups = PreloadedActualsLookups(
+                db,
+                project_ids={record.project_id for record in records},
+                resource_ids={record.resource_id for record in records},
+            )
             for record in records:
                 try:
-                    actual = self.create_nonlabor_actual(
+                    rows.append(self._build_nonlabor_actual_data(
                         db=db,
                         project_id=record.project_id,
                         resource_id=record.resource_id,
                         actual_date=record.actual_date,
                         capital_amount=record.capital,
                         expense_amount=record.expense,
-                        commit=False,
                         import_batch_id=batch.id,
-                    )
-                    created_actuals.append(actual)
+                        lookups=lookups,
+                    ))
                 except Exception as e:
                     errors.append({
                         "row": record.row_number,
@@ -741,14 +1091,30 @@ class ActualsService:
                     row_errors=errors
                 )
 
+            created_actuals, actual_ids, errors = self._insert_actuals(
+                db,
+                rows,
+                [record.row_number for record in records],
+                keep_objects=return_objects,
+            )
+            if errors:
+                db.rollback()
+                raise ImportException(
+                    f"Import failed with {len(errors)} errors",
+                    row_errors=errors
+                )
+
             db.commit()
 
-            return {
+            result = {
                 "status": "success",
-                "imported_count": len(created_actuals),
-                "actuals": created_actuals,
+                "imported_count": len(rows),
+                "actual_ids": actual_ids,
                 "batch": batch,
             }
+            if return_objects:
+                result["actuals"] = created_actuals
+            return result
 
         except ImportException:
             # Re-raise import exceptions
@@ -837,7 +1203,12 @@ class ActualsService:
         if not actual:
             raise ResourceNotFoundError("Actual", resource_id=actual_id)
         
-        if allocation_percentage is not None:
+        # Re-sending the stored percentage changes nothing, so skip the
+        # allocation check and the rate/assignment lookups behind the recalc.
+        if (
+            allocation_percentage is not None
+            and allocation_percentage != actual.allocation_percentage
+        ):
             # Validate allocation limit (excluding current actual)
             if validate_allocation:
                 is_valid = allocation_validator_service.validate_single_actual(
@@ -5,16 +5,93 @@ import csv
 from datetime import date, datetime
 from decimal import Decimal, InvalidOperation
 from io import StringIO
-from typing import List, Dict, Any, Optional
+from itertools import islice
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Sequence, Set, Tuple, TypeVar
 from uuid import UUID
 
 from sqlalchemy.orm import Session
 
-from app.models.resource import ResourceType
+from app.models.resource import Resource, ResourceType, Worker
 from app.repositories.project import project_repository
 from app.repositories.resource import resource_repository, worker_repository
 
 
+# Bounds for percentage and amount checks, built once rather than per row.
+_ZERO = Decimal('0.00')
+_HUNDRED = Decimal('100.00')
+
+# Shared placeholder for records without errors, so valid rows (the common
+# case) never allocate an error list of their own.
+_NO_ERRORS: Tuple[str, ...] = ()
+
+# Rows parsed and validated together when streaming an import.
+IMPORT_CHUNK_SIZE = 5000
+
+T = TypeVar("T")
+
+
+def _chunked(iterable: Iterable[T], size: int) -> Iterator[List[T]]:
+    """Yield successive lists of at most size items from iterable."""
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def _read_csv(csv_content: str) -> Tuple[Dict[str, int], Iterator[List[str]]]:
+    """
+    Read the CSV header row and return a column-index map plus the data rows.
+
+    Rows are plain lists indexed through the map, which avoids building a
+    dict per row as csv.DictReader does. Blank lines are skipped and a
+    duplicated header resolves to its last occurrence, both as DictReader
+    behaves.
+    """
+    reader = csv.reader(StringIO(csv_content))
+    headers = next(reader, None)
+    if not headers:
+        raise ActualsImportError("CSV file is empty or has no headers")
+    columns = {name: index for index, name in enumerate(headers)}
+    return columns, (row for row in reader if row)
+
+
+def _short_row_error(
+    row_num: int, row: List[str], columns: Dict[str, int], names: Sequence[str]
+) -> "ActualsImportError":
+    """Build the error for a row with fewer fields than the header requires."""
+    missing = [name for name in names if columns[name] >= len(row)]
+    return ActualsImportError(
+        f"Error parsing row {row_num}: missing values for columns: {', '.join(missing)}"
+    )
+
+
+def _parse_date(value: str) -> date:
+    """
+    Parse a YYYY-MM-DD date, raising ValueError on bad input.
+
+    date.fromisoformat is a C fast path for the canonical zero-padded form.
+    Anything else falls back to strptime, which also accepts unpadded
+    months and days. The shape check stops fromisoformat from accepting
+    the other ISO forms it allows (e.g. week dates).
+    """
+    if len(value) == 10 and value[4] == "-" and value[7] == "-":
+        try:
+            return date.fromisoformat(value)
+        except ValueError:
+            pass
+    return datetime.strptime(value, "%Y-%m-%d").date()
+
+
+def _parse_uuids(values: Iterable[str]) -> Set[UUID]:
+    """Parse the well-formed UUID strings in values, skipping the rest."""
+    parsed = set()
+    for value in values:
+        try:
+            parsed.add(UUID(value))
+        except ValueError:
+            continue
+    return parsed
+
+
 class ActualsImportError(Exception):
     """Custom exception for actuals import errors."""
     pass
@@ -28,9 +105,117 @@ class ActualsImportValidationError(Exception):
         super().__init__(f"Validation failed with {len(errors)} error(s)")
 
 
-class ActualsImportRecord:
+class _ImportRecord:
+    """Row number and validation errors shared by every import record type."""
+
+    __slots__ = ("row_number", "validation_errors")
+
+    # (error report key, attribute) pairs reported between "row" and "errors"
+    _REPORT_FIELDS: Tuple[Tuple[str, str], ...] = ()
+
+    def __init__(self, row_number: int):
+        self.row_number = row_number
+        self.validation_errors: Sequence[str] = _NO_ERRORS
+
+    def add_error(self, message: str) -> None:
+        """Record a validation error, allocating the error list on first use."""
+        if not self.validation_errors:
+            self.validation_errors = []
+        self.validation_errors.append(message)
+
+    def is_valid(self) -> bool:
+        """Check if the record passed validation."""
+        return not self.validation_errors
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert record to dictionary for error reporting."""
+        data: Dict[str, Any] = {"row": self.row_number}
+        for key, attribute in self._REPORT_FIELDS:
+            data[key] = getattr(self, attribute)
+        data["errors"] = self.validation_errors
+        return data
+
+
+class _ImportService:
+    """Record validation shared by the actuals CSV importers.
+
+    Subclasses load the reference data a chunk of records needs in
+    _load_lookups and check one record against it in _validate_record.
+    """
+
+    def _load_lookups(self, db: Session, records: List[Any]) -> Tuple[Any, ...]:
+        raise NotImplementedError
+
+    def _validate_record(self, db: Session, record: Any, *lookups: Any) -> None:
+        raise NotImplementedError
+
+    def validate_records(self, db: Session, records: List[Any]) -> List[Any]:
+        """
+        Validate all records for data integrity.
+
+        Args:
+            db: Database session
+            records: List of import records
+
+        Returns:
+            List of validated records (with validation_errors populated)
+        """
+        # Fetch the referenced rows once for the chunk instead of issuing
+        # lookups per record.
+        lookups = self._load_lookups(db, records)
+        for record in records:
+            self._validate_record(db, record, *lookups)
+
+        return records
+
+    def get_validation_errors(self, records: List[Any]) -> List[Dict[str, Any]]:
+        """
+        Get all validation errors from records.
+
+        Args:
+            records: List of validated import records
+
+        Returns:
+            List of error dictionaries
+        """
+        return [record.to_dict() for record in records if not record.is_valid()]
+
+
+def _load_worker_lookups(
+    db: Session, records: List[Any]
+) -> Tuple[Set[UUID], Dict[str, Worker]]:
+    """Fetch the projects and workers referenced by labor import records."""
+    project_ids = project_repository.exists_many(
+        db, _parse_uuids(r.project_id_str for r in records if r.project_id_str)
+    )
+    workers = worker_repository.get_many_by_external_ids(
+        db, {r.external_worker_id for r in records if r.external_worker_id}
+    )
+    return project_ids, workers
+
+
+class ActualsImportRecord(_ImportRecord):
     """Represents a single actuals import record."""
     
+    __slots__ = (
+        "project_id_str",
+        "external_worker_id",
+        "worker_name",
+        "actual_date_str",
+        "percentage_str",
+        "project_id",
+        "actual_date",
+        "percentage",
+    )
+    
+    _REPORT_FIELDS = (
+        ("project_id", "project_id_str"),
+        ("external_worker_id", "external_worker_id"),
+        ("worker_name", "worker_name"),
+        ("date", "actual_date_str"),
+        ("percentage", "percentage_str"),
+    )
+    
     def __init__(
         self,
         row_number: int,
@@ -40,7 +225,7 @@ class ActualsImportRecord:
         actual_date: str,
         percentage: str
     ):
-        self.row_number = row_number
+        super().__init__(row_number)
         self.project_id_str = project_id
         self.external_worker_id = external_worker_id
         self.worker_name = worker_name
@@ -51,26 +236,9 @@ class ActualsImportRecord:
         self.project_id: Optional[UUID] = None
         self.actual_date: Optional[date] = None
         self.percentage: Optional[Decimal] = None
-        self.validation_errors: List[str] = []
-    
-    def is_valid(self) -> bool:
-        """Check if the record passed validation."""
-        return len(self.validation_errors) == 0
-    
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert record to dictionary for error reporting."""
-        return {
-            "row": self.row_number,
-            "project_id": self.project_id_str,
-            "external_worker_id": self.external_worker_id,
-            "worker_name": self.worker_name,
-            "date": self.actual_date_str,
-            "percentage": self.percentage_str,
-            "errors": self.validation_errors
-        }
 
 
-class ActualsImportService:
+class ActualsImportService(_ImportService):
     """Service for importing actuals data from CSV files."""
     
     REQUIRED_COLUMNS = [
@@ -94,156 +262,143 @@ class ActualsImportService:
         Returns:
             List of ActualsImportRecord objects
             
+        Raises:
+            ActualsImportError: If CSV format is invalid
+        """
+        records = list(self.iter_records(csv_content))
+        if not records:
+            raise ActualsImportError("CSV file contains no data rows")
+        return records
+    
+    def iter_records(self, csv_content: str) -> Iterator[ActualsImportRecord]:
+        """
+        Validate the CSV headers, then lazily yield one record per data row.
+        
+        Header problems are raised immediately; row-level parse errors are
+        raised while iterating.
+        
         Raises:
             ActualsImportError: If CSV format is invalid
         """
         try:
-            csv_file = StringIO(csv_content)
-            reader = csv.DictReader(csv_file)
+            columns, rows = _read_csv(csv_content)
             
             # Validate headers
-            if not reader.fieldnames:
-                raise ActualsImportError("CSV file is empty or has no headers")
-            
-            missing_columns = set(self.REQUIRED_COLUMNS) - set(reader.fieldnames)
+            missing_columns = set(self.REQUIRED_COLUMNS) - set(columns)
             if missing_columns:
                 raise ActualsImportError(
                     f"Missing required columns: {', '.join(missing_columns)}"
                 )
-            
-            records = []
-            for row_num, row in enumerate(reader, start=2):  # Start at 2 (header is row 1)
+        except csv.Error as e:
+            raise ActualsImportError(f"CSV parsing error: {str(e)}")
+        
+        return self._records_from_rows(columns, rows)
+    
+    def _records_from_rows(
+        self,
+        columns: Dict[str, int],
+        rows: Iterator[List[str]],
+    ) -> Iterator[ActualsImportRecord]:
+        project_col = columns["project_id"]
+        worker_id_col = columns["external_worker_id"]
+        worker_name_col = columns["worker_name"]
+        date_col = columns["date"]
+        percentage_col = columns["percentage"]
+        width = max(columns[name] for name in self.REQUIRED_COLUMNS) + 1
+        try:
+            for row_num, row in enumerate(rows, start=2):  # Start at 2 (header is row 1)
+                if len(row) < width:
+                    raise _short_row_error(row_num, row, columns, self.REQUIRED_COLUMNS)
                 try:
-                    record = ActualsImportRecord(
+                    yield ActualsImportRecord(
                         row_number=row_num,
-                        project_id=row.get("project_id", "").strip(),
-                        external_worker_id=row.get("external_worker_id", "").strip(),
-                        worker_name=row.get("worker_name", "").strip(),
-                        actual_date=row.get("date", "").strip(),
-                        percentage=row.get("percentage", "").strip()
+                        project_id=row[project_col].strip(),
+                        external_worker_id=row[worker_id_col].strip(),
+                        worker_name=row[worker_name_col].strip(),
+                        actual_date=row[date_col].strip(),
+                        percentage=row[percentage_col].strip()
                     )
-                    records.append(record)
                 except Exception as e:
                     raise ActualsImportError(f"Error parsing row {row_num}: {str(e)}")
-            
-            if not records:
-                raise ActualsImportError("CSV file contains no data rows")
-            
-            return records
-            
         except csv.Error as e:
             raise ActualsImportError(f"CSV parsing error: {str(e)}")
     
-    def validate_records(
+    _load_lookups = staticmethod(_load_worker_lookups)
+    
+    def _validate_record(
         self,
         db: Session,
-        records: List[ActualsImportRecord]
-    ) -> List[ActualsImportRecord]:
-        """
-        Validate all records for data integrity.
-        
-        Args:
-            db: Database session
-            records: List of ActualsImportRecord objects
-            
-        Returns:
-            List of validated records (with validation_errors populated)
-        """
-        for record in records:
-            self._validate_record(db, record)
-        
-        return records
-    
-    def _validate_record(self, db: Session, record: ActualsImportRecord) -> None:
+        record: ActualsImportRecord,
+        project_ids: Set[UUID],
+        workers: Dict[str, Worker],
+    ) -> None:
         """Validate a single record."""
         
         # Validate project_id (UUID format and existence)
         if not record.project_id_str:
-            record.validation_errors.append("project_id is required")
+            record.add_error("project_id is required")
         else:
             try:
                 record.project_id = UUID(record.project_id_str)
                 # Check if project exists
-                project = project_repository.get(db, record.project_id)
-                if not project:
-                    record.validation_errors.append(
+                if record.project_id not in project_ids:
+                    record.add_error(
                         f"Project with ID {record.project_id} does not exist"
                     )
             except ValueError:
-                record.validation_errors.append(
+                record.add_error(
                     f"Invalid project_id format: {record.project_id_str}"
                 )
         
         # Validate external_worker_id
         if not record.external_worker_id:
-            record.validation_errors.append("external_worker_id is required")
+            record.add_error("external_worker_id is required")
         else:
             # Check if worker exists
-            worker = worker_repository.get_by_external_id(db, record.external_worker_id)
+            worker = workers.get(record.external_worker_id)
             if not worker:
-                record.validation_errors.append(
+                record.add_error(
                     f"Worker with external_id '{record.external_worker_id}' does not exist"
                 )
             elif record.worker_name and worker.name != record.worker_name:
-                record.validation_errors.append(
+                record.add_error(
                     f"Worker name mismatch: expected '{worker.name}', got '{record.worker_name}'"
                 )
         
         # Validate worker_name
         if not record.worker_name:
-            record.validation_errors.append("worker_name is required")
+            record.add_error("worker_name is required")
         
         # Validate date
         if not record.actual_date_str:
-            record.validation_errors.append("date is required")
+            record.add_error("date is required")
         else:
             try:
-                record.actual_date = datetime.strptime(
-                    record.actual_date_str, "%Y-%m-%d"
-                ).date()
+                record.actual_date = _parse_date(record.actual_date_str)
             except ValueError:
-                record.validation_errors.append(
+                record.add_error(
                     f"Invalid date format: {record.actual_date_str} (expected YYYY-MM-DD)"
                 )
         
         # Validate percentage
         if not record.percentage_str:
-            record.validation_errors.append("percentage is required")
+            record.add_error("percentage is required")
         else:
             try:
                 record.percentage = Decimal(record.percentage_str)
-                if record.percentage < Decimal('0.00'):
-                    record.validation_errors.append(
+                if record.percentage < _ZERO:
+                    record.add_error(
                         f"Percentage must be >= 0.0, got {record.percentage}"
                     )
-                elif record.percentage > Decimal('100.00'):
-                    record.validation_errors.append(
+                elif record.percentage > _HUNDRED:
+                    record.add_error(
                         f"Percentage must be <= 100.0, got {record.percentage}"
                     )
             except (InvalidOperation, ValueError):
-                record.validation_errors.append(
+                record.add_error(
                     f"Invalid percentage format: {record.percentage_str}"
                 )
     
-    def get_validation_errors(
-        self,
-        records: List[ActualsImportRecord]
-    ) -> List[Dict[str, Any]]:
-        """
-        Get all validation errors from records.
-        
-        Args:
-            records: List of validated ActualsImportRecord objects
-            
-        Returns:
-            List of error dictionaries
-        """
-        errors = []
-        for record in records:
-            if not record.is_valid():
-                errors.append(record.to_dict())
-        return errors
-    
     def import_actuals(
         self,
         db: Session,
@@ -265,14 +420,31 @@ class ActualsImportService:
             ActualsImportError: If CSV parsing fails
             ActualsImportValidationError: If validation fails
         """
-        # Parse CSV
-        records = self.parse_csv(csv_content)
+        # Parse and validate in chunks. Validation-only runs and files with
+        # errors keep just the error dicts, so their memory is bounded by the
+        # chunk size. A clean import still keeps every record, because they
+        # are returned for import_actuals_batch, which checks allocation and
+        # inserts the whole file in one transaction.
+        total_records = 0
+        valid_records = 0
+        validation_errors: List[Dict[str, Any]] = []
+        validated_records: List[ActualsImportRecord] = []
+        for chunk in _chunked(self.iter_records(csv_content), IMPORT_CHUNK_SIZE):
+            self.validate_records(db, chunk)
+            chunk_errors = self.get_validation_errors(chunk)
+            validation_errors.extend(chunk_errors)
+            total_records += len(chunk)
+            valid_records += len(chunk) - len(chunk_errors)
+            if validate_only or validation_errors:
+                # These records will never be returned, so let them go
+                validated_records.clear()
+            else:
+                validated_records.extend(chunk)
         
-        # Validate records
-        validated_records = self.validate_records(db, records)
+        if not total_records:
+            raise ActualsImportError("CSV file contains no data rows")
         
         # Check for validation errors
-        validation_errors = self.get_validation_errors(validated_records)
         if validation_errors:
             raise ActualsImportValidationError(validation_errors)
         
@@ -280,8 +452,8 @@ class ActualsImportService:
         if validate_only:
             return {
                 "status": "validated",
-                "total_records": len(records),
-                "valid_records": len([r for r in records if r.is_valid()]),
+                "total_records": total_records,
+                "valid_records": valid_records,
                 "invalid_records": len(validation_errors),
                 "errors": validation_errors
             }
@@ -290,13 +462,13 @@ class ActualsImportService:
         # For now, return the validated records
         return {
             "status": "ready_for_import",
-            "total_records": len(records),
-            "valid_records": len([r for r in records if r.is_valid()]),
+            "total_records": total_records,
+            "valid_records": valid_records,
             "records": validated_records
         }
 
 
-class LaborImportRecord:
+class LaborImportRecord(_ImportRecord):
     """Represents a single labor actuals import record.
 
     Either `percentage` (single-bucket) or the pair
@@ -304,6 +476,31 @@ class LaborImportRecord:
     depending on which form the CSV header declared.
     """
 
+    __slots__ = (
+        "project_id_str",
+        "external_worker_id",
+        "worker_name",
+        "actual_date_str",
+        "percentage_str",
+        "capital_percentage_str",
+        "expense_percentage_str",
+        "project_id",
+        "actual_date",
+        "percentage",
+        "capital_percentage",
+        "expense_percentage",
+    )
+
+    _REPORT_FIELDS = (
+        ("project_id", "project_id_str"),
+        ("external_worker_id", "external_worker_id"),
+        ("worker_name", "worker_name"),
+        ("date", "actual_date_str"),
+        ("percentage", "percentage_str"),
+        ("capital_percentage", "capital_percentage_str"),
+        ("expense_percentage", "expense_percentage_str"),
+    )
+
     def __init__(
         self,
         row_number: int,
@@ -315,7 +512,7 @@ class LaborImportRecord:
         capital_percentage: Optional[str] = None,
         expense_percentage: Optional[str] = None,
     ):
-        self.row_number = row_number
+        super().__init__(row_number)
         self.project_id_str = project_id
         self.external_worker_id = external_worker_id
         self.worker_name = worker_name
@@ -330,28 +527,9 @@ class LaborImportRecord:
         self.percentage: Optional[Decimal] = None
         self.capital_percentage: Optional[Decimal] = None
         self.expense_percentage: Optional[Decimal] = None
-        self.validation_errors: List[str] = []
 
-    def is_valid(self) -> bool:
-        """Check if the record passed validation."""
-        return len(self.validation_errors) == 0
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert record to dictionary for error reporting."""
-        return {
-            "row": self.row_number,
-            "project_id": self.project_id_str,
-            "external_worker_id": self.external_worker_id,
-            "worker_name": self.worker_name,
-            "date": self.actual_date_str,
-            "percentage": self.percentage_str,
-            "capital_percentage": self.capital_percentage_str,
-            "expense_percentage": self.expense_percentage_str,
-            "errors": self.validation_errors,
-        }
-
-
-class LaborActualsImportService:
+class LaborActualsImportService(_ImportService):
     """Service for importing labor actuals data from CSV files.
 
     Accepts either a single `percentage` column, or a split pair of
@@ -384,14 +562,10 @@ class LaborActualsImportService:
             ActualsImportError: If CSV format is invalid
         """
         try:
-            csv_file = StringIO(csv_content)
-            reader = csv.DictReader(csv_file)
+            columns, rows = _read_csv(csv_content)
 
             # Validate headers
-            if not reader.fieldnames:
-                raise ActualsImportError("CSV file is empty or has no headers")
-
-            fieldnames = set(reader.fieldnames)
+            fieldnames = set(columns)
 
             missing_columns = set(self.BASE_REQUIRED_COLUMNS) - fieldnames
             if missing_columns:
@@ -433,18 +607,33 @@ class LaborActualsImportService:
                     f"or incomplete columns: {', '.join(present)})"
                 )
 
+            project_col = columns["project_id"]
+            worker_id_col = columns["external_worker_id"]
+            worker_name_col = columns["worker_name"]
+            date_col = columns["date"]
+            percentage_col = columns.get("percentage")
+            capital_col = columns.get("capital_percentage")
+            expense_col = columns.get("expense_percentage")
+            row_columns = self.BASE_REQUIRED_COLUMNS + (
+                ["percentage"] if has_single
+                else ["capital_percentage", "expense_percentage"]
+            )
+            width = max(columns[name] for name in row_columns) + 1
+
             records = []
-            for row_num, row in enumerate(reader, start=2):  # Start at 2 (header is row 1)
+            for row_num, row in enumerate(rows, start=2):  # Start at 2 (header is row 1)
+                if len(row) < width:
+                    raise _short_row_error(row_num, row, columns, row_columns)
                 try:
                     record = LaborImportRecord(
                         row_number=row_num,
-                        project_id=row.get("project_id", "").strip(),
-                        external_worker_id=row.get("external_worker_id", "").strip(),
-                        worker_name=row.get("worker_name", "").strip(),
-                        actual_date=row.get("date", "").strip(),
-                        percentage=row.get("percentage", "").strip() if has_single else None,
-                        capital_percentage=row.get("capital_percentage", "").strip() if has_split else None,
-                        expense_percentage=row.get("expense_percentage", "").strip() if has_split else None,
+                        project_id=row[project_col].strip(),
+                        external_worker_id=row[worker_id_col].strip(),
+                        worker_name=row[worker_name_col].strip(),
+                        actual_date=row[date_col].strip(),
+                        percentage=row[percentage_col].strip() if has_single else None,
+                        capital_percentage=row[capital_col].strip() if has_split else None,
+                        expense_percentage=row[expense_col].strip() if has_split else None,
                     )
                     records.append(record)
                 except Exception as e:
@@ -458,75 +647,60 @@ class LaborActualsImportService:
         except csv.Error as e:
             raise ActualsImportError(f"CSV parsing error: {str(e)}")
 
-    def validate_records(
+    _load_lookups = staticmethod(_load_worker_lookups)
+
+    def _validate_record(
         self,
         db: Session,
-        records: List[LaborImportRecord]
-    ) -> List[LaborImportRecord]:
-        """
-        Validate all records for data integrity.
-
-        Args:
-            db: Database session
-            records: List of LaborImportRecord objects
-
-        Returns:
-            List of validated records (with validation_errors populated)
-        """
-        for record in records:
-            self._validate_record(db, record)
-
-        return records
-
-    def _validate_record(self, db: Session, record: LaborImportRecord) -> None:
+        record: LaborImportRecord,
+        project_ids: Set[UUID],
+        workers: Dict[str, Worker],
+    ) -> None:
         """Validate a single record."""
 
         # Validate project_id (UUID format and existence)
         if not record.project_id_str:
-            record.validation_errors.append("project_id is required")
+            record.add_error("project_id is required")
         else:
             try:
                 record.project_id = UUID(record.project_id_str)
                 # Check if project exists
-                project = project_repository.get(db, record.project_id)
-                if not project:
-                    record.validation_errors.append(
+                if record.project_id not in project_ids:
+                    record.add_error(
                         f"Project with ID {record.project_id} does not exist"
                     )
             except ValueError:
-                record.validation_errors.append(
+                record.add_error(
                     f"Invalid project_id format: {record.project_id_str}"
                 )
 
         # Validate external_worker_id
         if not record.external_worker_id:
-            record.validation_errors.append("external_worker_id is required")
+            record.add_error("external_worker_id is required")
         else:
             # Check if worker exists
-            worker = worker_repository.get_by_external_id(db, record.external_worker_id)
+            worker = workers.get(record.external_worker_id)
             if not worker:
-                record.validation_errors.append(
+                record.add_error(
                     f"Worker with external_id '{record.external_worker_id}' does not exist"
                 )
             elif record.worker_name and worker.name != record.worker_name:
-                record.validation_errors.append(
+                record.add_error(
                     f"Worker name mismatch: expected '{worker.name}', got '{record.worker_name}'"
                 )
 
         # Validate worker_name
         if not record.worker_name:
-            record.validation_errors.append("worker_name is required")
+            record.add_error("worker_name is required")
 
         # Validate date
         if not record.actual_date_str:
-            record.validation_errors.append("date is required")
+            record.add_error("date is required")
         else:
             try:
-                record.actual_date = datetime.strptime(
-                    record.actual_date_str, "%Y-%m-%d"
-                ).date()
+                record.actual_date = _parse_date(record.actual_date_str)
             except ValueError:
-                record.validation_errors.append(
+                record.add_error(
                     f"Invalid date format: {record.actual_date_str} (expected YYYY-MM-DD)"
                 )
 
@@ -540,93 +714,95 @@ class LaborActualsImportService:
     def _validate_single_percentage(self, record: LaborImportRecord) -> None:
         """Validate the single `percentage` column form."""
         if not record.percentage_str:
-            record.validation_errors.append("percentage is required")
+            record.add_error("percentage is required")
             return
         try:
             record.percentage = Decimal(record.percentage_str)
-            if record.percentage < Decimal('0.00'):
-                record.validation_errors.append(
+            if record.percentage < _ZERO:
+                record.add_error(
                     f"Percentage must be >= 0.0, got {record.percentage}"
                 )
-            elif record.percentage > Decimal('100.00'):
-                record.validation_errors.append(
+            elif record.percentage > _HUNDRED:
+                record.add_error(
                     f"Percentage must be <= 100.0, got {record.percentage}"
                 )
         except (InvalidOperation, ValueError):
-            record.validation_errors.append(
+            record.add_error(
                 f"Invalid percentage format: {record.percentage_str}"
             )
 
     def _validate_split_percentage(self, record: LaborImportRecord) -> None:
         """Validate the split `capital_percentage`/`expense_percentage` form."""
         if not record.capital_percentage_str:
-            record.validation_errors.append("capital_percentage is required")
+            record.add_error("capital_percentage is required")
         if not record.expense_percentage_str:
-            record.validation_errors.append("expense_percentage is required")
+            record.add_error("expense_percentage is required")
         if not record.capital_percentage_str or not record.expense_percentage_str:
             return
 
         try:
             record.capital_percentage = Decimal(record.capital_percentage_str)
         except (InvalidOperation, ValueError):
-            record.validation_errors.append(
+            record.add_error(
                 f"Invalid capital_percentage format: {record.capital_percentage_str}"
             )
         try:
             record.expense_percentage = Decimal(record.expense_percentage_str)
         except (InvalidOperation, ValueError):
-            record.validation_errors.append(
+            record.add_error(
                 f"Invalid expense_percentage format: {record.expense_percentage_str}"
             )
 
         if record.capital_percentage is None or record.expense_percentage is None:
             return
 
-        if record.capital_percentage < Decimal('0.00'):
-            record.validation_errors.append(
+        if record.capital_percentage < _ZERO:
+            record.add_error(
                 f"capital_percentage must be >= 0.0, got {record.capital_percentage}"
             )
-        if record.expense_percentage < Decimal('0.00'):
-            record.validation_errors.append(
+        if record.expense_percentage < _ZERO:
+            record.add_error(
                 f"expense_percentage must be >= 0.0, got {record.expense_percentage}"
             )
-        if record.capital_percentage > Decimal('100.00'):
-            record.validation_errors.append(
+        if record.capital_percentage > _HUNDRED:
+            record.add_error(
                 f"capital_percentage must be <= 100.0, got {record.capital_percentage}"
             )
-        if record.expense_percentage > Decimal('100.00'):
-            record.validation_errors.append(
+        if record.expense_percentage > _HUNDRED:
+            record.add_error(
                 f"expense_percentage must be <= 100.0, got {record.expense_percentage}"
             )
 
         total = record.capital_percentage + record.expense_percentage
-        if total > Decimal('100.00'):
-            record.validation_errors.append(
+        if total > _HUNDRED:
+            record.add_error(
                 f"capital_percentage + expense_percentage must be <= 100.0, got {total}"
             )
 
-    def get_validation_errors(
-        self,
-        records: List[LaborImportRecord]
-    ) -> List[Dict[str, Any]]:
-        """
-        Get all validation errors from records.
-
-        Args:
-            records: List of validated LaborImportRecord objects
 
-        Returns:
-            List of error dictionaries
-        """
-        errors = []
-        for record in records:
-            if not record.is_valid():
-                errors.append(record.to_dict())
-        return errors
+class NonLaborImportRecord(_ImportRecord):
+    """Represents a single non-labor actuals import record (dollar-based)."""
 
+    __slots__ = (
+        "project_id_str",
+        "resource_id_str",
+        "actual_date_str",
+        "capital_str",
+        "expense_str",
+        "project_id",
+        "resource_id",
+        "actual_date",
+        "capital",
+        "expense",
+    )
 
-class NonLaborImportRecord:
-    """Represents a single non-labor actuals import record (dollar-based)."""
+    _REPORT_FIELDS = (
+        ("project_id", "project_id_str"),
+        ("resource_id", "resource_id_str"),
+        ("date", "actual_date_str"),
+        ("capital", "capital_str"),
+        ("expense", "expense_str"),
+    )
 
     def __init__(
         self,
@@ -637,7 +813,7 @@ class NonLaborImportRecord:
         capital: str,
         expense: str,
     ):
-        self.row_number = row_number
+        super().__init__(row_number)
         self.project_id_str = project_id
         self.resource_id_str = resource_id
         self.actual_date_str = actual_date
@@ -650,26 +826,9 @@ class NonLaborImportRecord:
         self.actual_date: Optional[date] = None
         self.capital: Optional[Decimal] = None
         self.expense: Optional[Decimal] = None
-        self.validation_errors: List[str] = []
-
-    def is_valid(self) -> bool:
-        """Check if the record passed validation."""
-        return len(self.validation_errors) == 0
-
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert record to dictionary for error reporting."""
-        return {
-            "row": self.row_number,
-            "project_id": self.project_id_str,
-            "resource_id": self.resource_id_str,
-            "date": self.actual_date_str,
-            "capital": self.capital_str,
-            "expense": self.expense_str,
-            "errors": self.validation_errors,
-        }
 
 
-class NonLaborActualsImportService:
+class NonLaborActualsImportService(_ImportService):
     """Service for importing non-labor actuals data (dollar amounts) from
     CSV files.
 
@@ -712,14 +871,10 @@ class NonLaborActualsImportService:
             ActualsImportError: If CSV format is invalid
         """
         try:
-            csv_file = StringIO(csv_content)
-            reader = csv.DictReader(csv_file)
+            columns, rows = _read_csv(csv_content)
 
             # Validate headers
-            if not reader.fieldnames:
-                raise ActualsImportError("CSV file is empty or has no headers")
-
-            fieldnames = set(reader.fieldnames)
+            fieldnames = set(columns)
 
             missing_columns = set(self.REQUIRED_COLUMNS) - fieldnames
             if missing_columns:
@@ -738,16 +893,25 @@ class NonLaborActualsImportService:
                     "importer instead"
                 )
 
+            project_col = columns["project_id"]
+            resource_col = columns["resource_id"]
+            date_col = columns["date"]
+            capital_col = columns["capital"]
+            expense_col = columns["expense"]
+            width = max(columns[name] for name in self.REQUIRED_COLUMNS) + 1
+
             records = []
-            for row_num, row in enumerate(reader, start=2):  # Start at 2 (header is row 1)
+            for row_num, row in enumerate(rows, start=2):  # Start at 2 (header is row 1)
+                if len(row) < width:
+                    raise _short_row_error(row_num, row, columns, self.REQUIRED_COLUMNS)
                 try:
                     record = NonLaborImportRecord(
                         row_number=row_num,
-                        project_id=row.get("project_id", "").strip(),
-                        resource_id=row.get("resource_id", "").strip(),
-                        actual_date=row.get("date", "").strip(),
-                        capital=row.get("capital", "").strip(),
-                        expense=row.get("expense", "").strip(),
+                        project_id=row[project_col].strip(),
+                        resource_id=row[resource_col].strip(),
+                        actual_date=row[date_col].strip(),
+                        capital=row[capital_col].strip(),
+                        expense=row[expense_col].strip(),
                     )
                     records.append(record)
                 except Exception as e:
@@ -761,129 +925,105 @@ class NonLaborActualsImportService:
         except csv.Error as e:
             raise ActualsImportError(f"CSV parsing error: {str(e)}")
 
-    def validate_records(
+    def _load_lookups(
+        self, db: Session, records: List[NonLaborImportRecord]
+    ) -> Tuple[Set[UUID], Dict[UUID, Resource]]:
+        """Fetch the projects and resources referenced by the records."""
+        project_ids = project_repository.exists_many(
+            db, _parse_uuids(r.project_id_str for r in records if r.project_id_str)
+        )
+        resources = resource_repository.get_many(
+            db, _parse_uuids(r.resource_id_str for r in records if r.resource_id_str)
+        )
+        return project_ids, resources
+
+    def _validate_record(
         self,
         db: Session,
-        records: List[NonLaborImportRecord]
-    ) -> List[NonLaborImportRecord]:
-        """
-        Validate all records for data integrity.
-
-        Args:
-            db: Database session
-            records: List of NonLaborImportRecord objects
-
-        Returns:
-            List of validated records (with validation_errors populated)
-        """
-        for record in records:
-            self._validate_record(db, record)
-
-        return records
-
-    def _validate_record(self, db: Session, record: NonLaborImportRecord) -> None:
+        record: NonLaborImportRecord,
+        project_ids: Set[UUID],
+        resources: Dict[UUID, Resource],
+    ) -> None:
         """Validate a single record."""
 
         # Validate project_id (UUID format and existence)
         if not record.project_id_str:
-            record.validation_errors.append("project_id is required")
+            record.add_error("project_id is required")
         else:
             try:
                 record.project_id = UUID(record.project_id_str)
                 # Check if project exists
-                project = project_repository.get(db, record.project_id)
-                if not project:
-                    record.validation_errors.append(
+                if record.project_id not in project_ids:
+                    record.add_error(
                         f"Project with ID {record.project_id} does not exist"
                     )
             except ValueError:
-                record.validation_errors.append(
+                record.add_error(
                     f"Invalid project_id format: {record.project_id_str}"
                 )
 
         # Validate resource_id (UUID format, existence, and NON_LABOR type)
         if not record.resource_id_str:
-            record.validation_errors.append("resource_id is required")
+            record.add_error("resource_id is required")
         else:
             try:
                 record.resource_id = UUID(record.resource_id_str)
-                resource = resource_repository.get(db, record.resource_id)
+                resource = resources.get(record.resource_id)
                 if not resource:
-                    record.validation_errors.append(
+                    record.add_error(
                         f"Resource with ID {record.resource_id} does not exist"
                     )
                 elif resource.resource_type != ResourceType.NON_LABOR:
-                    record.validation_errors.append(
+                    record.add_error(
                         f"Resource with ID {record.resource_id} is not "
                         "non-labor"
                     )
             except ValueError:
-                record.validation_errors.append(
+                record.add_error(
                     f"Invalid resource_id format: {record.resource_id_str}"
                 )
 
         # Validate date
         if not record.actual_date_str:
-            record.validation_errors.append("date is required")
+            record.add_error("date is required")
         else:
             try:
-                record.actual_date = datetime.strptime(
-                    record.actual_date_str, "%Y-%m-%d"
-                ).date()
+                record.actual_date = _parse_date(record.actual_date_str)
             except ValueError:
-                record.validation_errors.append(
+                record.add_error(
                     f"Invalid date format: {record.actual_date_str} (expected YYYY-MM-DD)"
                 )
 
         # Validate capital
         if not record.capital_str:
-            record.validation_errors.append("capital is required")
+            record.add_error("capital is required")
         else:
             try:
                 record.capital = Decimal(record.capital_str)
-                if record.capital < Decimal('0.00'):
-                    record.validation_errors.append(
+                if record.capital < _ZERO:
+                    record.add_error(
                         f"capital must be >= 0, got {record.capital}"
                     )
             except (InvalidOperation, ValueError):
-                record.validation_errors.append(
+                record.add_error(
                     f"Invalid capital format: {record.capital_str}"
                 )
 
         # Validate expense
         if not record.expense_str:
-            record.validation_errors.append("expense is required")
+            record.add_error("expense is required")
         else:
             try:
                 record.expense = Decimal(record.expense_str)
-                if record.expense < Decimal('0.00'):
-                    record.validation_errors.append(
+                if record.expense < _ZERO:
+                    record.add_error(
                         f"expense must be >= 0, got {record.expense}"
                     )
             except (InvalidOperation, ValueError):
-                record.validation_errors.append(
+                record.add_error(
                     f"Invalid expense format: {record.expense_str}"
                 )
 
-    def get_validation_errors(
-        self,
-        records: List[NonLaborImportRecord]
-    ) -> List[Dict[str, Any]]:
-        """
-        Get all validation errors from records.
-
-        Args:
-            records: List of validated NonLaborImportRecord objects
-
-        Returns:
-            List of error dictionaries
-        """
-        errors = []
-        for record in records:
-            if not record.is_valid():
-                errors.append(record.to_dict())
-        return errors
-
 
 # Create service instances
 actuals_import_service = ActualsImportService()
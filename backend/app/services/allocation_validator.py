@@ -1,9 +1,14 @@
 """
 AllocationValidatorService for validating worker allocation limits.
+
+Every allocation lookup filters actuals by external_worker_id and actual_date
+and sums allocation_percentage; they rely on the ix_actuals_worker_date
+composite index for range access.
 """
+from dataclasses import dataclass
 from datetime import date
 from decimal import Decimal
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterable, Optional, Tuple
 from uuid import UUID
 
 from sqlalchemy.orm import Session
@@ -11,24 +16,20 @@ from sqlalchemy.orm import Session
 from app.repositories.actual import actual_repository
 
 
+# Daily allocation ceiling, built once at import time.
+MAX_ALLOCATION = Decimal('100.00')
+
+
+@dataclass(frozen=True, slots=True)
 class AllocationConflict:
     """Represents an allocation conflict for a worker on a specific date."""
     
-    def __init__(
-        self,
-        external_worker_id: str,
-        worker_name: str,
-        actual_date: date,
-        existing_allocation: Decimal,
-        new_allocation: Decimal,
-        total_allocation: Decimal
-    ):
-        self.external_worker_id = external_worker_id
-        self.worker_name = worker_name
-        self.actual_date = actual_date
-        self.existing_allocation = existing_allocation
-        self.new_allocation = new_allocation
-        self.total_allocation = total_allocation
+    external_worker_id: str
+    worker_name: str
+    actual_date: date
+    existing_allocation: Decimal
+    new_allocation: Decimal
+    total_allocation: Decimal
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert conflict to dictionary for reporting."""
@@ -39,14 +40,14 @@ class AllocationConflict:
             "existing_allocation": float(self.existing_allocation),
             "new_allocation": float(self.new_allocation),
             "total_allocation": float(self.total_allocation),
-            "excess": float(self.total_allocation - Decimal('100.00'))
+            "excess": float(self.total_allocation - MAX_ALLOCATION)
         }
 
 
 class AllocationValidatorService:
     """Service for validating worker allocation limits."""
     
-    MAX_ALLOCATION = Decimal('100.00')
+    MAX_ALLOCATION = MAX_ALLOCATION  # Shared instance; callers read it off the service
     
     def __init__(self):
         pass
@@ -103,6 +104,23 @@ class AllocationValidatorService:
             actual_date=actual_date
         )
     
+    def get_current_allocations_bulk(
+        self,
+        db: Session,
+        keys: Iterable[Tuple[str, date]]
+    ) -> Dict[Tuple[str, date], Decimal]:
+        """
+        Get the current total allocation for many worker-date pairs at once.
+        
+        Args:
+            db: Database session
+            keys: (external_worker_id, actual_date) pairs to look up
+            
+        Returns:
+            Dictionary mapping each pair to its total allocation percentage
+        """
+        return actual_repository.get_total_allocations_for_dates(db=db, keys=keys)
+    
     def validate_batch_actuals(
         self,
         db: Session,
@@ -128,27 +146,27 @@ class AllocationValidatorService:
         """
         conflicts = []
         
-        # Group actuals by worker and date
-        worker_date_allocations: Dict[tuple, List[Dict[str, Any]]] = {}
+        # Sum the batch per worker and date in one pass, keeping only the
+        # running total and the first row's worker name for each key
+        batch_allocations: Dict[Tuple[str, date], List[Any]] = {}
         for actual in actuals_data:
             key = (actual["external_worker_id"], actual["actual_date"])
-            if key not in worker_date_allocations:
-                worker_date_allocations[key] = []
-            worker_date_allocations[key].append(actual)
+            slot = batch_allocations.get(key)
+            if slot is None:
+                batch_allocations[key] = [actual["allocation_percentage"], actual["worker_name"]]
+            else:
+                slot[0] += actual["allocation_percentage"]
+        
+        # Get existing allocations for every worker-date combination at once
+        existing_allocations = self.get_current_allocations_bulk(
+            db=db,
+            keys=batch_allocations.keys()
+        )
         
         # Check each worker-date combination
-        for (external_worker_id, actual_date), batch_actuals in worker_date_allocations.items():
-            # Get existing allocation from database
-            existing_allocation = self.get_current_allocation(
-                db=db,
-                external_worker_id=external_worker_id,
-                actual_date=actual_date
-            )
-            
-            # Calculate new allocation from batch
-            new_allocation = sum(
-                actual["allocation_percentage"] for actual in batch_actuals
-            )
+        for key, (new_allocation, worker_name) in batch_allocations.items():
+            external_worker_id, actual_date = key
+            existing_allocation = existing_allocations[key]
             
             # Calculate total
             total_allocation = existing_allocation + new_allocation
@@ -157,7 +175,7 @@ class AllocationValidatorService:
             if total_allocation > self.MAX_ALLOCATION:
                 conflicts.append(AllocationConflict(
                     external_worker_id=external_worker_id,
-                    worker_name=batch_actuals[0]["worker_name"],
+                    worker_name=worker_name,
                     actual_date=actual_date,
                     existing_allocation=existing_allocation,
                     new_allocation=new_allocation,
@@ -185,24 +203,12 @@ class AllocationValidatorService:
         Returns:
             Dictionary mapping dates to total allocation percentages
         """
-        actuals = actual_repository.get_by_date_range(
+        return actual_repository.get_daily_totals(
             db=db,
+            external_worker_id=external_worker_id,
             start_date=start_date,
             end_date=end_date
         )
-        
-        # Filter by worker and group by date
-        worker_actuals = [
-            a for a in actuals if a.external_worker_id == external_worker_id
-        ]
-        
-        date_allocations: Dict[date, Decimal] = {}
-        for actual in worker_actuals:
-            if actual.actual_date not in date_allocations:
-                date_allocations[actual.actual_date] = Decimal('0.00')
-            date_allocations[actual.actual_date] += actual.allocation_percentage
-        
-        return date_allocations
     
     def find_over_allocated_dates(
         self,
@@ -223,23 +229,23 @@ class AllocationValidatorService:
         Returns:
             List of dictionaries with over-allocated dates and amounts
         """
-        date_allocations = self.check_cross_project_allocation(
+        # The database groups and filters, so only offending days come back.
+        rows = actual_repository.find_over_allocated_dates(
             db=db,
             external_worker_id=external_worker_id,
             start_date=start_date,
-            end_date=end_date
+            end_date=end_date,
+            max_allocation=self.MAX_ALLOCATION
         )
         
-        over_allocated = []
-        for actual_date, total_allocation in date_allocations.items():
-            if total_allocation > self.MAX_ALLOCATION:
-                over_allocated.append({
-                    "date": actual_date.isoformat(),
-                    "total_allocation": float(total_allocation),
-                    "excess": float(total_allocation - self.MAX_ALLOCATION)
-                })
-        
-        return over_allocated
+        return [
+            {
+                "date": actual_date.isoformat(),
+                "total_allocation": float(total_allocation),
+                "excess": float(excess)
+            }
+            for actual_date, total_allocation, excess in rows
+        ]
     
     def detect_conflicts_with_existing(
         self,
@@ -260,7 +266,8 @@ class AllocationValidatorService:
         Returns:
             AllocationConflict if conflict exists, None otherwise
         """
-        existing_allocation = self.get_current_allocation(
+        # One query returns the total and the worker name for the report
+        existing_allocation, worker_name = actual_repository.get_allocation_summary_for_date(
             db=db,
             external_worker_id=external_worker_id,
             actual_date=actual_date
@@ -269,17 +276,9 @@ class AllocationValidatorService:
         total_allocation = existing_allocation + new_allocation
         
         if total_allocation > self.MAX_ALLOCATION:
-            # Get worker name from existing actuals
-            existing_actuals = actual_repository.get_by_date(
-                db=db,
-                external_worker_id=external_worker_id,
-                actual_date=actual_date
-            )
-            worker_name = existing_actuals[0].worker_name if existing_actuals else "Unknown"
-            
             return AllocationConflict(
                 external_worker_id=external_worker_id,
-                worker_name=worker_name,
+                worker_name=worker_name or "Unknown",
                 actual_date=actual_date,
                 existing_allocation=existing_allocation,
                 new_allocation=new_allocation,
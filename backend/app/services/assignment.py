@@ -1,9 +1,10 @@
 """
 Assignment service for resource assignment business logic with allocation validation and scope filtering.
 """
+from dataclasses import dataclass
 from datetime import date
 from decimal import Decimal
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, FrozenSet, Iterable, Set, Tuple
 from uuid import UUID
 import csv
 import io
@@ -11,6 +12,7 @@ import io
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
+from app.models.project import Project
 from app.models.resource_assignment import ResourceAssignment
 from app.models.resource import Resource, ResourceType
 from app.models.user import ScopeType
@@ -20,6 +22,126 @@ from app.repositories.project import project_repository, project_phase_repositor
 from app.repositories.user import user_role_repository, scope_assignment_repository
 
 
+@dataclass(frozen=True)
+class _AssignmentScope:
+    """A user's active scope assignments, flattened across all of their roles."""
+    
+    is_global: bool
+    program_ids: FrozenSet[UUID]
+    project_ids: FrozenSet[UUID]
+
+
+_ZERO = Decimal('0')
+_HUNDRED = Decimal('100')
+
+# Columns import_assignments reads from each CSV row.
+_IMPORT_COLUMNS = (
+    "resource_id",
+    "project_id",
+    "assignment_date",
+    "capital_percentage",
+    "expense_percentage",
+)
+
+
+class AssignmentLookups:
+    """Reference data needed to validate a new assignment.
+
+    This default implementation queries the repositories on every call, which
+    is right for single assignments. CSV imports use PreloadedAssignmentLookups.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def resource(self, resource_id: UUID) -> Optional[Resource]:
+        return resource_repository.get(self.db, resource_id)
+
+    def project(self, project_id: UUID) -> Optional[Project]:
+        return project_repository.get(self.db, project_id)
+
+    def assignment_exists(
+        self,
+        resource_id: UUID,
+        project_id: UUID,
+        assignment_date: date,
+    ) -> bool:
+        return resource_assignment_repository.get_by_resource_project_date(
+            self.db, resource_id, project_id, assignment_date
+        ) is not None
+
+    def allocated_percentage(self, resource_id: UUID, assignment_date: date) -> Decimal:
+        """Total capital + expense already assigned to the resource on the date."""
+        return resource_assignment_repository.get_total_allocation_for_date(
+            self.db, resource_id, assignment_date
+        )
+
+    def record(self, assignment_data: Dict[str, Any]) -> None:
+        """Account for an accepted assignment that is not yet in the database."""
+
+
+class PreloadedAssignmentLookups(AssignmentLookups):
+    """Reference data for a whole CSV import, fetched with one query per kind.
+
+    Accepted rows are recorded as they are validated, so later rows in the same
+    file see them in the duplicate and daily allocation checks.
+    """
+
+    def __init__(self, db: Session, cells: Iterable[Tuple[UUID, UUID, date]]):
+        super().__init__(db)
+        cells = list(cells)
+        self.resources = resource_repository.get_many(
+            db, {resource_id for resource_id, _, _ in cells}
+        )
+        self.projects = project_repository.get_many(
+            db, {project_id for _, project_id, _ in cells}
+        )
+        self.cells: Set[Tuple[UUID, UUID, date]] = set()
+        self.allocated: Dict[Tuple[UUID, date], Decimal] = {}
+        for resource_id, project_id, assignment_date, total in (
+            resource_assignment_repository.get_allocation_cells(
+                db, {(resource_id, assignment_date) for resource_id, _, assignment_date in cells}
+            )
+        ):
+            self._add(resource_id, project_id, assignment_date, total)
+
+    def _add(
+        self,
+        resource_id: UUID,
+        project_id: UUID,
+        assignment_date: date,
+        total: Decimal,
+    ) -> None:
+        self.cells.add((resource_id, project_id, assignment_date))
+        key = (resource_id, assignment_date)
+        self.allocated[key] = self.allocated.get(key, _ZERO) + total
+
+    def resource(self, resource_id: UUID) -> Optional[Resource]:
+        return self.resources.get(resource_id)
+
+    def project(self, project_id: UUID) -> Optional[Project]:
+        return self.projects.get(project_id)
+
+    def assignment_exists(
+        self,
+        resource_id: UUID,
+        project_id: UUID,
+        assignment_date: date,
+    ) -> bool:
+        return (resource_id, project_id, assignment_date) in self.cells
+
+    def allocated_percentage(self, resource_id: UUID, assignment_date: date) -> Decimal:
+        return self.allocated.get((resource_id, assignment_date), _ZERO)
+
+    def record(self, assignment_data: Dict[str, Any]) -> None:
+        self._add(
+            assignment_data["resource_id"],
+            assignment_data["project_id"],
+            assignment_data["assignment_date"],
+            assignment_data["capital_percentage"] + assignment_data["expense_percentage"],
+        )
+
+
 class AssignmentService:
     """Service for resource assignment business logic with allocation validation and scope filtering."""
     
@@ -76,28 +198,34 @@ class AssignmentService:
         Returns:
             (is_valid, error_message) tuple
         """
-        # Get all assignments for this resource on this date
-        assignments = self.repository.get_by_date(db, resource_id, assignment_date)
-        
-        # Calculate current total (excluding the assignment being updated)
-        current_total = Decimal('0')
-        for assignment in assignments:
-            if exclude_assignment_id and assignment.id == exclude_assignment_id:
-                continue
-            current_total += assignment.capital_percentage + assignment.expense_percentage
+        # Sum the resource's other assignments on this date in the database
+        current_total = self.repository.get_total_allocation_for_date(
+            db, resource_id, assignment_date, exclude_id=exclude_assignment_id
+        )
         
-        # Calculate new allocation
+        error_msg = self._cross_project_allocation_error(
+            assignment_date, current_total, capital_percentage, expense_percentage
+        )
+        return (error_msg is None, error_msg)
+    
+    @staticmethod
+    def _cross_project_allocation_error(
+        assignment_date: date,
+        current_total: Decimal,
+        capital_percentage: Decimal,
+        expense_percentage: Decimal
+    ) -> Optional[str]:
+        """Return the over-allocation message, or None if the new total fits in 100%."""
         new_allocation = capital_percentage + expense_percentage
         new_total = current_total + new_allocation
         
-        if new_total > Decimal('100'):
-            return (False, 
-                    f'Assignment would exceed 100% allocation for resource on '
+        if new_total > _HUNDRED:
+            return (f'Assignment would exceed 100% allocation for resource on '
                     f'{assignment_date}. Current total across other projects: {current_total}%, '
                     f'This assignment: {new_allocation}%, '
                     f'Would result in: {new_total}%')
         
-        return (True, None)
+        return None
     
     def create_assignment(
         self,
@@ -127,8 +255,43 @@ class AssignmentService:
         Raises:
             ValueError: If validation fails
         """
+        assignment_data = self._build_assignment_data(
+            db,
+            resource_id=resource_id,
+            project_id=project_id,
+            assignment_date=assignment_date,
+            capital_percentage=capital_percentage,
+            expense_percentage=expense_percentage,
+            user_id=user_id,
+            scope=None,
+            lookups=AssignmentLookups(db),
+        )
+        
+        try:
+            return self.repository.create(db, obj_in=assignment_data)
+        except IntegrityError as error:
+            db.rollback()
+            if self._is_duplicate_assignment_error(error):
+                raise ValueError(
+                    self._duplicate_assignment_message(assignment_date)
+                ) from error
+            raise
+    
+    def _build_assignment_data(
+        self,
+        db: Session,
+        resource_id: UUID,
+        project_id: UUID,
+        assignment_date: date,
+        capital_percentage: Decimal,
+        expense_percentage: Decimal,
+        user_id: Optional[UUID],
+        scope: Optional[_AssignmentScope],
+        lookups: AssignmentLookups,
+    ) -> Dict[str, Any]:
+        """Validate a new assignment and return its column values."""
         # Validate resource exists
-        resource = self.resource_repository.get(db, resource_id)
+        resource = lookups.resource(resource_id)
         if not resource:
             raise ValueError(f"Resource with ID {resource_id} not found")
         if resource.resource_type != ResourceType.LABOR:
@@ -138,7 +301,7 @@ class AssignmentService:
             )
         
         # Validate project exists
-        project = self.project_repository.get(db, project_id)
+        project = lookups.project(project_id)
         if not project:
             raise ValueError(f"Project with ID {project_id} not found")
         
@@ -151,16 +314,12 @@ class AssignmentService:
 
         # Validate scope access if user_id provided
         if user_id:
-            if not self._can_access_project(db, user_id, project_id):
+            if scope is None:
+                scope = self._get_user_scope(db, user_id)
+            if not self._scope_allows(scope, project):
                 raise ValueError(f"User does not have access to project {project_id}")
 
-        existing_assignment = self.repository.get_by_resource_project_date(
-            db,
-            resource_id,
-            project_id,
-            assignment_date,
-        )
-        if existing_assignment:
+        if lookups.assignment_exists(resource_id, project_id, assignment_date):
             raise ValueError(self._duplicate_assignment_message(assignment_date))
         
         # Validate percentages are whole numbers (integers)
@@ -171,38 +330,29 @@ class AssignmentService:
         
         # Validate single assignment constraint (capital + expense <= 100)
         total = capital_percentage + expense_percentage
-        if total > Decimal('100'):
+        if total > _HUNDRED:
             raise ValueError(
                 f'Capital percentage + expense percentage cannot exceed 100% '
                 f'(got {total}%)'
             )
         
         # Validate cross-project allocation
-        is_valid, error_msg = self._validate_cross_project_allocation(
-            db, resource_id, assignment_date, 
-            capital_percentage, expense_percentage
+        error_msg = self._cross_project_allocation_error(
+            assignment_date,
+            lookups.allocated_percentage(resource_id, assignment_date),
+            capital_percentage,
+            expense_percentage
         )
-        if not is_valid:
+        if error_msg:
             raise ValueError(error_msg)
         
-        # Create assignment
-        assignment_data = {
+        return {
             "resource_id": resource_id,
             "project_id": project_id,
             "assignment_date": assignment_date,
             "capital_percentage": capital_percentage,
             "expense_percentage": expense_percentage
         }
-        
-        try:
-            return self.repository.create(db, obj_in=assignment_data)
-        except IntegrityError as error:
-            db.rollback()
-            if self._is_duplicate_assignment_error(error):
-                raise ValueError(
-                    self._duplicate_assignment_message(assignment_date)
-                ) from error
-            raise
     
     def get_assignment(self, db: Session, assignment_id: UUID) -> Optional[ResourceAssignment]:
         """Get assignment by ID."""
@@ -231,18 +381,22 @@ class AssignmentService:
         Returns:
             List of assignments
         """
-        if project_id:
-            assignments = self.repository.get_by_project(db, project_id)
-        elif resource_id:
-            assignments = self.repository.get_by_resource(db, resource_id)
-        else:
-            assignments = self.repository.get_multi(db, skip=0, limit=10000)
-        
-        # Apply scope-based filtering if user_id provided
+        # Restrict to the user's accessible projects in SQL so paging applies
+        # after scope filtering
+        project_ids = None
         if user_id:
-            assignments = self._filter_by_user_scope(db, assignments, user_id)
+            project_ids = self._get_accessible_project_ids(db, user_id)
+            if project_ids is not None and not project_ids:
+                return []
         
-        return assignments[skip:skip + limit]
+        return self.repository.get_page(
+            db,
+            skip=skip,
+            limit=limit,
+            project_id=project_id,
+            resource_id=resource_id,
+            project_ids=project_ids
+        )
     
     def get_assignments_by_project(
         self,
@@ -288,13 +442,12 @@ class AssignmentService:
         Returns:
             List of assignments
         """
-        assignments = self.repository.get_by_resource(db, resource_id)
-        
-        # Apply scope-based filtering if user_id provided
-        if user_id:
-            assignments = self._filter_by_user_scope(db, assignments, user_id)
+        # Apply scope-based filtering in SQL if user_id provided
+        project_ids = self._get_accessible_project_ids(db, user_id) if user_id else None
+        if project_ids is not None and not project_ids:
+            return []
         
-        return assignments
+        return self.repository.get_by_resource(db, resource_id, project_ids=project_ids)
     
     def get_assignments_by_date(
         self,
@@ -315,13 +468,14 @@ class AssignmentService:
         Returns:
             List of assignments
         """
-        assignments = self.repository.get_by_date(db, resource_id, assignment_date)
-        
-        # Apply scope-based filtering if user_id provided
-        if user_id:
-            assignments = self._filter_by_user_scope(db, assignments, user_id)
+        # Apply scope-based filtering in SQL if user_id provided
+        project_ids = self._get_accessible_project_ids(db, user_id) if user_id else None
+        if project_ids is not None and not project_ids:
+            return []
         
-        return assignments
+        return self.repository.get_by_date(
+            db, resource_id, assignment_date, project_ids=project_ids
+        )
     
     def update_assignment(
         self,
@@ -388,7 +542,7 @@ class AssignmentService:
         
         # Validate single assignment constraint (capital + expense <= 100)
         total = new_capital + new_expense
-        if total > Decimal('100'):
+        if total > _HUNDRED:
             raise ValueError(
                 f'Capital percentage + expense percentage cannot exceed 100% '
                 f'(got {total}%)'
@@ -471,6 +625,9 @@ class AssignmentService:
                 "failed": int,
                 "errors": List[Dict[str, Any]]
             }
+            
+        Raises:
+            ValueError: If the CSV header is missing a required column
         """
         results = {
             "total": 0,
@@ -479,44 +636,128 @@ class AssignmentService:
             "errors": []
         }
         
-        # Parse CSV
-        csv_file = io.StringIO(csv_content)
-        reader = csv.DictReader(csv_file)
+        # Resolve the importing user's scope once for every row
+        scope = self._get_user_scope(db, user_id) if user_id else None
+        
+        # Parse CSV by column position; rows are only turned into dicts for
+        # the error payload
+        reader = csv.reader(io.StringIO(csv_content))
+        header = next(reader, [])
+        columns = {name: index for index, name in enumerate(header)}
+        missing_columns = [name for name in _IMPORT_COLUMNS if name not in columns]
+        if missing_columns:
+            raise ValueError(f"Missing required columns: {', '.join(missing_columns)}")
+        resource_col, project_col, date_col, capital_col, expense_col = (
+            columns[name] for name in _IMPORT_COLUMNS
+        )
         
-        for row_num, row in enumerate(reader, start=2):  # Start at 2 to account for header
+        parsed_rows = []
+        row_num = 1  # Header is row 1
+        for row in reader:
+            if not row:
+                continue  # Skip blank lines, as DictReader does
+            row_num += 1
             results["total"] += 1
             
             try:
+                missing_values = [
+                    name for name in _IMPORT_COLUMNS if columns[name] >= len(row)
+                ]
+                if missing_values:
+                    raise ValueError(
+                        f"Missing values for columns: {', '.join(missing_values)}"
+                    )
                 # Parse row data
-                resource_id = UUID(row["resource_id"])
-                project_id = UUID(row["project_id"])
-                assignment_date = date.fromisoformat(row["assignment_date"])
-                capital_percentage = Decimal(row["capital_percentage"])
-                expense_percentage = Decimal(row["expense_percentage"])
-                
-                # Create assignment with validation
-                self.create_assignment(
-                    db,
-                    resource_id=resource_id,
-                    project_id=project_id,
-                    assignment_date=assignment_date,
-                    capital_percentage=capital_percentage,
-                    expense_percentage=expense_percentage,
-                    user_id=user_id
+                parsed_rows.append((row_num, row, {
+                    "resource_id": UUID(row[resource_col]),
+                    "project_id": UUID(row[project_col]),
+                    "assignment_date": date.fromisoformat(row[date_col]),
+                    "capital_percentage": Decimal(row[capital_col]),
+                    "expense_percentage": Decimal(row[expense_col]),
+                }))
+            except Exception as e:
+                results["errors"].append({
+                    "row": row_num,
+                    "data": dict(zip(header, row)),
+                    "error": str(e)
+                })
+        
+        # Fetch resources, projects, and existing allocations for the whole file
+        lookups = PreloadedAssignmentLookups(
+            db,
+            [
+                (values["resource_id"], values["project_id"], values["assignment_date"])
+                for _, _, values in parsed_rows
+            ],
+        )
+        
+        accepted = []
+        for row_num, row, values in parsed_rows:
+            try:
+                assignment_data = self._build_assignment_data(
+                    db, **values, user_id=user_id, scope=scope, lookups=lookups
                 )
-                
-                results["successful"] += 1
-                
             except Exception as e:
-                results["failed"] += 1
                 results["errors"].append({
                     "row": row_num,
-                    "data": row,
+                    "data": dict(zip(header, row)),
                     "error": str(e)
                 })
+                continue
+            lookups.record(assignment_data)
+            accepted.append((row_num, row, assignment_data))
+        
+        if accepted:
+            results["successful"] += self._insert_imported_assignments(
+                db, header, accepted, results["errors"]
+            )
         
+        results["errors"].sort(key=lambda error: error["row"])
+        results["failed"] = len(results["errors"])
         return results
     
+    def _insert_imported_assignments(
+        self,
+        db: Session,
+        header: List[str],
+        accepted: List[Tuple[int, List[str], Dict[str, Any]]],
+        errors: List[Dict[str, Any]]
+    ) -> int:
+        """
+        Insert validated import rows with one batched INSERT and commit.
+        
+        If another writer claimed one of the cells since validation, fall back
+        to row-by-row inserts so the other rows still import. Returns the
+        number of rows inserted; failures are appended to errors.
+        """
+        try:
+            self.repository.create_many_in_transaction(
+                db, objs_in=[assignment_data for _, _, assignment_data in accepted]
+            )
+            db.commit()
+            return len(accepted)
+        except IntegrityError:
+            db.rollback()
+        
+        inserted = 0
+        for row_num, row, assignment_data in accepted:
+            try:
+                self.repository.create(db, obj_in=assignment_data)
+                inserted += 1
+            except IntegrityError as error:
+                db.rollback()
+                message = str(error)
+                if self._is_duplicate_assignment_error(error):
+                    message = self._duplicate_assignment_message(
+                        assignment_data["assignment_date"]
+                    )
+                errors.append({
+                    "row": row_num,
+                    "data": dict(zip(header, row)),
+                    "error": message
+                })
+        return inserted
+    
     def check_allocation_conflicts(
         self,
         db: Session,
@@ -536,32 +777,20 @@ class AssignmentService:
         Returns:
             List of conflicts with date and total allocation
         """
-        conflicts = []
-        
-        # Get all assignments in date range
-        assignments = self.repository.get_by_date_range(
-            db, resource_id, start_date, end_date
-        )
-        
-        # Group by date and check totals
-        date_allocations = {}
-        for assignment in assignments:
-            assignment_date = assignment.assignment_date
-            if assignment_date not in date_allocations:
-                date_allocations[assignment_date] = Decimal('0')
-            date_allocations[assignment_date] += (assignment.capital_percentage + 
-                                                   assignment.expense_percentage)
-        
-        # Identify conflicts (>100%)
-        for assignment_date, total_allocation in date_allocations.items():
-            if total_allocation > Decimal('100'):
-                conflicts.append({
-                    "date": assignment_date,
-                    "total_allocation": total_allocation,
-                    "over_allocation": total_allocation - Decimal('100')
-                })
-        
-        return conflicts
+        # Sum and filter per day in the database so only conflicting days
+        # come back, rather than every assignment in the range
+        return [
+            {
+                "date": assignment_date,
+                "total_allocation": total_allocation,
+                "over_allocation": over_allocation
+            }
+            for assignment_date, total_allocation, over_allocation in (
+                self.repository.find_over_allocated_dates(
+                    db, resource_id, start_date, end_date, _HUNDRED
+                )
+            )
+        ]
     
     def bulk_update_assignments(
         self,
@@ -666,104 +895,94 @@ class AssignmentService:
         
         return results
     
-    def _can_access_project(self, db: Session, user_id: UUID, project_id: UUID) -> bool:
+    def _get_user_scope(self, db: Session, user_id: UUID) -> _AssignmentScope:
         """
-        Check if user has access to a project based on scope assignments.
+        Resolve a user's scope with one query for roles and one for their scopes.
         
         Args:
             db: Database session
             user_id: User ID
-            project_id: Project ID
             
         Returns:
-            True if user has access, False otherwise
+            _AssignmentScope covering every active role of the user
         """
-        # Get user's active roles
         user_roles = self.user_role_repository.get_active_roles_by_user(db, user_id)
-        if not user_roles:
-            return False
+        scope_assignments = self.scope_assignment_repository.get_active_by_user_role_ids(
+            db, [user_role.id for user_role in user_roles]
+        )
         
-        # Get project to check program
-        project = self.project_repository.get(db, project_id)
-        if not project:
-            return False
+        is_global = False
+        program_ids = set()
+        project_ids = set()
+        for scope in scope_assignments:
+            if scope.scope_type == ScopeType.GLOBAL:
+                is_global = True
+            elif scope.scope_type == ScopeType.PROGRAM and scope.program_id:
+                program_ids.add(scope.program_id)
+            elif scope.scope_type == ScopeType.PROJECT and scope.project_id:
+                project_ids.add(scope.project_id)
+        
+        return _AssignmentScope(
+            is_global=is_global,
+            program_ids=frozenset(program_ids),
+            project_ids=frozenset(project_ids),
+        )
+    
+    def _can_access_project(
+        self,
+        db: Session,
+        user_id: UUID,
+        project_id: UUID
+    ) -> bool:
+        """
+        Check if user has access to a project based on scope assignments.
         
-        # Check scope assignments
-        for user_role in user_roles:
-            scope_assignments = self.scope_assignment_repository.get_active_by_user_role(
-                db, user_role.id
-            )
+        Args:
+            db: Database session
+            user_id: User ID
+            project_id: Project ID
             
-            for scope in scope_assignments:
-                # Global scope grants access to everything
-                if scope.scope_type == ScopeType.GLOBAL:
-                    return True
-                
-                # Program scope grants access to all projects in the program
-                if scope.scope_type == ScopeType.PROGRAM and scope.program_id == project.program_id:
-                    return True
-                
-                # Project scope grants access to specific project
-                if scope.scope_type == ScopeType.PROJECT and scope.project_id == project_id:
-                    return True
-        
-        return False
+        Returns:
+            True if user has access, False otherwise
+        """
+        return self.scope_assignment_repository.user_can_access_project(
+            db, user_id, project_id
+        )
+    
+    @staticmethod
+    def _scope_allows(scope: _AssignmentScope, project: Project) -> bool:
+        """Check a resolved scope against an already-loaded project."""
+        # Global scope grants access to everything; program scope to all
+        # projects in the program; project scope to the specific project
+        return (
+            scope.is_global
+            or project.program_id in scope.program_ids
+            or project.id in scope.project_ids
+        )
     
-    def _filter_by_user_scope(
+    def _get_accessible_project_ids(
         self,
         db: Session,
-        assignments: List[ResourceAssignment],
         user_id: UUID
-    ) -> List[ResourceAssignment]:
+    ) -> Optional[Set[UUID]]:
         """
-        Filter assignments based on user's scope assignments.
+        Get the IDs of every project a user can access.
         
         Args:
             db: Database session
-            assignments: List of assignments to filter
-            user_id: User ID for scope checking
+            user_id: User ID
             
         Returns:
-            Filtered list of assignments
+            Set of project IDs, or None if the user has global scope
         """
-        # Get user's active roles
-        user_roles = self.user_role_repository.get_active_roles_by_user(db, user_id)
-        if not user_roles:
-            return []
-        
-        # Check for global scope (admin)
-        for user_role in user_roles:
-            scope_assignments = self.scope_assignment_repository.get_active_by_user_role(
-                db, user_role.id
-            )
-            for scope in scope_assignments:
-                if scope.scope_type == ScopeType.GLOBAL:
-                    return assignments  # Full access
-        
-        # Collect accessible project IDs
-        accessible_project_ids = set()
-        
-        for user_role in user_roles:
-            scope_assignments = self.scope_assignment_repository.get_active_by_user_role(
-                db, user_role.id
-            )
-            
-            for scope in scope_assignments:
-                if scope.scope_type == ScopeType.PROGRAM and scope.program_id:
-                    # Get all projects in the program
-                    projects = self.project_repository.get_by_program(db, scope.program_id)
-                    accessible_project_ids.update(p.id for p in projects)
-                
-                elif scope.scope_type == ScopeType.PROJECT and scope.project_id:
-                    accessible_project_ids.add(scope.project_id)
-        
-        # Filter assignments by accessible projects
-        filtered_assignments = [
-            assignment for assignment in assignments
-            if assignment.project_id in accessible_project_ids
-        ]
-        
-        return filtered_assignments
+        scope = self._get_user_scope(db, user_id)
+        if scope.is_global:
+            return None
+        
+        # Expand program scopes to their projects with one ID-only query
+        return self.project_repository.get_ids_by_programs(
+            db, scope.program_ids
+        ) | scope.project_ids
 
 
 # Create service instance
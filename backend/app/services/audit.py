@@ -1,8 +1,9 @@
 """
 Audit service for tracking data modifications and permission changes.
 """
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Tuple, Type
 from uuid import UUID
 
 from sqlalchemy.orm import Session
@@ -13,6 +14,33 @@ from app.models.base import BaseModel
 from app.repositories.audit import audit_log_repository
 
 
+# Entity types whose audit logs record permission and role changes.
+PERMISSION_ENTITY_TYPES = ("Permission", "UserRole", "ScopeAssignment")
+
+# Column attribute keys per model class; mappers don't change after startup.
+_COLUMN_KEYS: Dict[Type[BaseModel], Tuple[str, ...]] = {}
+
+_MISSING = object()
+
+# Converters for the common column value types, looked up by exact type.
+_CONVERTERS = {
+    UUID: str,
+    datetime: datetime.isoformat,
+    date: date.isoformat,
+}
+
+# Column value types stored as-is.
+_PLAIN_TYPES = frozenset({type(None), str, int, float, bool, Decimal})
+
+
+def _column_keys(model: Type[BaseModel]) -> Tuple[str, ...]:
+    """Get a model's column attribute keys, inspecting the mapper only once."""
+    keys = _COLUMN_KEYS.get(model)
+    if keys is None:
+        keys = _COLUMN_KEYS[model] = tuple(column.key for column in inspect(model).columns)
+    return keys
+
+
 class AuditService:
     """Service for creating and querying audit logs."""
     
@@ -29,26 +57,31 @@ class AuditService:
         Returns:
             Dictionary of column names to values
         """
-        from datetime import date
-        
         values = {}
-        mapper = inspect(obj.__class__)
-        
-        for column in mapper.columns:
-            value = getattr(obj, column.key, None)
+        loaded = obj.__dict__
+        
+        for key in _column_keys(obj.__class__):
+            # Read loaded values directly; expired or deferred ones go
+            # through the attribute so they are loaded
+            value = loaded.get(key, _MISSING)
+            if value is _MISSING:
+                value = getattr(obj, key, None)
             
-            # Convert non-serializable types
-            if isinstance(value, UUID):
-                value = str(value)
-            elif isinstance(value, datetime):
-                value = value.isoformat()
-            elif isinstance(value, date):
-                value = value.isoformat()
-            elif hasattr(value, '__dict__'):
-                # Skip complex objects
-                continue
+            # Convert non-serializable types; subclasses and anything else
+            # take the general isinstance checks
+            converter = _CONVERTERS.get(type(value))
+            if converter is not None:
+                value = converter(value)
+            elif type(value) not in _PLAIN_TYPES:
+                if isinstance(value, UUID):
+                    value = str(value)
+                elif isinstance(value, (datetime, date)):
+                    value = value.isoformat()
+                elif hasattr(value, '__dict__'):
+                    # Skip complex objects
+                    continue
             
-            values[column.key] = value
+            values[key] = value
         
         return values
     
@@ -239,15 +272,7 @@ class AuditService:
         Returns:
             List of AuditLog entries
         """
-        if entity_type:
-            logs = self.audit_repo.get_by_operation(db, entity_type)
-        else:
-            logs = self.audit_repo.get_all(db)
-        
-        # Sort by created_at descending
-        logs.sort(key=lambda x: x.created_at, reverse=True)
-        
-        return logs[:limit]
+        return self.audit_repo.get_recent(db, entity_type=entity_type, limit=limit)
     
     def get_changes_by_date_range(
         self,
@@ -292,22 +317,12 @@ class AuditService:
         Returns:
             List of AuditLog entries for permission changes
         """
-        # Get all permission-related logs
-        permission_logs = [
-            log for log in self.audit_repo.get_all(db)
-            if log.entity_type in ["Permission", "UserRole", "ScopeAssignment"]
-        ]
-        
-        if target_user_id:
-            permission_logs = [
-                log for log in permission_logs
-                if log.entity_id == target_user_id
-            ]
-        
-        # Sort by created_at descending
-        permission_logs.sort(key=lambda x: x.created_at, reverse=True)
-        
-        return permission_logs[:limit]
+        return self.audit_repo.get_recent_by_entity_types(
+            db,
+            PERMISSION_ENTITY_TYPES,
+            entity_id=target_user_id,
+            limit=limit
+        )
     
     def get_field_changes(
         self,
@@ -426,36 +441,32 @@ class AuditService:
         Returns:
             Dictionary with summary statistics
         """
-        # Get logs based on filters
-        if start_date and end_date:
-            logs = self.get_changes_by_date_range(db, start_date, end_date, entity_type)
-        elif entity_type:
-            logs = [log for log in self.audit_repo.get_all(db) if log.entity_type == entity_type]
-        else:
-            logs = self.audit_repo.get_all(db)
-        
-        # Calculate statistics
-        total_changes = len(logs)
-        creates = sum(1 for log in logs if log.operation == "CREATE")
-        updates = sum(1 for log in logs if log.operation == "UPDATE")
-        deletes = sum(1 for log in logs if log.operation == "DELETE")
+        # The date range only applies when both ends are given
+        has_range = bool(start_date and end_date)
         
-        # Count by entity type
+        # Count in the database, then fold the (operation, entity type, user)
+        # groups into the per-dimension totals
+        operation_counts = {}
         entity_counts = {}
-        for log in logs:
-            entity_counts[log.entity_type] = entity_counts.get(log.entity_type, 0) + 1
-        
-        # Count by user
         user_counts = {}
-        for log in logs:
-            user_id_str = str(log.user_id)
-            user_counts[user_id_str] = user_counts.get(user_id_str, 0) + 1
+        for operation, log_entity_type, user_id, count in (
+            self.audit_repo.count_by_operation_entity_user(
+                db,
+                entity_type=entity_type,
+                start_date=start_date if has_range else None,
+                end_date=end_date if has_range else None
+            )
+        ):
+            operation_counts[operation] = operation_counts.get(operation, 0) + count
+            entity_counts[log_entity_type] = entity_counts.get(log_entity_type, 0) + count
+            user_id_str = str(user_id)
+            user_counts[user_id_str] = user_counts.get(user_id_str, 0) + count
         
         return {
-            "total_changes": total_changes,
-            "creates": creates,
-            "updates": updates,
-            "deletes": deletes,
+            "total_changes": sum(operation_counts.values()),
+            "creates": operation_counts.get("CREATE", 0),
+            "updates": operation_counts.get("UPDATE", 0),
+            "deletes": operation_counts.get("DELETE", 0),
             "by_entity_type": entity_counts,
             "by_user": user_counts,
             "date_range": {
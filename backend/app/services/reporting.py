@@ -431,6 +431,12 @@ class ReportingService:
             end_date=end_date
         )
         
+        # Periods are contiguous and ascending, so walk the date-sorted actuals
+        # once instead of rescanning the whole list for every period
+        actuals = sorted(actuals, key=lambda a: a.actual_date)
+        actual_count = len(actuals)
+        next_actual = 0
+        
         # Group actuals by interval
         time_series = []
         current_date = start_date
@@ -458,14 +464,17 @@ class ReportingService:
                 period_end = end_date
             
             # Get actuals for this period
-            period_actuals = [
-                a for a in actuals
-                if current_date <= a.actual_date <= period_end
-            ]
-            
-            total_cost = sum(a.actual_cost for a in period_actuals)
-            capital_cost = sum(a.capital_amount for a in period_actuals)
-            expense_cost = sum(a.expense_amount for a in period_actuals)
+            while next_actual < actual_count and actuals[next_actual].actual_date < current_date:
+                next_actual += 1
+            period_start_index = next_actual
+            total_cost = capital_cost = expense_cost = 0
+            while next_actual < actual_count and actuals[next_actual].actual_date <= period_end:
+                actual = actuals[next_actual]
+                total_cost += actual.actual_cost
+                capital_cost += actual.capital_amount
+                expense_cost += actual.expense_amount
+                next_actual += 1
+            period_actuals_count = next_actual - period_start_index
             
             time_series.append({
                 "period_start": current_date.isoformat(),
@@ -473,7 +482,7 @@ class ReportingService:
                 "total_cost": float(total_cost),
                 "capital_cost": float(capital_cost),
                 "expense_cost": float(expense_cost),
-                "actuals_count": len(period_actuals)
+                "actuals_count": period_actuals_count
             })
             
             current_date = next_date
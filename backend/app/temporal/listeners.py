@@ -156,6 +156,10 @@ def _clear(session: OrmSession, previous_transaction=None) -> None:
         False,
     ):
         return
+    # after_commit also fires when a SAVEPOINT is released; the revision
+    # transaction only ends with the outermost commit.
+    if previous_transaction is None and session.in_nested_transaction():
+        return
     session.info.pop(TRANSACTION_KEY, None)
 
 
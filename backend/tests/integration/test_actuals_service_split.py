@@ -21,7 +21,7 @@ from app.models.resource import Resource, ResourceRole, ResourceType, Worker, Wo
 from app.models.resource_assignment import ResourceAssignment
 from app.models.rate import Rate
 
-from app.services.actuals import actuals_service
+from app.services.actuals import PreloadedActualsLookups, actuals_service
 from app.core.exceptions import BusinessRuleViolationError
 
 
@@ -222,3 +222,99 @@ def test_nonlabor_create_rejects_labor_resource(db_session, labor_setup):
         actuals_service.create_nonlabor_actual(
             db=db_session, project_id=ctx.project.id, resource_id=ctx.resource.id,
             actual_date=date(2026, 3, 3), capital_amount=Decimal("400"), expense_amount=Decimal("100"))
+
+
+def test_preloaded_lookups_cost_like_direct_queries(db_session, labor_setup):
+    ctx = labor_setup
+    lookups = PreloadedActualsLookups(
+        db_session,
+        project_ids={ctx.project.id},
+        external_worker_ids={ctx.worker.external_id},
+    )
+    assert lookups.active_rate(ctx.worker.worker_type_id, date(2025, 12, 31)) is None
+
+    actual = actuals_service.create_actual(
+        db=db_session, project_id=ctx.project.id,
+        external_worker_id=ctx.worker.external_id, worker_name=ctx.worker.name,
+        actual_date=ctx.assignment.assignment_date,
+        allocation_percentage=Decimal("50.00"), validate_allocation=False,
+        lookups=lookups)
+    assert actual.resource_id == ctx.resource.id
+    assert actual.capital_amount == Decimal("150.00")
+    assert actual.expense_amount == Decimal("100.00")
+
+
+def test_labor_batch_costs_both_forms_and_inserts_in_order(db_session, labor_setup):
+    ctx = labor_setup
+    common = dict(
+        project_id=ctx.project.id,
+        external_worker_id=ctx.worker.external_id,
+        worker_name=ctx.worker.name,
+        actual_date=ctx.assignment.assignment_date,
+        row_number=2,
+    )
+    records = [
+        SimpleNamespace(**common, percentage=Decimal("50.00"),
+                        capital_percentage=None, expense_percentage=None,
+                        validation_errors=[], is_valid=lambda: True),
+        SimpleNamespace(**common, percentage=None,
+                        capital_percentage=Decimal("10.00"),
+                        expense_percentage=Decimal("20.00"),
+                        validation_errors=[], is_valid=lambda: True),
+    ]
+
+    result = actuals_service.import_labor_batch(db_session, records, return_objects=True)
+
+    planned, split = result["actuals"]
+    assert (planned.capital_amount, planned.expense_amount) == (Decimal("150.00"), Decimal("100.00"))
+    assert (split.capital_amount, split.expense_amount) == (Decimal("50.00"), Decimal("100.00"))
+    assert {a.import_batch_id for a in result["actuals"]} == {result["batch"].id}
+    assert result["actual_ids"] == [planned.id, split.id]
+
+
+def test_labor_batch_returns_only_ids_by_default(db_session, labor_setup):
+    ctx = labor_setup
+    record = SimpleNamespace(
+        project_id=ctx.project.id,
+        external_worker_id=ctx.worker.external_id,
+        worker_name=ctx.worker.name,
+        actual_date=ctx.assignment.assignment_date,
+        row_number=2,
+        percentage=Decimal("50.00"),
+        capital_percentage=None,
+        expense_percentage=None,
+        validation_errors=[],
+        is_valid=lambda: True,
+    )
+
+    result = actuals_service.import_labor_batch(db_session, [record])
+
+    assert "actuals" not in result
+    assert result["imported_count"] == 1
+    assert len(result["actual_ids"]) == 1
+
+
+def test_update_actual_with_unchanged_percentage_skips_recalc(
+    db_session, labor_setup, monkeypatch,
+):
+    ctx = labor_setup
+    actual = actuals_service.create_actual(
+        db=db_session, project_id=ctx.project.id,
+        external_worker_id=ctx.worker.external_id, worker_name=ctx.worker.name,
+        actual_date=ctx.assignment.assignment_date,
+        allocation_percentage=Decimal("50.00"), validate_allocation=False)
+
+    def fail_recalc(*args, **kwargs):
+        raise AssertionError("cost should not be recalculated")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(actuals_service, "_calculate_cost", fail_recalc)
+        unchanged = actuals_service.update_actual(
+            db_session, actual.id, allocation_percentage=Decimal("50.00"))
+    assert unchanged.actual_cost == Decimal("250.00")
+
+    updated = actuals_service.update_actual(
+        db_session, actual.id, allocation_percentage=Decimal("100.00"),
+        validate_allocation=False)
+    assert updated.actual_cost == Decimal("500.00")
+    assert (updated.capital_amount, updated.expense_amount) == (Decimal("300.00"), Decimal("200.00"))
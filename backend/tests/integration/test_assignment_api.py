@@ -391,6 +391,31 @@ class TestAssignmentAPICrossProjectValidation:
 
 
 
+class TestAssignmentImportAPI:
+    """Test the assignment CSV import endpoint."""
+    
+    @pytest.fixture(autouse=True)
+    def _override_auth(self, override_auth_dependency):
+        """Use auth override for this test class."""
+        pass
+    
+    def test_import_missing_column_returns_400(self, client: TestClient):
+        """Test that a CSV header missing a required column is rejected."""
+        csv_content = (
+            "resource_id,project_id,assignment_date,capital_percentage\n"
+            f"{uuid4()},{uuid4()},2024-03-15,60.00\n"
+        )
+        
+        response = client.post(
+            "/api/v1/assignments/import",
+            files={"file": ("assignments.csv", csv_content, "text/csv")},
+            headers={"Authorization": "Bearer fake-token"}
+        )
+        
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Missing required columns: expense_percentage"
+
+
 class TestAssignmentAPI:
     """Test Assignment API endpoints."""
     
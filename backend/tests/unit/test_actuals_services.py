@@ -5,6 +5,7 @@ import pytest
 from datetime import date
 from decimal import Decimal
 from io import StringIO
+from uuid import uuid4
 
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
@@ -32,6 +33,25 @@ engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
+def _add_actuals(db, rows):
+    """Add and commit one actual per (external_worker_id, actual_date, allocation) row."""
+    db.add_all([
+        Actual(
+            project_id=uuid4(),
+            resource_id=uuid4(),
+            external_worker_id=external_worker_id,
+            worker_name="John Smith",
+            actual_date=actual_date,
+            allocation_percentage=allocation,
+            actual_cost=Decimal('100.00'),
+            capital_amount=Decimal('50.00'),
+            expense_amount=Decimal('50.00')
+        )
+        for external_worker_id, actual_date, allocation in rows
+    ])
+    db.commit()
+
+
 @pytest.fixture(scope="function")
 def db():
     """Create test database for each test."""
@@ -160,6 +180,16 @@ class TestActualsImportService:
         with pytest.raises(ActualsImportError, match="Missing required columns"):
             actuals_import_service.parse_csv(csv_content)
     
+    def test_parse_csv_short_row(self, db):
+        """Test parsing CSV with a row shorter than the header."""
+        csv_content = """project_id,external_worker_id,worker_name,date,percentage
+123,EMP001,John Smith"""
+        
+        with pytest.raises(
+            ActualsImportError, match="row 2: missing values for columns: date, percentage"
+        ):
+            actuals_import_service.parse_csv(csv_content)
+    
     def test_parse_csv_empty(self, db):
         """Test parsing empty CSV."""
         csv_content = ""
@@ -167,6 +197,19 @@ class TestActualsImportService:
         with pytest.raises(ActualsImportError, match="empty"):
             actuals_import_service.parse_csv(csv_content)
     
+    def test_import_actuals_collects_errors_across_chunks(self, db, monkeypatch):
+        """Test that streamed validation reports every invalid row."""
+        monkeypatch.setattr("app.services.actuals_import.IMPORT_CHUNK_SIZE", 2)
+        csv_content = """project_id,external_worker_id,worker_name,date,percentage
+not-a-uuid,EMP001,John Smith,2024-01-15,75.0
+not-a-uuid,EMP001,John Smith,2024-01-16,50.0
+not-a-uuid,EMP001,John Smith,2024-01-17,50.0"""
+        
+        with pytest.raises(ActualsImportValidationError) as exc_info:
+            actuals_import_service.import_actuals(db, csv_content, validate_only=True)
+        
+        assert [error["row"] for error in exc_info.value.errors] == [2, 3, 4]
+    
     def test_validate_records_valid(self, db, sample_project, sample_worker):
         """Test validating valid records."""
         csv_content = f"""project_id,external_worker_id,worker_name,date,percentage
@@ -343,6 +386,105 @@ class TestAllocationValidatorService:
         assert conflicts[0].external_worker_id == "EMP001"
         assert conflicts[0].total_allocation == Decimal('110.00')
 
+    def test_get_current_allocations_bulk(self, db):
+        """Test fetching totals for several worker-date pairs in one call."""
+        _add_actuals(db, [
+            ("EMP001", date(2024, 1, 15), Decimal('30.00')),
+            ("EMP001", date(2024, 1, 15), Decimal('40.00')),
+            ("EMP001", date(2024, 1, 16), Decimal('25.00')),
+            ("EMP002", date(2024, 1, 15), Decimal('80.00')),
+        ])
+        
+        totals = allocation_validator_service.get_current_allocations_bulk(
+            db=db,
+            keys=[("EMP001", date(2024, 1, 15)), ("EMP002", date(2024, 1, 16))]
+        )
+        
+        assert totals == {
+            ("EMP001", date(2024, 1, 15)): Decimal('70.00'),
+            ("EMP002", date(2024, 1, 16)): Decimal('0.00'),
+        }
+
+    def test_get_current_allocations_bulk_across_chunks(self, db, monkeypatch):
+        """Test that totals are merged when the lookup is split into chunks."""
+        monkeypatch.setattr("app.repositories.actual.ALLOCATION_LOOKUP_CHUNK_SIZE", 2)
+        _add_actuals(db, [
+            (f"EMP00{day}", date(2024, 1, day), Decimal('10.00') * day)
+            for day in range(1, 6)
+        ])
+        
+        keys = [(f"EMP00{day}", date(2024, 1, day)) for day in range(1, 6)]
+        totals = allocation_validator_service.get_current_allocations_bulk(db=db, keys=keys)
+        
+        assert totals == {key: Decimal('10.00') * day for day, key in enumerate(keys, 1)}
+
+    def test_find_over_allocated_dates(self, db):
+        """Test that only days summing above 100% inside the range are reported."""
+        _add_actuals(db, [
+            ("EMP001", date(2024, 1, 15), Decimal('60.00')),
+            ("EMP001", date(2024, 1, 15), Decimal('60.00')),
+            ("EMP001", date(2024, 1, 16), Decimal('100.00')),
+            ("EMP001", date(2024, 2, 1), Decimal('60.00')),
+            ("EMP001", date(2024, 2, 1), Decimal('60.00')),
+            ("EMP002", date(2024, 1, 16), Decimal('60.00')),
+            ("EMP002", date(2024, 1, 16), Decimal('60.00')),
+        ])
+        
+        over_allocated = allocation_validator_service.find_over_allocated_dates(
+            db=db,
+            external_worker_id="EMP001",
+            start_date=date(2024, 1, 1),
+            end_date=date(2024, 1, 31)
+        )
+        
+        assert over_allocated == [
+            {"date": "2024-01-15", "total_allocation": 120.0, "excess": 20.0},
+        ]
+
+    def test_check_cross_project_allocation(self, db):
+        """Test per-day totals for one worker across projects within a range."""
+        _add_actuals(db, [
+            ("EMP001", date(2024, 1, 15), Decimal('30.00')),
+            ("EMP001", date(2024, 1, 15), Decimal('45.00')),
+            ("EMP001", date(2024, 1, 16), Decimal('20.00')),
+            ("EMP001", date(2024, 2, 1), Decimal('50.00')),
+            ("EMP002", date(2024, 1, 15), Decimal('90.00')),
+        ])
+        
+        date_allocations = allocation_validator_service.check_cross_project_allocation(
+            db=db,
+            external_worker_id="EMP001",
+            start_date=date(2024, 1, 1),
+            end_date=date(2024, 1, 31)
+        )
+        
+        assert date_allocations == {
+            date(2024, 1, 15): Decimal('75.00'),
+            date(2024, 1, 16): Decimal('20.00'),
+        }
+
+    def test_detect_conflicts_with_existing(self, db):
+        """Test that a conflict reports the existing total and worker name."""
+        _add_actuals(db, [("EMP001", date(2024, 1, 15), Decimal('70.00'))])
+        
+        conflict = allocation_validator_service.detect_conflicts_with_existing(
+            db=db,
+            external_worker_id="EMP001",
+            actual_date=date(2024, 1, 15),
+            new_allocation=Decimal('40.00')
+        )
+        no_conflict = allocation_validator_service.detect_conflicts_with_existing(
+            db=db,
+            external_worker_id="EMP001",
+            actual_date=date(2024, 1, 16),
+            new_allocation=Decimal('100.00')
+        )
+        
+        assert conflict.worker_name == "John Smith"
+        assert conflict.existing_allocation == Decimal('70.00')
+        assert conflict.total_allocation == Decimal('110.00')
+        assert no_conflict is None
+
 
 class TestActualsService:
     """Test ActualsService."""
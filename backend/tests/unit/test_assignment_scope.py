@@ -0,0 +1,233 @@
+"""
+Unit tests for AssignmentService scope resolution and filtering.
+"""
+from datetime import date, timedelta
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+import app.models  # noqa: F401 - registers every relationship/table
+from app.models.base import Base
+from app.models.portfolio import Portfolio
+from app.models.program import Program
+from app.models.project import Project
+from app.models.resource import Resource, ResourceRole, ResourceType, Worker, WorkerType
+from app.models.resource_assignment import ResourceAssignment
+from app.models.user import User, UserRole, ScopeAssignment, RoleType, ScopeType
+from app.services.assignment import assignment_service
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine, autoflush=False)()
+    yield session
+    session.close()
+
+
+def _make_program(db, name):
+    portfolio = Portfolio(
+        name=f"Portfolio {name}",
+        description="Test portfolio",
+        owner="owner",
+        reporting_start_date=date(2024, 1, 1),
+        reporting_end_date=date(2024, 12, 31),
+    )
+    db.add(portfolio)
+    db.flush()
+    program = Program(
+        portfolio_id=portfolio.id,
+        name=name,
+        business_sponsor="sponsor",
+        program_manager="manager",
+        technical_lead="lead",
+        start_date=date(2024, 1, 1),
+        end_date=date(2024, 12, 31),
+    )
+    db.add(program)
+    db.flush()
+    return program
+
+
+def _make_project(db, program, cost_center_code):
+    project = Project(
+        program_id=program.id,
+        name=cost_center_code,
+        business_sponsor="sponsor",
+        project_manager="manager",
+        technical_lead="lead",
+        start_date=date(2024, 1, 1),
+        end_date=date(2024, 12, 31),
+        cost_center_code=cost_center_code,
+    )
+    db.add(project)
+    db.flush()
+    return project
+
+
+def _make_user(db, username, *scopes):
+    """Create a user with one active role per (scope_type, program, project) scope."""
+    user = User(username=username, email=f"{username}@test.com", password_hash="hash")
+    db.add(user)
+    db.flush()
+    for scope_type, program_id, project_id in scopes:
+        user_role = UserRole(user_id=user.id, role_type=RoleType.VIEWER, is_active=True)
+        db.add(user_role)
+        db.flush()
+        db.add(ScopeAssignment(
+            user_role_id=user_role.id,
+            scope_type=scope_type,
+            program_id=program_id,
+            project_id=project_id,
+            is_active=True,
+        ))
+    db.flush()
+    return user
+
+
+def _make_resource(db, name):
+    worker_type = WorkerType(type=f"{name} type", description="Employee")
+    role = ResourceRole(name=f"{name} role", description="Developer")
+    db.add_all([worker_type, role])
+    db.flush()
+    worker = Worker(
+        worker_type_id=worker_type.id,
+        external_id=name,
+        name=name,
+        cost_center_code=f"{name}-CC",
+    )
+    db.add(worker)
+    db.flush()
+    resource = Resource(
+        name=name,
+        resource_type=ResourceType.LABOR,
+        worker_id=worker.id,
+        resource_role_id=role.id,
+    )
+    db.add(resource)
+    db.flush()
+    return resource
+
+
+def _assign(db, resource, project, assignment_date):
+    db.add(ResourceAssignment(
+        resource_id=resource.id,
+        project_id=project.id,
+        assignment_date=assignment_date,
+        capital_percentage=Decimal("10"),
+        expense_percentage=Decimal("0"),
+    ))
+    db.flush()
+
+
+@pytest.fixture
+def projects(db):
+    program_a = _make_program(db, "Program A")
+    program_b = _make_program(db, "Program B")
+    return SimpleNamespace(
+        program_a=program_a,
+        in_a=_make_project(db, program_a, "CC-A1"),
+        in_b=_make_project(db, program_b, "CC-B1"),
+        other_in_b=_make_project(db, program_b, "CC-B2"),
+    )
+
+
+def test_scope_is_flattened_across_roles(db, projects):
+    user = _make_user(
+        db,
+        "mixed",
+        (ScopeType.PROGRAM, projects.program_a.id, None),
+        (ScopeType.PROJECT, None, projects.in_b.id),
+    )
+
+    scope = assignment_service._get_user_scope(db, user.id)
+
+    assert scope.is_global is False
+    assert scope.program_ids == {projects.program_a.id}
+    assert scope.project_ids == {projects.in_b.id}
+    assert assignment_service._can_access_project(db, user.id, projects.in_a.id)
+    assert assignment_service._can_access_project(db, user.id, projects.in_b.id)
+    assert not assignment_service._can_access_project(db, user.id, projects.other_in_b.id)
+    assert assignment_service._get_accessible_project_ids(db, user.id) == {
+        projects.in_a.id,
+        projects.in_b.id,
+    }
+
+
+def test_global_scope_sees_everything(db, projects):
+    user = _make_user(db, "admin", (ScopeType.GLOBAL, None, None))
+
+    assert assignment_service._can_access_project(db, user.id, projects.other_in_b.id)
+    assert assignment_service._get_accessible_project_ids(db, user.id) is None
+
+
+def test_user_without_roles_sees_nothing(db, projects):
+    user = _make_user(db, "nobody")
+
+    scope = assignment_service._get_user_scope(db, user.id)
+    assert not any(
+        assignment_service._scope_allows(scope, project)
+        for project in (projects.in_a, projects.in_b, projects.other_in_b)
+    )
+    assert not assignment_service._can_access_project(db, user.id, projects.in_a.id)
+    assert assignment_service._get_accessible_project_ids(db, user.id) == set()
+
+
+def test_list_assignments_pages_within_scope(db, projects):
+    resource = _make_resource(db, "paged")
+    for offset in range(3):
+        day = date(2024, 3, 1) + timedelta(days=offset)
+        _assign(db, resource, projects.in_a, day)
+        _assign(db, resource, projects.other_in_b, day)
+    user = _make_user(db, "program-a", (ScopeType.PROGRAM, projects.program_a.id, None))
+
+    page = assignment_service.list_assignments(db, skip=1, limit=1, user_id=user.id)
+    assert [(a.project_id, a.assignment_date) for a in page] == [
+        (projects.in_a.id, date(2024, 3, 2))
+    ]
+    assert len(assignment_service.list_assignments(db, user_id=user.id)) == 3
+    assert len(assignment_service.list_assignments(db, resource_id=resource.id)) == 6
+
+    nobody = _make_user(db, "nobody")
+    assert assignment_service.list_assignments(db, user_id=nobody.id) == []
+
+
+def test_resource_and_date_lookups_are_scope_filtered(db, projects):
+    resource = _make_resource(db, "scoped")
+    day = date(2024, 3, 1)
+    _assign(db, resource, projects.in_a, day)
+    _assign(db, resource, projects.in_b, day)
+    user = _make_user(db, "project-b", (ScopeType.PROJECT, None, projects.in_b.id))
+    nobody = _make_user(db, "nobody")
+
+    by_resource = assignment_service.get_assignments_by_resource(db, resource.id, user.id)
+    by_date = assignment_service.get_assignments_by_date(db, resource.id, day, user.id)
+    assert [a.project_id for a in by_resource] == [projects.in_b.id]
+    assert [a.project_id for a in by_date] == [projects.in_b.id]
+    assert len(assignment_service.get_assignments_by_resource(db, resource.id)) == 2
+    assert assignment_service.get_assignments_by_date(db, resource.id, day, nobody.id) == []
+
+
+def test_project_access_check_matches_resolved_scope(db, projects):
+    program_user = _make_user(db, "program-b", (ScopeType.PROGRAM, projects.in_b.program_id, None))
+    project_user = _make_user(db, "project-a", (ScopeType.PROJECT, None, projects.in_a.id))
+    admin = _make_user(db, "global", (ScopeType.GLOBAL, None, None))
+    inactive = _make_user(db, "inactive", (ScopeType.GLOBAL, None, None))
+    for user_role in inactive.user_roles:
+        user_role.is_active = False
+    db.flush()
+
+    for user in (program_user, project_user, admin, inactive):
+        scope = assignment_service._get_user_scope(db, user.id)
+        for project in (projects.in_a, projects.in_b, projects.other_in_b):
+            assert assignment_service._can_access_project(db, user.id, project.id) == (
+                assignment_service._scope_allows(scope, project)
+            )
+
+    assert assignment_service._can_access_project(db, admin.id, projects.in_a.id)
+    assert not assignment_service._can_access_project(db, inactive.id, projects.in_a.id)
+    assert not assignment_service._can_access_project(db, admin.id, projects.program_a.id)
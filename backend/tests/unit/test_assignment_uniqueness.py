@@ -164,3 +164,120 @@ def test_service_translates_database_race_to_clear_error(
         match="already assigned to this project on 2024-06-15",
     ):
         create_assignment(db, resource, project, 15)
+
+
+def test_import_checks_rows_against_earlier_rows_in_the_file(assignment_context):
+    db, resource, project = assignment_context
+    create_assignment(db, resource, project, 14)
+
+    header = "resource_id,project_id,assignment_date,capital_percentage,expense_percentage"
+    csv_content = "\n".join([
+        header,
+        f"{resource.id},{project.id},2024-06-14,10,0",
+        f"{resource.id},{project.id},2024-06-15,60,0",
+        f"{resource.id},{project.id},2024-06-15,10,0",
+        "",
+        f"{resource.id},{project.id},2024-06-16,60,0",
+        f"{resource.id},{project.id},not-a-date,10,0",
+    ])
+
+    results = assignment_service.import_assignments(db, csv_content)
+
+    assert results["total"] == 5
+    assert results["successful"] == 2
+    assert results["failed"] == 3
+    assert [error["row"] for error in results["errors"]] == [2, 4, 6]
+    assert "already assigned to this project on 2024-06-14" in results["errors"][0]["error"]
+    assert "already assigned to this project on 2024-06-15" in results["errors"][1]["error"]
+    assert results["errors"][2]["data"]["assignment_date"] == "not-a-date"
+    assert db.query(ResourceAssignment).count() == 3
+
+
+def _add_other_project(db: Session, project: Project) -> Project:
+    other_project = Project(
+        id=uuid4(),
+        program_id=project.program_id,
+        name="Other Project",
+        business_sponsor="Sponsor",
+        project_manager="Manager",
+        technical_lead="Lead",
+        start_date=date(2024, 1, 1),
+        end_date=date(2024, 12, 31),
+        cost_center_code="UNIQUE-002",
+    )
+    db.add(other_project)
+    db.commit()
+    return other_project
+
+
+def test_import_rejects_row_that_overallocates_with_earlier_rows(assignment_context):
+    db, resource, project = assignment_context
+    other_project = _add_other_project(db, project)
+
+    header = "resource_id,project_id,assignment_date,capital_percentage,expense_percentage"
+    csv_content = "\n".join([
+        header,
+        f"{resource.id},{project.id},2024-06-15,60,0",
+        f"{resource.id},{other_project.id},2024-06-15,50,0",
+    ])
+
+    results = assignment_service.import_assignments(db, csv_content)
+
+    assert results["successful"] == 1
+    assert results["errors"][0]["row"] == 3
+    assert "Would result in: 110" in results["errors"][0]["error"]
+
+
+def test_allocation_conflicts_are_summed_across_projects(assignment_context):
+    db, resource, project = assignment_context
+    other_project = _add_other_project(db, project)
+    # Bypass service validation to store an over-allocated day
+    for day, assigned_project, capital in (
+        (15, project, "60"),
+        (15, other_project, "50"),
+        (16, project, "60"),
+        (16, other_project, "40"),
+    ):
+        db.add(ResourceAssignment(
+            id=uuid4(),
+            resource_id=resource.id,
+            project_id=assigned_project.id,
+            assignment_date=date(2024, 6, day),
+            capital_percentage=Decimal(capital),
+            expense_percentage=Decimal("0"),
+        ))
+    db.commit()
+
+    conflicts = assignment_service.check_allocation_conflicts(
+        db, resource.id, date(2024, 6, 1), date(2024, 6, 30)
+    )
+
+    assert conflicts == [{
+        "date": date(2024, 6, 15),
+        "total_allocation": Decimal("110"),
+        "over_allocation": Decimal("10"),
+    }]
+
+
+def test_update_checks_allocation_excluding_the_updated_assignment(assignment_context):
+    db, resource, project = assignment_context
+    other_project = _add_other_project(db, project)
+    create_assignment(db, resource, project, 15)  # 20%
+    other = assignment_service.create_assignment(
+        db,
+        resource_id=resource.id,
+        project_id=other_project.id,
+        assignment_date=date(2024, 6, 15),
+        capital_percentage=Decimal("30"),
+        expense_percentage=Decimal("0"),
+    )
+
+    updated = assignment_service.update_assignment(
+        db, other.id, capital_percentage=Decimal("80")
+    )
+    assert updated.capital_percentage == Decimal("80")
+
+    with pytest.raises(ValueError, match="Current total across other projects: 20"):
+        assignment_service.update_assignment(
+            db, other.id, capital_percentage=Decimal("81")
+        )
@@ -12,6 +12,7 @@ from app.services.authorization import authorization_service, Permission
 from app.services.scope_validator import scope_validator_service
 from app.services.role_management import role_management_service
 from app.services.audit import audit_service
+from app.repositories.audit import audit_log_repository
 from app.models.user import User, UserRole, ScopeAssignment, RoleType, ScopeType
 from app.models.program import Program
 from app.models.project import Project, ProjectPhase
@@ -608,3 +609,98 @@ class TestAuditService:
         
         assert len(history) == 1
         assert history[0].operation == "CREATE"
+    
+    def test_recent_permission_changes_and_summary(self, db_session):
+        """Test listing and summarizing audit logs."""
+        actor = authentication_service.create_user(
+            db=db_session,
+            username="auditactor",
+            email="auditactor@example.com",
+            password="password123"
+        )
+        target_id = uuid4()
+        other_id = uuid4()
+        
+        audit_service.create_audit_trail(db_session, actor.id, "CREATE", "Program", uuid4())
+        audit_service.create_audit_trail(db_session, actor.id, "UPDATE", "Program", uuid4())
+        audit_service.log_permission_change(db_session, actor.id, target_id, "ROLE_ASSIGNED", {})
+        audit_service.log_permission_change(db_session, actor.id, other_id, "ROLE_ASSIGNED", {})
+        
+        recent = audit_service.get_recent_changes(db_session, entity_type="Program", limit=1)
+        assert len(recent) == 1
+        assert recent[0].entity_type == "Program"
+        
+        changes = audit_service.get_permission_changes(db_session, target_user_id=target_id)
+        assert [log.entity_id for log in changes] == [target_id]
+        assert len(audit_service.get_permission_changes(db_session)) == 2
+        
+        summary = audit_service.get_audit_summary(db_session)
+        assert summary["total_changes"] == 4
+        assert (summary["creates"], summary["updates"], summary["deletes"]) == (1, 1, 0)
+        assert summary["by_entity_type"] == {"Program": 2, "Permission": 2}
+        assert summary["by_user"] == {str(actor.id): 4}
+        
+        program_summary = audit_service.get_audit_summary(db_session, entity_type="Program")
+        assert program_summary["total_changes"] == 2
+    
+    def test_create_audit_logs(self, db_session):
+        """Test logging many operations with one batched insert."""
+        user = authentication_service.create_user(
+            db=db_session,
+            username="bulkaudit",
+            email="bulkaudit@example.com",
+            password="password123"
+        )
+        entity_ids = [uuid4(), uuid4()]
+        
+        logs = audit_log_repository.create_audit_logs(db_session, [
+            {
+                "user_id": user.id,
+                "entity_type": "Program",
+                "entity_id": entity_id,
+                "operation": "DELETE",
+                "before_values": {"name": f"Program {index}"},
+            }
+            for index, entity_id in enumerate(entity_ids)
+        ])
+        
+        assert [log.entity_id for log in logs] == entity_ids
+        assert all(log.id and log.created_at for log in logs)
+        history = audit_service.get_entity_history(db_session, "Program", entity_ids[1])
+        assert history[0].before_values == {"name": "Program 1"}
+    
+    def test_capture_before_update_reads_expired_and_pending_values(self, db_session):
+        """Test model values are captured whether or not they are loaded."""
+        user = authentication_service.create_user(
+            db=db_session,
+            username="captureuser",
+            email="capture@example.com",
+            password="password123"
+        )
+        db_session.expire(user)
+        
+        values = audit_service.capture_before_update(user)
+        assert values["username"] == "captureuser"
+        assert values["id"] == str(user.id)
+        
+        pending = User(username="pending", email="pending@example.com", password_hash="hash")
+        values = audit_service.capture_before_update(pending)
+        assert values["username"] == "pending"
+        assert values["id"] is None
+    
+    def test_model_values_are_json_ready(self):
+        """Test UUIDs and dates are converted and enum values are skipped."""
+        user_id = uuid4()
+        start = datetime(2024, 1, 1).date()
+        role = UserRole(user_id=user_id, role_type=RoleType.VIEWER, is_active=True)
+        program = Program(name="Values", start_date=start, created_at=datetime(2024, 1, 2, 3, 4))
+        
+        role_values = audit_service.capture_before_update(role)
+        assert role_values["user_id"] == str(user_id)
+        assert role_values["is_active"] is True
+        assert "role_type" not in role_values
+        
+        program_values = audit_service.capture_before_update(program)
+        assert program_values["start_date"] == "2024-01-01"
+        assert program_values["created_at"] == "2024-01-02T03:04:00"
+        assert program_values["name"] == "Values"
@@ -36,6 +36,10 @@ CSV_CAPITAL_ONLY = (
     "project_id,external_worker_id,worker_name,date,capital_percentage\n"
     "11111111-1111-1111-1111-111111111111,EMP1,Ann,2026-03-03,50\n"
 )
+CSV_SPLIT_SHORT_ROW = (
+    "project_id,external_worker_id,worker_name,date,capital_percentage,expense_percentage\n"
+    "11111111-1111-1111-1111-111111111111,EMP1,Ann,2026-03-03\n"
+)
 
 
 def test_parse_single_percentage():
@@ -80,6 +84,14 @@ def test_parse_csv_capital_percentage_only_rejects():
         svc.parse_csv(CSV_CAPITAL_ONLY)
 
 
+def test_parse_csv_short_row_names_missing_columns():
+    with pytest.raises(
+        ActualsImportError,
+        match="row 2: missing values for columns: capital_percentage, expense_percentage",
+    ):
+        svc.parse_csv(CSV_SPLIT_SHORT_ROW)
+
+
 # ---------------------------------------------------------------------------
 # Row-validation tests (validate_records)
 # ---------------------------------------------------------------------------
@@ -224,6 +236,21 @@ def test_validate_bad_date_format_rejected(db_session):
     assert any("Invalid date format" in e for e in records[0].validation_errors)
 
 
+@pytest.mark.parametrize("actual_date, expected", [
+    ("2026-03-03", date(2026, 3, 3)),
+    ("2026-3-3", date(2026, 3, 3)),
+    ("2026-W10-2", None),
+])
+def test_validate_date_accepts_only_year_month_day(db_session, actual_date, expected):
+    project = _make_project(db_session)
+    _make_worker(db_session)
+
+    records = svc.parse_csv(_csv_single(project.id, actual_date=actual_date))
+    svc.validate_records(db_session, records)
+
+    assert records[0].actual_date == expected
+
+
 def test_validate_single_percentage_over_100_rejected(db_session):
     project = _make_project(db_session)
     _make_worker(db_session)
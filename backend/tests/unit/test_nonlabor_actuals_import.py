@@ -24,6 +24,9 @@ CSV = "project_id,resource_id,date,capital,expense\n" \
 CSV_MISSING_COLUMN = "project_id,resource_id,date,capital\n" \
                      "11111111-1111-1111-1111-111111111111,22222222-2222-2222-2222-222222222222,2026-03-03,400\n"
 
+CSV_SHORT_ROW = "project_id,resource_id,date,capital,expense\n" \
+                "11111111-1111-1111-1111-111111111111,22222222-2222-2222-2222-222222222222,2026-03-03\n"
+
 CSV_WITH_EXTERNAL_WORKER_ID = (
     "project_id,resource_id,date,capital,expense,external_worker_id\n"
     "11111111-1111-1111-1111-111111111111,22222222-2222-2222-2222-222222222222,2026-03-03,400,100,EMP1\n"
@@ -48,6 +51,13 @@ def test_parse_csv_missing_column_rejects():
         svc.parse_csv(CSV_MISSING_COLUMN)
 
 
+def test_parse_csv_short_row_names_missing_columns():
+    with pytest.raises(
+        ActualsImportError, match="row 2: missing values for columns: capital, expense"
+    ):
+        svc.parse_csv(CSV_SHORT_ROW)
+
+
 def test_parse_csv_with_external_worker_id_rejects():
     with pytest.raises(ActualsImportError):
         svc.parse_csv(CSV_WITH_EXTERNAL_WORKER_ID)
@@ -4,6 +4,7 @@ Unit tests for repositories.
 import pytest
 from datetime import date
 from decimal import Decimal
+from uuid import uuid4
 
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
@@ -173,6 +174,36 @@ class TestProjectRepository:
         
         projects = project_repository.get_by_program(db, program.id)
         assert len(projects) == 2
+    
+    def test_many_lookups_span_chunks(self, db, monkeypatch):
+        """Test that batched ID lookups merge results across chunks."""
+        monkeypatch.setattr("app.repositories.base.ID_LOOKUP_CHUNK_SIZE", 2)
+        program = program_repository.create(db, obj_in={
+            "name": "Test Program",
+            "business_sponsor": "John Doe",
+            "program_manager": "Jane Smith",
+            "technical_lead": "Bob Johnson",
+            "start_date": date(2024, 1, 1),
+            "end_date": date(2024, 12, 31)
+        })
+        projects = [
+            project_repository.create(db, obj_in={
+                "program_id": program.id,
+                "name": f"Project {n}",
+                "business_sponsor": "John Doe",
+                "project_manager": "Jane Smith",
+                "technical_lead": "Bob Johnson",
+                "start_date": date(2024, 1, 1),
+                "end_date": date(2024, 6, 30),
+                "cost_center_code": f"CC00{n}"
+            })
+            for n in range(1, 6)
+        ]
+        ids = {project.id for project in projects}
+        missing = uuid4()
+        
+        assert project_repository.exists_many(db, ids | {missing}) == ids
+        assert set(project_repository.get_many(db, ids | {missing})) == ids
 
 
 class TestRateRepository:
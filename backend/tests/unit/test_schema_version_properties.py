@@ -15,7 +15,7 @@ from hypothesis import given, strategies as st, settings
 
 from app.schemas.portfolio import PortfolioResponse, PortfolioUpdate
 from app.schemas.program import ProgramResponse, ProgramUpdate
-from app.schemas.project import ProjectResponse, ProjectUpdate, ProjectPhaseResponse, ProjectPhaseUpdate
+from app.schemas.project import ProjectResponse, ProjectUpdate
 from app.schemas.phase import PhaseResponse, PhaseUpdate
 from app.schemas.resource import ResourceResponse, ResourceUpdate, WorkerTypeResponse, WorkerTypeUpdate, WorkerResponse, WorkerUpdate
 from app.schemas.assignment import ResourceAssignmentResponse, ResourceAssignmentUpdate
@@ -4,18 +4,23 @@ Unit tests for Pydantic schemas.
 import pytest
 from datetime import date, datetime
 from decimal import Decimal
+from typing import get_args
 from uuid import uuid4
 from pydantic import ValidationError
 
+from app.api.responses import json_response
 from app.schemas.base import PaginationParams, PaginatedResponse, ErrorResponse
-from app.schemas.program import ProgramCreate, ProgramUpdate, ProgramResponse
-from app.schemas.project import ProjectCreate, ProjectPhaseCreate, ProjectUpdate
+from app.schemas.program import ProgramCreate, ProgramUpdate, ProgramResponse, ProgramListResponse
+from app.schemas.project import ProjectCreate, ProjectUpdate
+from app.schemas.phase import PhaseCreate
 from app.schemas.resource import ResourceCreate, WorkerCreate, WorkerTypeCreate
 from app.schemas.user import UserCreate, UserRoleCreate, ScopeAssignmentCreate
 from app.schemas.assignment import ResourceAssignmentCreate, ResourceAssignmentUpdate, AssignmentImportRow
 from app.schemas.actual import ActualCreate, ActualBase, ActualImportRow
-from app.schemas.rate import RateCreate
+from app.schemas.rate import RateCreate, RateResponse
 from app.schemas.auth import LoginRequest, RoleSwitchRequest
+from app.schemas.report import BudgetBreakdown, ExportFormat, VarianceTypeName
+from app.services.variance_analysis import VarianceType
 from app.models.resource import ResourceType
 from app.models.user import RoleType, ScopeType
 
@@ -51,7 +56,18 @@ class TestBaseSchemas:
         """Test invalid sort order."""
         with pytest.raises(ValidationError) as exc_info:
             PaginationParams(sort_order="invalid")
-        assert "String should match pattern" in str(exc_info.value)
+        assert "Input should be 'asc' or 'desc'" in str(exc_info.value)
+
+    def test_json_response_serializes_model(self):
+        """Test that json_response renders the model with the app's JSON media type."""
+        response = json_response(ErrorResponse(message="Nope"))
+        assert response.media_type == "application/json"
+        assert response.body == ErrorResponse(message="Nope").model_dump_json().encode()
+
+    def test_program_responses_built_at_import(self):
+        """Test that forward references are resolved when the module is imported."""
+        assert ProgramResponse.__pydantic_complete__
+        assert ProgramListResponse.__pydantic_complete__
 
 
 class TestProgramSchemas:
@@ -127,11 +143,13 @@ class TestProjectSchemas:
             "name": "Planning Phase",
             "start_date": date(2024, 1, 1),
             "end_date": date(2024, 6, 30),
-            "capital_budget": Decimal("50000.00"),
-            "expense_budget": Decimal("30000.00"),
+            "labor_capital_budget": Decimal("30000.00"),
+            "labor_expense_budget": Decimal("20000.00"),
+            "nonlabor_capital_budget": Decimal("20000.00"),
+            "nonlabor_expense_budget": Decimal("10000.00"),
             "total_budget": Decimal("80000.00")
         }
-        phase = ProjectPhaseCreate(**phase_data)
+        phase = PhaseCreate(**phase_data)
         assert phase.name == "Planning Phase"
         assert phase.total_budget == Decimal("80000.00")
     
@@ -143,13 +161,15 @@ class TestProjectSchemas:
             "name": "Planning Phase",
             "start_date": date(2024, 1, 1),
             "end_date": date(2024, 6, 30),
-            "capital_budget": Decimal("50000.00"),
-            "expense_budget": Decimal("30000.00"),
+            "labor_capital_budget": Decimal("30000.00"),
+            "labor_expense_budget": Decimal("20000.00"),
+            "nonlabor_capital_budget": Decimal("20000.00"),
+            "nonlabor_expense_budget": Decimal("10000.00"),
             "total_budget": Decimal("90000.00")  # Wrong total
         }
         with pytest.raises(ValidationError) as exc_info:
-            ProjectPhaseCreate(**phase_data)
-        assert "Total budget must equal capital" in str(exc_info.value)
+            PhaseCreate(**phase_data)
+        assert "Total budget must equal the four category budgets" in str(exc_info.value)
 
 
 class TestResourceSchemas:
@@ -519,6 +539,52 @@ class TestRateSchemas:
             RateCreate(**rate_data)
         assert "greater than 0" in str(exc_info.value)
 
+    def test_rate_response_from_trusted_skips_validation(self):
+        """Test that from_trusted builds a response without re-validating."""
+        now = datetime.now()
+        rate = RateResponse.from_trusted({
+            "id": uuid4(),
+            "worker_type_id": uuid4(),
+            "rate_amount": Decimal("0.00"),
+            "start_date": date(2024, 1, 1),
+            "end_date": None,
+            "version": 1,
+            "created_at": now,
+            "updated_at": now,
+            "is_current": True,
+        })
+        assert rate.rate_amount == Decimal("0.00")
+        assert rate.is_current is True
+        assert "worker_type_name" not in rate.model_fields_set
+
+
+class TestReportSchemas:
+    """Test report-related schemas."""
+    
+    def test_variance_type_literal_matches_service(self):
+        """Test that the schema's variance types match the service constants."""
+        service_types = {
+            value for name, value in vars(VarianceType).items() if name.isupper()
+        }
+        assert set(get_args(VarianceTypeName)) == service_types
+    
+    def test_money_fields_quantize_to_cents(self):
+        """Test that money fields accept extra decimal places and round them."""
+        budget = BudgetBreakdown(
+            capital_budget=Decimal("1000.005"),
+            expense_budget=Decimal("333.3333"),
+            total_budget=Decimal("1333.3383"),
+        )
+        assert budget.capital_budget == Decimal("1000.00")
+        assert budget.expense_budget == Decimal("333.33")
+        assert budget.total_budget == Decimal("1333.34")
+    
+    def test_export_format_rejects_unknown_format(self):
+        """Test export format validation."""
+        assert ExportFormat(format="csv").format == "csv"
+        with pytest.raises(ValidationError):
+            ExportFormat(format="docx")
+
 
 class TestAuthSchemas:
     """Test authentication-related schemas."""
@@ -2234,3 +2234,29 @@ class TestAssignmentService:
         assert results["failed"] == 1
         assert len(results["errors"]) == 1
         assert "Allocation percentage must be between 0 and 100" in results["errors"][0]["error"]
+    
+    def test_import_assignments_csv_missing_column(self, db, setup_data):
+        """Test that a header without a required column is rejected up front."""
+        from app.services.assignment import assignment_service
+        
+        csv_content = f"""resource_id,project_id,assignment_date,capital_percentage
+{setup_data["resource"].id},{setup_data["project"].id},2024-01-15,60.00
+"""
+        
+        with pytest.raises(ValueError, match="Missing required columns: expense_percentage"):
+            assignment_service.import_assignments(db, csv_content)
+    
+    def test_import_assignments_csv_short_row(self, db, setup_data):
+        """Test that a short row reports which columns it has no values for."""
+        from app.services.assignment import assignment_service
+        
+        csv_content = f"""resource_id,project_id,assignment_date,capital_percentage,expense_percentage
+{setup_data["resource"].id},{setup_data["project"].id},2024-01-15
+"""
+        
+        results = assignment_service.import_assignments(db, csv_content)
+        
+        assert results["failed"] == 1
+        assert results["errors"][0]["error"] == (
+            "Missing values for columns: capital_percentage, expense_percentage"
+        )
@@ -84,23 +84,20 @@ class _Record:
         return not self.validation_errors
 
 
-def _add_nonlabor_actual(db, *, project_id, resource_id, actual_date,
-                         capital_amount, expense_amount, import_batch_id, **kwargs):
-    return actual_repository.create_in_transaction(
-        db,
-        obj_in={
-            "project_id": project_id,
-            "resource_id": resource_id,
-            "import_batch_id": import_batch_id,
-            "external_worker_id": None,
-            "worker_name": None,
-            "actual_date": actual_date,
-            "allocation_percentage": None,
-            "actual_cost": capital_amount + expense_amount,
-            "capital_amount": capital_amount,
-            "expense_amount": expense_amount,
-        },
-    )
+def _nonlabor_actual_data(db, *, project_id, resource_id, actual_date,
+                          capital_amount, expense_amount, import_batch_id, **kwargs):
+    return {
+        "project_id": project_id,
+        "resource_id": resource_id,
+        "import_batch_id": import_batch_id,
+        "external_worker_id": None,
+        "worker_name": None,
+        "actual_date": actual_date,
+        "allocation_percentage": None,
+        "actual_cost": capital_amount + expense_amount,
+        "capital_amount": capital_amount,
+        "expense_amount": expense_amount,
+    }
 
 
 def test_actual_import_is_atomic_and_shares_one_revision_transaction(
@@ -108,7 +105,7 @@ def test_actual_import_is_atomic_and_shares_one_revision_transaction(
     monkeypatch,
 ):
     service = ActualsService()
-    monkeypatch.setattr(service, "create_nonlabor_actual", _add_nonlabor_actual)
+    monkeypatch.setattr(service, "_build_nonlabor_actual_data", _nonlabor_actual_data)
 
     result = service.import_nonlabor_batch(
         session,
@@ -147,9 +144,9 @@ def test_failed_actual_import_rolls_back_rows_batch_and_revisions(
         calls += 1
         if calls == 2:
             raise RuntimeError("source row failed")
-        return _add_nonlabor_actual(*args, **kwargs)
+        return _nonlabor_actual_data(*args, **kwargs)
 
-    monkeypatch.setattr(service, "create_nonlabor_actual", fail_second)
+    monkeypatch.setattr(service, "_build_nonlabor_actual_data", fail_second)
 
     with pytest.raises(ImportException):
         service.import_nonlabor_batch(session, [_Record(1), _Record(2)])
@@ -157,3 +154,107 @@ def test_failed_actual_import_rolls_back_rows_batch_and_revisions(
     assert session.query(Actual).count() == 0
     assert session.query(ActualImportBatch).count() == 0
     assert session.query(EntityRevision).count() == 0
+
+
+class _LaborRecord(_Record):
+    def __init__(self, row_number: int):
+        super().__init__(row_number)
+        self.external_worker_id = f"W{row_number}"
+        self.worker_name = f"Worker {row_number}"
+        self.percentage = Decimal("50")
+
+
+def _labor_actual_data(db, *, project_id, external_worker_id, worker_name,
+                       actual_date, allocation_percentage, import_batch_id,
+                       **kwargs):
+    return {
+        "project_id": project_id,
+        "resource_id": uuid4(),
+        "import_batch_id": import_batch_id,
+        "external_worker_id": external_worker_id,
+        "worker_name": worker_name,
+        "actual_date": actual_date,
+        "allocation_percentage": allocation_percentage,
+        "actual_cost": Decimal("100"),
+        "capital_amount": Decimal("60"),
+        "expense_amount": Decimal("40"),
+    }
+
+
+def test_labor_batch_import_bulk_inserts_and_captures_revisions(
+    session,
+    monkeypatch,
+):
+    service = ActualsService()
+    monkeypatch.setattr(service, "_build_actual_data", _labor_actual_data)
+    monkeypatch.setattr("app.services.actuals.IMPORT_INSERT_CHUNK_SIZE", 2)
+    records = [_LaborRecord(row) for row in range(1, 6)]
+
+    result = service.import_actuals_batch(
+        session,
+        records,
+        validate_allocation=False,
+        return_objects=True,
+    )
+
+    batch = result["batch"]
+    revisions = session.query(EntityRevision).filter_by(
+        entity_type="actuals",
+    ).all()
+    assert result["imported_count"] == 5
+    assert session.query(Actual).filter_by(import_batch_id=batch.id).count() == 5
+    assert {revision.entity_id for revision in revisions} == {
+        actual.id for actual in result["actuals"]
+    }
+    assert {revision.transaction_id for revision in revisions} == {
+        batch.transaction_id,
+    }
+
+
+def test_failed_insert_chunk_reports_its_rows_and_rolls_back_import(
+    session,
+    monkeypatch,
+):
+    service = ActualsService()
+
+    def null_cost_on_row_three(db, **kwargs):
+        data = _labor_actual_data(db, **kwargs)
+        if kwargs["external_worker_id"] == "W3":
+            data["actual_cost"] = None
+        return data
+
+    monkeypatch.setattr(service, "_build_actual_data", null_cost_on_row_three)
+    monkeypatch.setattr("app.services.actuals.IMPORT_INSERT_CHUNK_SIZE", 2)
+    records = [_LaborRecord(row) for row in range(1, 6)]
+
+    with pytest.raises(ImportException) as exc_info:
+        service.import_actuals_batch(
+            session,
+            records,
+            validate_allocation=False,
+        )
+
+    row_errors = exc_info.value.details["row_errors"]
+    assert [error["row"] for error in row_errors] == [3]
+    assert row_errors[0]["error"].startswith("Rows 3-4 could not be saved")
+    assert session.query(Actual).count() == 0
+    assert session.query(ActualImportBatch).count() == 0
+    assert session.query(EntityRevision).count() == 0
+
+
+def test_actuals_batch_returns_only_counts_by_default(session, monkeypatch):
+    service = ActualsService()
+    monkeypatch.setattr(service, "_build_actual_data", _labor_actual_data)
+    records = [_LaborRecord(row) for row in range(1, 4)]
+
+    result = service.import_actuals_batch(
+        session,
+        records,
+        validate_allocation=False,
+    )
+
+    assert "actuals" not in result
+    assert result["imported_count"] == 3
+    assert session.query(Actual).filter_by(
+        import_batch_id=result["batch"].id,
+    ).count() == 3